@@ -0,0 +1,108 @@
+"""
+Measure `Grid.apply_plan` against the former one-by-one insertion
+
+| Run from the repository root, e.g. with the offscreen platform:
+| QT_QPA_PLATFORM=offscreen python benchmarks/bench_apply_to_layout.py [--all]
+
+The former implementation is kept below as `apply_one_by_one` for comparison.
+Both variants add the cells to a layout whose parent widget is shown, and
+include showing the parent widget and processing the pending events.
+Both cases are measured, a parent widget shown before and after calling finish.
+With a shown parent, the one-by-one insertion grows quadratically, so it is only
+measured up to `BASELINE_MAX` cells, unless the *--all* argument is given.
+"""
+import sys
+import time
+from os import path
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from qtgrid.qtgrid import Grid, _Gap, QT_BINDING  # noqa: E402, needs the path above
+
+if QT_BINDING == "PyQt6":
+    from PyQt6.QtWidgets import QApplication, QLabel, QLayout, QScrollArea, QSpacerItem, QWidget
+elif QT_BINDING == "PyQt5":
+    from PyQt5.QtWidgets import QApplication, QLabel, QLayout, QScrollArea, QSpacerItem, QWidget
+else:
+    from PySide6.QtWidgets import QApplication, QLabel, QLayout, QScrollArea, QSpacerItem, QWidget
+
+SIZES   = (1000, 10000, 50000)
+COLUMNS = 10
+BASELINE_MAX = 10000
+
+
+def apply_one_by_one(grid) -> None:
+    """
+    The former `_Cells.apply_to_layout`, an isinstance chain and a live parent widget
+    """
+    layout = grid.layout
+    for cell in grid.cells.get():
+        if cell.item is None:
+            continue
+        elif isinstance(cell.item, _Gap):
+            gap = cell.item
+            if gap.item is None:
+                continue
+            elif isinstance(gap.item, QSpacerItem):
+                layout.addItem( gap.item, cell.y, cell.x, cell.y_span, cell.x_span )
+            elif isinstance(gap.item, QLabel):
+                layout.addWidget( gap.item, cell.y, cell.x, cell.y_span, cell.x_span )
+        elif isinstance(cell.item, Grid):
+            layout.addLayout( cell.item.layout, cell.y, cell.x, cell.y_span, cell.x_span )
+        elif isinstance(cell.item, QSpacerItem):
+            layout.addItem( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
+        elif isinstance(cell.item, QLayout):
+            layout.addLayout( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
+        elif isinstance(cell.item, QWidget):
+            layout.addWidget( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
+
+
+def build(size, shown):
+    """
+    Create a scroll area and a grid with *size* label cells, not applied yet
+
+    Large grids need a scroll area, a window with thousands of rows would exceed the screen by far.
+    """
+    scroll = QScrollArea()
+    widget = QWidget()
+    grid   = Grid( content_columns=COLUMNS, expand_right=True )
+    widget.setLayout( grid.layout )
+    scroll.setWidget( widget )
+    scroll.setWidgetResizable( True )
+    scroll.resize( 800, 600 )
+    if shown:
+        scroll.show()
+    grid.add_many( QLabel(str(i)) for i in range(size) )
+    return (scroll, grid)
+
+
+def measure(app, size, apply, shown) -> float:
+    (scroll, grid) = build( size, shown )
+    app.processEvents()
+    start = time.perf_counter()
+    apply( grid )
+    if not shown:
+        scroll.show()
+    app.processEvents()
+    seconds = time.perf_counter() - start
+    scroll.deleteLater()
+    app.processEvents()
+    return seconds
+
+
+def main() -> None:
+    app = QApplication( sys.argv )
+    for shown in (True, False):
+        print("Parent widget shown before finish" if shown else "Parent widget shown after finish")
+        print(f"{'cells':>8} {'one-by-one':>12} {'batched':>12} {'speedup':>8}")
+        for size in SIZES:
+            after = measure( app, size, lambda grid: grid.apply_plan(), shown )
+            if shown and size > BASELINE_MAX and "--all" not in sys.argv:
+                print(f"{size:>8} {'skipped':>12} {after:>11.3f}s {'-':>8}")
+                continue
+            before = measure( app, size, apply_one_by_one, shown )
+            print(f"{size:>8} {before:>11.3f}s {after:>11.3f}s {before/after:>7.2f}x")
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+Measure how placing, finishing, and clearing a `Grid` scale with the number of cells
+
+| Run from the repository root, e.g. with the offscreen platform:
+| QT_QPA_PLATFORM=offscreen python benchmarks/bench_grid.py [--max N] [--json FILE]
+
+Each scenario is run for each size of `SIZES` up to *--max* cells, default 100000.
+The labels are created before, so the *add* phase only measures the placement
+by one `Grid.add` call per label, i.e. `Grid.add` and `_WriteHead.gage`. The *add_many*
+phase places the same labels on a second grid with `Grid.add_many`, which takes an
+arithmetic fast path where possible. The *finish* phase adds expander, gaps, and
+unused cells and applies all cells to the layout. The *clear* phase includes
+processing the deferred deletes of the widgets.
+
+The peak memory per phase is taken with *tracemalloc* in a second run, as tracing
+slows down Python considerably. It only traces allocations by Python, memory
+allocated by Qt itself is not included.
+With *--json FILE* the results are also written to *FILE*, to compare runs.
+"""
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from os import path
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from qtgrid.qtgrid import Grid, QT_BINDING  # noqa: E402, needs the path above
+
+if QT_BINDING == "PyQt6":
+    from PyQt6.QtWidgets import QApplication, QLabel, QWidget
+elif QT_BINDING == "PyQt5":
+    from PyQt5.QtWidgets import QApplication, QLabel, QWidget
+else:
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget
+
+SIZES   = (100, 1000, 10000, 100000)
+COLUMNS = 10
+
+SCENARIOS = {
+    "plain":       dict(),
+    "spans":       dict(),
+    "column_gaps": dict( column_gaps=[ (2, 20), (5, "expand") ] ),
+    "expanders":   dict( expand_left=True, expand_right=True ),
+    "work_up":     dict( expand_right=True, column_gaps=[ (2, 20) ], work_up=True ),
+}
+"""Scenario name: Grid options. The "spans" scenario adds every 7th label spanning 2x2 cells."""
+
+
+def phase(func) -> float:
+    """
+    Run *func* and get its seconds, or its peak memory in bytes while tracing
+    """
+    gc.collect()
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - start
+    seconds = time.perf_counter()
+    func()
+    return time.perf_counter() - seconds
+
+
+def run(app, name, size) -> dict:
+    """
+    Measure the phases of scenario *name* with *size* labels, seconds or peak memory
+    """
+    widget = QWidget()
+    grid   = Grid( content_columns=COLUMNS, production=True, **SCENARIOS[ name ] )
+    widget.setLayout( grid.layout )
+    labels = [ QLabel( str(i) ) for i in range( size ) ]
+    if name == "spans":
+        items = [ (label, 2, 2) if i % 7 == 0 else (label, 1, 1) for (i, label) in enumerate( labels ) ]
+    else:
+        items = [ (label, 1, 1) for label in labels ]
+    del labels
+
+    def add():
+        for (label, y_span, x_span) in items:
+            grid.add( label, y_span=y_span, x_span=x_span )
+
+    # Same labels on a second grid, which is never applied to a layout
+    many       = Grid( content_columns=COLUMNS, production=True, **SCENARIOS[ name ] )
+    many_items = [ item if item[1] > 1 else item[0] for item in items ]
+    result = {}
+    result["add"]      = phase( add )
+    result["add_many"] = phase( lambda: many.add_many( many_items ) )
+    result["finish"]   = phase( grid.finish )
+    many.clear()
+    del items, many_items, many
+
+    def clear():
+        grid.clear()
+        app.processEvents()
+    result["clear"]  = phase( clear )
+    widget.deleteLater()
+    app.processEvents()
+    return result
+
+
+def main() -> None:
+    app  = QApplication( sys.argv )
+    args = sys.argv[1:]
+    max_size  = int( args[ args.index("--max") + 1 ] ) if "--max" in args else SIZES[-1]
+    json_file = args[ args.index("--json") + 1 ] if "--json" in args else None
+    # Warm up
+    run( app, "work_up", SIZES[0] )
+    results = []
+    phases = ("add", "add_many", "finish", "clear")
+    print(f"{'scenario':<12} {'cells':>7}" + "".join( f" {p + ' s':>10} {p + ' MiB':>10}" for p in phases ))
+    for name in SCENARIOS:
+        for size in SIZES:
+            if size > max_size:
+                continue
+            times = run( app, name, size )
+            tracemalloc.start()
+            peaks = run( app, name, size )
+            tracemalloc.stop()
+            line = f"{name:<12} {size:>7}"
+            for key in times:
+                line += f" {times[key]:>10.4f} {peaks[key] / 2**20:>10.2f}"
+            print( line, flush=True )
+            results.append( dict( scenario=name, cells=size,
+                                  **{ key: dict( seconds=times[key], peak=peaks[key] ) for key in times } ) )
+    if json_file is not None:
+        with open( json_file, "w" ) as f:
+            json.dump( dict( binding=QT_BINDING, columns=COLUMNS, results=results ), f, indent=1 )
+
+
+if __name__ == "__main__":
+    main()
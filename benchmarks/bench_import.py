@@ -0,0 +1,69 @@
+"""
+Measure the import time of the qtgrid package and its modules
+
+| Run from the repository root:
+| python benchmarks/bench_import.py
+
+Each case runs in a fresh interpreter, the median of `RUNS` runs is reported.
+The package is byte-compiled first, so compiling the sources is not measured.
+The Qt binding is selected as described with `qtgrid.qtgrid._select_binding`:
+by probing the installed packages, by the *QT_API* environment variable,
+or by a binding the application imported before.
+"""
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+from os import path
+
+ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+RUNS = 7
+
+TIMED = (
+    "import time\n"
+    "{setup}\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "print( time.perf_counter() - start )\n"
+)
+
+
+def measure(statement, setup="", env=None) -> float:
+    """
+    Get the median seconds of *statement* in a fresh interpreter, after running *setup*
+    """
+    env  = dict( os.environ, **(env or {}) )
+    code = TIMED.format( setup=setup, statement=statement )
+    times = []
+    for i in range( RUNS ):
+        out = subprocess.run( [sys.executable, "-c", code], cwd=ROOT, env=env,
+                              capture_output=True, text=True, check=True )
+        times.append( float( out.stdout ) )
+    return statistics.median( times )
+
+
+def main() -> None:
+    compileall.compile_dir( path.join(ROOT, "qtgrid"), quiet=1 )
+    sys.path.insert(0, ROOT)
+    from qtgrid.qtgrid import QT_BINDING
+    env = dict( os.environ )
+    env.pop( "QT_API", None )
+    os.environ.clear()
+    os.environ.update( env )
+    cases = [
+        ("import qtgrid",                          "",                                  None),
+        ("import qtgrid.planner",                  "",                                  None),
+        ("import qtgrid.qtgrid, probing",          "",                                  None),
+        ("import qtgrid.qtgrid, QT_API",           "",                                  {"QT_API": QT_BINDING}),
+        ("import qtgrid.qtgrid, binding imported", f"import {QT_BINDING}.QtWidgets",    None),
+        (f"import {QT_BINDING}.QtWidgets",         "",                                  None),
+    ]
+    print(f"Binding {QT_BINDING}, median of {RUNS} runs")
+    for (name, setup, case_env) in cases:
+        statement = name.split(",")[0]
+        print(f"{name:<40} {measure( statement, setup, case_env ) * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
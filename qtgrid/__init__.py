@@ -3,10 +3,23 @@
 # package qtgrid
 
 """
-The *qtgrid* package only contains the `qtgrid.qtgrid` module.
+The *qtgrid* package contains the `qtgrid.qtgrid` module, the Qt-free `qtgrid.planner` module,
+and the `qtgrid.loader` module.
+
+`Grid` and `GridLoader` are imported on first access, so `qtgrid.planner` can be used without importing Qt.
 """
 
-from qtgrid.qtgrid import Grid
+from qtgrid.planner import Planner, PlanCache
 
 __version__ = '1.0.0'
 """Version"""
+
+
+def __getattr__(name):
+    if name == "Grid":
+        from qtgrid.qtgrid import Grid
+        return Grid
+    if name == "GridLoader":
+        from qtgrid.loader import GridLoader
+        return GridLoader
+    raise AttributeError(f"module 'qtgrid' has no attribute '{ name }'")
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+
+"""
+Fill a grid from a data source, without blocking the event loop
+
+| The interface class for this module is `GridLoader`.
+| Rows are read lazily from an iterable, a CSV file, or a JSONL file, and added with
+| `qtgrid.qtgrid.Grid.add_label` in time-boxed chunks driven by a QTimer, or by an asyncio
+| event loop with `GridLoader.load_async`.
+| The Qt binding is the one selected by `qtgrid.qtgrid`.
+"""
+
+import csv
+import functools
+import gc
+import json
+import os
+import time
+
+from qtgrid.qtgrid import Grid, QObject, QTimer, Signal
+
+
+class GridLoader(QObject):
+    """
+    Add rows to a `qtgrid.qtgrid.Grid` in chunks, while the event loop keeps running
+
+    .. python::
+        loader = GridLoader( grid, "data.csv", columns=[ ("name", "default"), ("size", "default") ] )
+        loader.progress.connect( lambda rows: status.setText( f"{ rows } rows" ) )
+        loader.loaded.connect( lambda rows: print( "done", rows ) )
+        loader.start()
+        ...
+        loader.cancel()
+
+    | Each step adds rows until **chunk_ms** milliseconds are used up, then returns to the event loop.
+    | After the last row, `Grid.finish` is called, unless *finish* is False.
+    |
+    | With *pause_gc*, the automatic garbage collection is paused while loading, and only the young
+    | generations are collected after each chunk. Otherwise, the full collections triggered by the
+    | growing number of cells may each block the event loop for much longer than a chunk.
+    | As this affects the whole process, it is off by default.
+    """
+    progress = Signal(int)
+    """Signal emitted after each chunk with the number of rows added so far"""
+    loaded = Signal(int)
+    """Signal emitted after the last row, and after `Grid.finish`, with the number of rows added"""
+    canceled = Signal(int)
+    """Signal emitted by `cancel` with the number of rows added"""
+    failed = Signal(object)
+    """Signal emitted with the exception raised while reading or adding a row, loading stops"""
+
+    def __init__(self, grid=None, source=None, columns=None, chunk_ms=20, finish=True, pause_gc=False) -> None:
+        """
+        Examples
+
+        .. python::
+            loader = GridLoader( grid, rows )
+            loader = GridLoader( grid, "data.jsonl", columns=[ "name", ("size", "right") ] )
+            loader = GridLoader( grid, "data.csv", columns=[ ("name", "default") ], chunk_ms=10 )
+
+        | The *source* is an iterable of rows, or a path to a CSV or JSONL file, see `open_rows`.
+        | A row is either a dictionary, or a sequence of values.
+        | The *columns* map the values of a row to label sources: each is a 2-tuple *(key, name_id)*,
+        | or only the key, which uses the "default" label source. A key is a dictionary key,
+        | or a sequence index. Without *columns*, each value is added with the "default" label source,
+        | in order of the first row. Missing values are added as empty labels.
+        | The file is opened by `start` and closed after the last row, or by `cancel`.
+
+        :param grid:     required Grid object
+        :param source:   required iterable of rows, or path ending with ".csv" or ".jsonl"
+        :param columns:  None (default), or list of keys, or of 2-tuples *(key, name_id)*
+        :param chunk_ms: int milliseconds per chunk, default 20, or None for no time limit
+        :param finish:   boolean, if True (default) call `Grid.finish` after the last row
+        :param pause_gc: boolean, if True pause the automatic garbage collection while loading,
+                         default False
+        """
+        if not isinstance(grid, Grid):
+            raise Exception("Arg 'grid' must be Grid object")
+        if source is None:
+            raise Exception("Required arg 'source' is missing")
+        if not (chunk_ms is None or isinstance(chunk_ms, int) and chunk_ms > 0):
+            raise Exception("Arg 'chunk_ms' must be None, or integer > 0")
+        super(GridLoader, self).__init__()
+        self.grid = grid
+        """Grid object to fill"""
+        self.source = source
+        """Iterable of rows, or path of a CSV or JSONL file"""
+        self.columns = None if columns is None else self._get_columns( columns )
+        """None, or list of 2-tuples *(key, name_id)*"""
+        self.chunk_ms = chunk_ms
+        """None, or int milliseconds per chunk. None adds all rows in one chunk,
+        or up to *batch* rows by `load_async`"""
+        self.finish = True if finish else False
+        """Boolean. If True, `Grid.finish` is called after the last row"""
+        self.pause_gc = True if pause_gc else False
+        """Boolean. If True, the automatic garbage collection is paused while loading"""
+        self.rows = 0
+        """int number of rows added"""
+        self._rows = None
+        """None, or the iterator of rows while loading"""
+        self._columns = None
+        """None, or the **columns** in use while loading, taken from the first row without them"""
+        self._file = None
+        """None, or the opened file while loading"""
+        self._gc = [ False ]
+        """List holding True while the automatic garbage collection is paused by this loader"""
+        # Resume the collection even if the loader is deleted while loading
+        self.destroyed.connect( functools.partial( _resume_gc, self._gc ) )
+        self._timer = QTimer( self )
+        self._timer.setInterval( 0 )
+        self._timer.timeout.connect( self._step )
+
+    def start(self) -> None:
+        """
+        Start loading, the rows are added while the event loop runs
+
+        .. python::
+            loader.start()
+
+        Raise an exception if already running.
+        """
+        if self.is_running():
+            raise Exception("GridLoader is running already")
+        self.rows     = 0
+        self._columns = self.columns
+        self._rows    = self.open_rows()
+        self._pause_gc()
+        self._timer.start()
+
+    def cancel(self) -> None:
+        """
+        Stop loading and close the file
+
+        .. python::
+            loader.cancel()
+
+        | The rows added so far stay in the grid, and `Grid.finish` is called, unless *finish* is False.
+        | Then the `canceled` signal is emitted. Without loading, nothing happens.
+        """
+        if not self.is_running():
+            return
+        self._stop()
+        if self.finish:
+            self.grid.finish()
+        self.canceled.emit( self.rows )
+
+    async def load_async(self, batch=100) -> int:
+        """
+        Load all rows as coroutine, control is given back to the asyncio event loop after each batch
+
+        .. python::
+            rows = await loader.load_async()
+            rows = await loader.load_async( batch=500 )
+
+        | Instead of the timer of `start`, each batch adds up to *batch* rows until **chunk_ms**
+        | milliseconds are used up, then awaits *asyncio.sleep(0)*.
+        | Besides the sources of `open_rows`, the *source* may be an asynchronous iterable of rows.
+        | After the last row, `qtgrid.qtgrid.Grid.finish_async` is awaited, unless *finish* is False.
+        | The signals are emitted as by `start`, an exception is raised however, not emitted.
+        | Loading stops on `cancel`, or if the awaiting task is cancelled, the rows added so far stay in the grid.
+        | Raise an exception if already running.
+
+        :param batch: int maximum number of rows per batch, default 100
+        :return:      int number of rows added
+        """
+        # Not imported by the module, to keep importing it fast
+        import asyncio
+        if not (isinstance(batch, int) and batch > 0):
+            raise Exception("Arg 'batch' must be integer > 0")
+        if self.is_running():
+            raise Exception("GridLoader is running already")
+        self.rows     = 0
+        self._columns = self.columns
+        is_async = hasattr(self.source, "__aiter__")
+        if is_async:
+            self._rows = rows = self.source.__aiter__()
+        else:
+            self._rows = rows = self.open_rows()
+        self._pause_gc()
+        try:
+            done = False
+            while not done:
+                deadline = None if self.chunk_ms is None else time.perf_counter() + self.chunk_ms / 1000
+                for n in range( batch ):
+                    try:
+                        if is_async:
+                            row = await rows.__anext__()
+                        else:
+                            row = next( rows )
+                    except (StopIteration, StopAsyncIteration):
+                        done = True
+                        break
+                    self._add_row( row )
+                    if deadline is not None and time.perf_counter() >= deadline:
+                        break
+                if self._gc[0]:
+                    gc.collect( 1 )
+                self.progress.emit( self.rows )
+                await asyncio.sleep( 0 )
+                if self._rows is not rows:
+                    # Canceled
+                    return self.rows
+        finally:
+            if self._rows is rows:
+                self._stop()
+        if self.finish:
+            await self.grid.finish_async()
+        self.loaded.emit( self.rows )
+        return self.rows
+
+    def is_running(self) -> bool:
+        """
+        Is the loader adding rows ?
+
+        :return: boolean
+        """
+        return self._rows is not None
+
+    def open_rows(self) -> object:
+        """
+        Get an iterator of rows from **source**
+
+        | A path ending with ".csv" is read with *csv.DictReader*, so its first line holds the keys.
+        | A path ending with ".jsonl" is read line by line, each line holding a JSON object or array,
+        | empty lines are skipped. Any other *source* is iterated as it is.
+
+        :return: iterator of dictionaries or sequences
+        """
+        source = self.source
+        if not isinstance(source, (str, os.PathLike)):
+            return iter( source )
+        source = os.fspath( source )
+        lower  = source.lower()
+        if lower.endswith(".csv"):
+            self._file = open( source, newline="", encoding="utf-8" )
+            return iter( csv.DictReader( self._file ) )
+        if lower.endswith(".jsonl"):
+            self._file = open( source, encoding="utf-8" )
+            return ( json.loads( line ) for line in self._file if line.strip() )
+        raise Exception(f"Arg 'source' must be an iterable, or a path ending with '.csv' or '.jsonl', not '{ source }'")
+
+    #################
+    # Private methods
+    def _get_columns(self, columns=None) -> list:
+        """
+        Check *columns* and get them as list of 2-tuples *(key, name_id)*
+
+        :param columns: list of keys, or of 2-tuples *(key, name_id)*
+        :return: list of 2-tuples
+        """
+        RET = []
+        for column in columns:
+            if isinstance(column, tuple):
+                if len(column) != 2 or not isinstance(column[1], str):
+                    raise Exception("Arg 'columns' must hold keys, or 2-tuples (key, name_id)")
+                RET.append( column )
+            else:
+                RET.append( (column, "default") )
+        return RET
+
+    def _step(self) -> None:
+        """
+        Add rows until **chunk_ms** are used up, called by the timer
+
+        | After the last row, the grid is finished and the `loaded` signal is emitted.
+        | An exception stops loading and is emitted with the `failed` signal.
+        """
+        deadline = None if self.chunk_ms is None else time.perf_counter() + self.chunk_ms / 1000
+        done     = True
+        error    = None
+        try:
+            for row in self._rows:
+                self._add_row( row )
+                if deadline is not None and time.perf_counter() >= deadline:
+                    done = False
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            # Stop after the last row, and on any error
+            if done:
+                self._stop()
+        if error is not None:
+            self.failed.emit( error )
+            return
+        if not done:
+            if self._gc[0]:
+                gc.collect( 1 )
+            self.progress.emit( self.rows )
+            return
+        # Last row
+        self.progress.emit( self.rows )
+        if self.finish:
+            self.grid.finish()
+        self.loaded.emit( self.rows )
+
+    def _add_row(self, row=None) -> None:
+        """
+        Add the values of *row* as labels, see **columns**
+
+        :param row: required dictionary, or sequence of values
+        """
+        grid    = self.grid
+        columns = self._columns
+        if columns is None:
+            keys    = list( row ) if isinstance(row, dict) else range( len(row) )
+            columns = self._columns = [ (key, "default") for key in keys ]
+        if isinstance(row, dict):
+            for (key, name_id) in columns:
+                value = row.get( key )
+                grid.add_label( name_id, "" if value is None else str(value) )
+        else:
+            size = len( row )
+            for (key, name_id) in columns:
+                try:
+                    value = row[ key ] if key < size else None
+                except TypeError:
+                    raise Exception(f"Arg 'columns' must hold integer keys for rows of sequences, not '{ key }'")
+                grid.add_label( name_id, "" if value is None else str(value) )
+        self.rows += 1
+
+    def _pause_gc(self) -> None:
+        """
+        Pause the automatic garbage collection if **pause_gc** is True and it is enabled
+        """
+        if self.pause_gc and gc.isenabled():
+            gc.disable()
+            self._gc[0] = True
+
+    def _stop(self) -> None:
+        """
+        Stop the timer, close the file, and resume the automatic garbage collection
+        """
+        self._timer.stop()
+        self._rows = None
+        _resume_gc( self._gc )
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _resume_gc(paused=None, *args) -> None:
+    """
+    Resume the automatic garbage collection if it was paused by a `GridLoader`
+
+    | Also connected to the *destroyed* signal of the loader, so it must not refer to the loader.
+
+    :param paused: required list holding True while paused, set to False
+    """
+    if paused[0]:
+        paused[0] = False
+        gc.enable()
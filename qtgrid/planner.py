@@ -0,0 +1,1964 @@
+# -*- coding: utf-8 -*-
+
+"""
+Plan the placement of items in a grid, without Qt
+
+| The `Planner` class takes the same calls as `qtgrid.qtgrid.Grid` to add items, gaps, empty rows,
+| spans, and column gaps. Items are opaque handles, e.g. widgets, strings, or ids.
+| The result is a flat placement plan of 5-tuples *(item, y, x, y_span, x_span)*.
+| This module does not import Qt, so plans can be computed headless, or in worker threads.
+| `Grid` is a `Planner` itself, which applies its plan to a QGridLayout.
+| Finished plans can be shared between planners and grids with a `PlanCache`.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+
+class Planner():
+    """
+    Qt-free placement logic of `qtgrid.qtgrid.Grid`
+    """
+    _item_types = None
+    """None, or tuple of types accepted as items, see `_check_item`"""
+
+    def __init__(self,
+                 content_columns = 1,     expand_left  = False,
+                 expand_right    = False, column_gaps  = [],
+                 list_names      = [],    column_mode  = "cells",
+                 work_up         = False, plan_cache   = None
+                 ) -> None:
+        """
+        Examples
+
+        .. python::
+            planner = Planner()
+
+            planner = Planner(
+                content_columns = 5,
+                expand_left     = False,
+                expand_right    = True,
+                column_gaps     = [ (1, 20), (3, None) ],
+                list_names      = ["list1", "list2"],
+                column_mode     = "span",
+                plan_cache      = PlanCache(),
+            )
+            planner.add( "name" )
+            planner.add( "input", x_span="all" )
+            plan = planner.finish()
+
+        :param content_columns: Max int number of content columns, default 1
+        :param expand_left:     boolean, default False
+        :param expand_right:    boolean, default False
+        :param column_gaps:     list of tuples, default [ ]
+        :param list_names:      list of string names pointing to lists, default [ ]
+        :param column_mode:     "cells" (default), "span", or "properties"
+        :param work_up:         boolean, default False, see `set_work_up`
+        :param plan_cache:      None (default), or `PlanCache` object
+        """
+        # to be composed
+        self.wh      = None
+        """Composed `_WriteHead` object"""
+        self.colgaps = None
+        """Composed `_ColumnGaps` object"""
+        self.spans   = None
+        """Composed `_Spans` object"""
+        self.cells   = None
+        """Composed `_Cells` object"""
+        #####
+        self.expand_left = False
+        """Boolean. If True, a far left column with expanders are applied"""
+        self.expand_right = False
+        """Boolean. If True, a far right column with expanders are applied"""
+        self.content_columns = 1
+        """Integer >= 1. Max number of content columns"""
+        self.work_up = False
+        """Boolean. If True, unused cells are planned, too"""
+        self.column_mode = "cells"
+        """String. How expander and column gap columns are filled, see `set_column_mode`"""
+        self.column_properties = {}
+        """Dictionary = { x: (stretch, min_width), ... } of columns planned in column mode *properties*"""
+        self.custom_lists = {}
+        """Dictionary = { "list_name1": [ ], "list_name2": [ ], ... }"""
+        self.plan_cache = plan_cache
+        """None, or `PlanCache` object, see `set_plan_cache`"""
+        self._recipe = None
+        """None, or list of the steps recorded since `clear`, if **plan_cache** is set"""
+        self._replay = None
+        """None if not looked up yet, or tuple of cached steps to replay, empty if none"""
+        self._measure_later = False
+        """Boolean. If True, the set methods leave measuring to `__init__`"""
+
+        # Compose
+        self.wh      = _WriteHead(self)   # WriteHead
+        self.colgaps = _ColumnGaps(self)  # ColumnGaps
+        self.spans   = _Spans(self)       # Spans
+        self.cells   = _Cells(self)       # Cells
+
+        # Clear
+        self.clear()
+        # Prepare internal lists
+        self.set_list_names( list_names )
+        # The WriteHead and ColumnGaps are measured once below, not by each set method
+        self._measure_later = True
+        # Expanding far left or right columns
+        self.set_expand_left( expand_left )
+        self.set_expand_right( expand_right )
+        # Max number of content columns
+        self.set_content_columns( content_columns )
+        self._measure_later = False
+        # WriteHead measures
+        self.wh.measures()
+        # Columns gaps, this also measures ColumnGaps
+        self.set_column_gaps( column_gaps )
+        self.set_column_mode( column_mode )
+        self.set_work_up( work_up )
+        self.set_plan_cache( plan_cache )
+
+    ######################
+    # Public set Accessors
+    def set_list_names(self, names=[]) -> None:
+        """
+        Prepare internal lists with given names
+
+        .. python::
+            grid.set_list_names("list1", "list2")
+            grid.set_list_names()
+
+        | Can only be used before any widget is added or after calling the `clear` method.
+        | The internal lists are intended to hold users widgets for later disposal.
+        | Add widgets to the lists with `add`, or `add_label` methods.
+        | After all, use the `get_list_names`, or `get_list` methods to access the lists in turn.
+        | If called without argument, all internal lists will be removed.
+
+        :param names: list of strings, default [ ]
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set custom list names after adding widgets")
+        if not isinstance(names, list):
+            raise Exception("Arg 'names' must be a list")
+        #####
+        self.custom_lists = {}
+        for name in names:
+            if not isinstance(name, str):
+                raise Exception("Elements in 'names' must be strings")
+            self.custom_lists[ name ] = []
+
+    def set_expand_left(self, flag=False) -> None:
+        """
+        Set whether or not to add a far left expanding column, influencing the grid alignment
+
+        Can only be used before any widget is added or after calling the `clear` method.
+
+        :param flag: boolean, default False
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'expand_left' after adding widgets")
+        self.expand_left = True if flag else False
+        if not self._measure_later:
+            self.wh.measures()
+            self.colgaps.measure()
+
+    def set_expand_right(self, flag=False) -> None:
+        """
+        Set whether or not to add a far right expanding column, influencing the grid alignment
+
+        Can only be used before any widget is added or after calling the `clear` method.
+
+        :param flag: boolean, default False
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'expand_right' after adding widgets")
+        self.expand_right = True if flag else False
+        if not self._measure_later:
+            self.wh.measures()
+
+    def set_content_columns(self, content_columns=1) -> None:
+        """
+        Set maximum number of content columns
+
+        .. python::
+            grid.set_content_columns( content_columns=1 )
+            grid.set_content_columns( 1 )
+
+        | Can only be used before any widget is added or after calling the `clear` method.
+        | The possibly far left or right expanding columns are not considered.
+        | See also the `set_column_gaps` method.
+
+        :param content_columns: int n with n >= 1 and n > number of `_ColumnGaps.count`, default 1
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'content_columns' after adding widgets")
+        if not isinstance(content_columns, int) or content_columns < 1:
+            raise Exception("Arg 'content_columns' must be integer >= 1")
+        if self.colgaps.count() >= content_columns:
+            raise Exception("Arg 'content_columns' must be greater than the number of 'columns_gaps'")
+        #####
+        self.content_columns = content_columns
+        if not self._measure_later:
+            self.wh.measures()
+
+    def set_column_gaps(self, column_gaps=[]) -> None:
+        """
+        Interface method to `_ColumnGaps.set`
+        """
+        self.colgaps.set( column_gaps )
+
+    def set_column_mode(self, mode="cells") -> None:
+        """
+        Set how the far left or right expander columns and the column gaps are filled in `finish`
+
+        .. python::
+            grid.set_column_mode("cells")
+            grid.set_column_mode("span")
+
+        | Can only be used before any widget is added or after calling the `clear` method.
+        |
+        | **cells**      : each row gets its own expander or gap cell.
+        | **span**       : each column gets a single cell spanning over the rows, or one cell per run
+        |                  of rows not taken by other cells. The visual result is the same, but there
+        |                  are far less layout items in grids with many rows.
+        | **properties** : no cells at all. Expanders and "expand" column gaps set the column stretch,
+        |                  fixed sized column gaps set the minimum column width of the QGridLayout.
+        |                  Qt leaves out the spacing after a column without items, so `Grid.finish`
+        |                  adds the horizontal spacing of the layout to the minimum width.
+        |                  In work-up mode, "cells" is used instead to show the colored cells.
+
+        :param mode: string "cells", "span", or "properties", default "cells"
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'column_mode' after adding widgets")
+        if not isinstance(mode, str) or mode.lower() not in ["cells", "span", "properties"]:
+            raise Exception("Arg 'mode' must be string 'cells', 'span', or 'properties'")
+        self.column_mode = mode.lower()
+
+    def set_work_up(self, flag=False) -> None:
+        """
+        Set whether or not `finish` plans the unused cells as gaps, too
+
+        Can only be used before any widget is added or after calling the `clear` method.
+
+        :param flag: boolean, default False
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'work_up' after adding widgets")
+        self.work_up = True if flag else False
+
+    def set_plan_cache(self, cache=None) -> None:
+        """
+        Set a cache of finished plans, which may be shared with other planners or grids
+
+        .. python::
+            cache = PlanCache( maxsize=64 )
+            grid.set_plan_cache( cache )
+            grid.set_plan_cache()
+
+        | Can only be used before any widget is added or after calling the `clear` method.
+        | The calls to `add`, `add_gap`, `add_empty_row`, etc., are recorded as a recipe.
+        | Together with the options, it is the key of the finished plan stored by `finish`.
+        | As long as the calls follow the recipe cached last for the same options, the cells
+        | are placed at the cached coordinates, without searching for free cells.
+        | If `finish` finds the recipe, it also takes the planned gaps from the cache.
+        | Otherwise, the plan is stored in the cache.
+
+        :param cache: None (default), or `PlanCache` object
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'plan_cache' after adding widgets")
+        if cache is not None and not isinstance(cache, PlanCache):
+            raise Exception("Arg 'cache' must be None, or PlanCache object")
+        self.plan_cache = cache
+        self._recipe = [] if cache is not None else None
+        self._replay = None
+
+    ######################
+    # Public get Accessors
+    def get_list(self, name=None) -> list:
+        """
+        Get *name* list of widgets as it was prepared with `set_list_names`
+
+        The returned list contains QWidgets object added with the `add` or `add_label` methods.
+
+        .. python::
+            for widget in grid.get_list("list1"):
+                pass
+
+        :param name: required str name of an internal list
+
+        :return: list of widgets
+        """
+        if not isinstance(name, str):
+            raise Exception("Arg 'name' must be string")
+        if name not in self.custom_lists:
+            raise Exception(f"List '{ name }' not found")
+        return self.custom_lists[ name ]
+
+    def get_list_names(self) -> list:
+        """
+        Get all custom list names as they were prepared with `set_list_names`
+
+        .. python::
+            names = grid.get_list_names()
+            for name in names:
+                for widget in grid.get_list( name ):
+                    pass
+
+        :return: list of list names
+        """
+        return list( self.custom_lists.keys() )
+
+    def get_content_columns(self) -> int:
+        """
+        Get max number of content columns
+
+        :return: int
+        """
+        return self.content_columns
+
+    def get_plan(self) -> list:
+        """
+        Get the placement plan
+
+        .. python::
+            for (item, y, x, y_span, x_span) in planner.get_plan():
+                pass
+
+        | The plan is complete after calling `finish`. Gaps, expanders, and unused cells
+        | are planned with `Gap` objects as items, which may be None for explicit empty cells.
+
+        :return: list of 5-tuples *(item, y, x, y_span, x_span)*
+        """
+        return [ (cell.item, cell.y, cell.x, cell.y_span, cell.x_span) for cell in self.cells.get() ]
+
+    ################
+    # Public methods
+    def add(self, widget=None, y_span=1, x_span=1, to_list=None) -> object:
+        """
+        Add a *widget* to the current `_WriteHead` position into the grid
+
+        .. python::
+            cell = grid.add( widget=WIDGET, y_span=1, x_span=1, to_list="list_name" )
+            cell = grid.add( WIDGET, y_span=2, x_span=2 )
+            cell = grid.add( WIDGET, x_span="all" )
+            cell = grid.add( WIDGET )
+
+        | The *to_list* argument can be used to not only add the widget to the grid, but also to
+        | a prepared internal list for later use. See also the `set_list_names` method.
+        |
+        | The *y_span* and *x_span* integer arguments spans the cell over the given number of rows
+        | and columns. If *x_span* value is **"all"** the cell spans over the remaining row.
+
+        :param widget:  required QWidget object to be added
+        :param y_span:  int >= 1, default 1
+        :param x_span:  int >= 1, or string "all", default 1
+        :param to_list: optional str name of an internal list
+
+        :return: `_Cell` object with *QWidget* object
+        """
+        # Arguments
+        self._check_adding()
+        self._check_add_args( widget, y_span, x_span )
+        custom_list = self._get_custom_list( to_list )
+        # Place
+        return self._place( widget, y_span, x_span, custom_list )
+
+    def add_many(self, items=None, to_list=None) -> object:
+        """
+        Add all widgets of an iterable, one after the other, to the grid
+
+        .. python::
+            cells = grid.add_many( items=[ WIDGET1, WIDGET2 ], to_list="list_name" )
+            cells = grid.add_many([ WIDGET1, (WIDGET2, 2, 1), (WIDGET3, 1, "all") ])
+            cells = grid.add_many( widget for widget in generator() )
+
+        | Each item is either a widget, or a 3-tuple *(widget, y_span, x_span)* with the
+        | same meaning as for the `add` method.
+        | The *to_list* argument is checked once for the whole batch.
+        | All widgets are placed right away, the returned iterator only walks over the new cells.
+
+        :param items:   required iterable of widgets or 3-tuples
+        :param to_list: optional str name of an internal list
+
+        :return: iterator of `_Cell` objects
+        """
+        if items is None:
+            raise Exception("missing items")
+        self._check_adding()
+        custom_list = self._get_custom_list( to_list )
+        #####
+        wh        = self.wh
+        cells     = self.cells
+        cell_list = cells.get()
+        index     = cells._index
+        columns   = self.content_columns
+        left_edge = wh.content_range[0]
+        types     = self._item_types
+        cached    = self._recipe is not None
+        start     = len( cell_list )
+        try:
+            for item in items:
+                if item is None or isinstance(item, tuple) or not wh.uniform or self.colgaps._columns or cached:
+                    self._place_item( item, custom_list )
+                    continue
+                if types is not None and not isinstance(item, types):
+                    self._check_item( item )
+                # Uniform table, see `_WriteHead.gage`
+                (y, x) = divmod( len(cell_list), columns )
+                x   += left_edge
+                cell = _Cell( item, y, x )
+                cell_list.append( cell )
+                index[ (y, x) ] = cell
+                if custom_list is not None:
+                    custom_list.append( item )
+                wh.y = y
+                wh.x = x
+        finally:
+            # Also for the cells placed before an item failed
+            if wh.y > cells._max_y:
+                cells._max_y = wh.y
+        return self._iter_cells( start )
+
+    def add_rows(self, rows=None, to_list=None) -> object:
+        """
+        Add widgets row by row to the grid
+
+        .. python::
+            cells = grid.add_rows( rows=[ [WIDGET1, WIDGET2], [WIDGET3] ], to_list="list_name" )
+            cells = grid.add_rows([ [WIDGET1, (WIDGET2, 1, "all")], [WIDGET3] ])
+
+        | Each row is an iterable of items as described with the `add_many` method.
+        | After each row the next widget starts in a new row, even if the current
+        | row has unused cells left. Empty rows are skipped.
+
+        :param rows:    required iterable of iterables
+        :param to_list: optional str name of an internal list
+
+        :return: iterator of `_Cell` objects
+        """
+        if rows is None:
+            raise Exception("missing rows")
+        self._check_adding()
+        custom_list = self._get_custom_list( to_list )
+        #####
+        start = len( self.cells.get() )
+        for row in rows:
+            placed = False
+            for item in row:
+                self._place_item( item, custom_list )
+                placed = True
+            if placed:
+                self._next_row()
+        return self._iter_cells( start )
+
+    def add_gap(self, direction=None, length=None, y_span=1, x_span=1) -> object:
+        """
+        Add a `_Cell` object with a `Gap` object to the `_WriteHead` position into the grid
+
+        .. python::
+            cell = add_gap(direction="H", length="20", y_span=2, x_span=2)
+            # horizontal direction
+            cell = add_gap("H")           # same as None
+            cell = add_gap("H", 0)        # same as None
+            cell = add_gap("H", None)     # explicitly empty
+            cell = add_gap("H", 20)
+            cell = add_gap("H", "expand")
+
+            # horizontal direction is default
+            cell = add_gap()         # same as None
+            cell = add_gap(0)        # same as None
+            cell = add_gap(None)     # explicitly empty
+            cell = add_gap(20)
+            cell = add_gap("expand")
+
+            # vertical direction
+            cell = add_gap("V")           # same as None
+            cell = add_gap("V", 0)        # same as None
+            cell = add_gap("V", None)     # explicitly empty
+            cell = add_gap("V", 20)
+            cell = add_gap("V", "expand")
+
+        See the `set_work_up` method for a list of displayed colors in **work_up** mode.
+
+        :param direction: None, "H" (default) , "V", "horizontal", or "vertical"
+        :param length:    None, int >= 0, or "expand", default None
+        :param y_span:    int >= 1, default 1
+        :param x_span:    int >= 1, default 1
+
+        :return: `_Cell` object with a `Gap` object
+        """
+        self._check_adding()
+        # Arg 'direction': None, int, H, HORIZONTAL, V, VERTICAL, EXPAND
+        err = "Arg 'direction' must be None, integer, H, horizontal, V, vertical, or expand"
+        if direction is None:
+            direction = "H"
+            length    = 0
+        if isinstance(direction, int):
+            length    = direction
+            direction = "H"
+        if ( not isinstance(direction, str)
+             or direction.upper() not in ["H", "HORIZONTAL", "V", "VERTICAL", "EXPAND"] ):
+            raise Exception( err )
+        else:
+            D = direction.upper()
+            if D in ["H", "HORIZONTAL"]:
+                direction = "H"
+            elif D in ["V", "VERTICAL"]:
+                direction = "V"
+            elif D == "EXPAND":
+                length    = D
+                direction = "H"
+            else:
+                direction = D
+        if direction not in ["H", "V"]:
+            raise Exception("Unknown arg 'direction' value:", direction)
+
+        # Arg 'length': None, int >= 0, EXPAND
+        err = "Arg 'length' must be None, integer >= 0, or string 'expand'"
+        if length is None:
+            length = 0
+        if not (isinstance(length, str) or isinstance(length, int)):
+            raise Exception( err )
+        if isinstance(length, int) and length < 0:
+            raise Exception( err )
+        if isinstance(length, str) and not length.upper() == "EXPAND":
+            raise Exception( err )
+
+        # Arg 'y_span': int >= 1
+        if not isinstance(y_span, int) or not y_span >= 1:
+            raise Exception("Arg 'y_span' must be integer >= 1")
+
+        # Arg 'x_span': int >= 1, ALL
+        err = "Arg 'x_span' must be integer >= 1, or 'all'"
+        if isinstance(x_span, str) and x_span.upper() == "ALL":
+            x_span = "all"
+        elif not (isinstance(x_span, int) and x_span >= 1):
+            raise Exception( err )
+
+        # Cached ?
+        if self._recipe is not None:
+            step = ("gap", direction, length, y_span, x_span)
+            if self._replay_step( step ):
+                return self.cells.get_last()
+            start = len( self.cells.get() )
+        # Calibrate write head
+        self.wh.gage()
+        # Get current position
+        y = self.wh.y
+        x = self.wh.x
+        # Check x_span at the calibrated position
+        max_span = self._get_remaining_x_span()
+        if x_span == "all" or x_span > max_span:
+            x_span = max_span
+        # Add to grid cells
+        gap  = self._new_gap( direction, length )
+        cell = _Cell( gap, y, x, y_span, x_span )
+        # Reserve span first, it raises on overlap
+        if y_span > 1 or x_span > 1:
+            self.spans.reserve( y, x, y_span, x_span )
+        self.cells.add( cell )
+        if self._recipe is not None:
+            self._record_step( step, start )
+        # Return
+        return cell
+
+    def add_empty_row(self, height=None) -> object:
+        """
+        Add a row gap
+
+        .. python::
+            cell = grid.add_empty_row()     # same as None
+            cell = grid.add_empty_row(0)    # same as None
+            cell = grid.add_empty_row(None) # explicitly empty
+            cell = grid.add_empty_row(20)
+            cell = grid.add_empty_row("expand")
+
+        | If not in first column: fill the remaining row with explicit empty cells (colored grey), then …
+        | In the first column of a row: apply vertical gap by adding a single cell spawning the complete row.
+        |
+        | The first three calls are all equivalent.
+        | When given a integer number, the row gets a fixed height in pixels.
+        | If the string “expand” is used, the row expands in vertical direction.
+        | See the `set_work_up` method for a list of displayed colors in **work_up** mode.
+
+        :param height: None (default), int >= 0, or "expand"
+
+        :return: `_Cell` object with `Gap` object
+        """
+        self._check_adding()
+        # Arg 'height': None, int >= 0, or "expand"
+        if ( height is not None
+             and not (isinstance(height, int) and height >= 0)
+             and not (isinstance(height, str) and height.upper() == "EXPAND") ):
+            raise Exception("Arg 'height' must be None, int >= 0, or string 'expand'")
+        # Cached ?
+        if self._recipe is not None:
+            step = ("row", height)
+            if self._replay_step( step ):
+                return self.cells.get_last()
+            start = len( self.cells.get() )
+        (left_edge, right_edge) = self.wh.content_range
+        # Calibrate write head
+        self.wh.gage()
+        # Get current position
+        y = self.wh.y
+        x = self.wh.x
+        # Fill remaining row cells
+        while x != left_edge:
+            gap = self._new_gap()
+            self.cells.add(
+                _Cell( gap, y, x )
+            )
+            self.wh.gage()
+            y = self.wh.y
+            x = self.wh.x
+        # Apply vertical row gap
+        span = self._get_remaining_x_span()
+        gap  = self._new_gap( "V", height )
+        cell = _Cell( gap, y, x, x_span=span )
+        # Reserve span first, it raises on overlap
+        if span > 1:
+            self.spans.reserve( y, x, 1, span )
+        self.cells.add( cell )
+        if self._recipe is not None:
+            self._record_step( step, start )
+        # Return
+        return cell
+
+    def clear(self) -> None:
+        """
+        Delete all `_Cell` objects
+
+        .. python::
+            planner.clear()
+
+        | The `_WriteHead` coordinates are reset.
+        | All `custom_lists`, the `_Spans`, and the `column_properties` are reset.
+        """
+        # Reset WriteHead coordinates
+        self.wh.y = 0
+        self.wh.x = 0
+        self.wh.uniform = True
+        # Clear custom lists
+        for name in self.custom_lists:
+            self.custom_lists[ name ] = []
+        # Clear spans
+        self.spans = _Spans(self)
+        # Clear cells
+        self.cells = _Cells(self)
+        self.column_properties = {}
+        # Restart the recipe
+        if self._recipe is not None:
+            self._recipe = []
+            self._replay = None
+
+    def finish(self) -> list:
+        """
+        Always call this after you added all your cells
+
+        .. python::
+            plan = planner.finish()
+
+        | Plan the expander and gaps, and the unused cells in **work_up** mode.
+        | In column mode "properties", the expander and column gap columns are not planned
+        | as cells, but recorded in `column_properties`.
+        | With a `plan_cache`, the finished plan is taken from, or stored to the cache.
+
+        :return: list of 5-tuples *(item, y, x, y_span, x_span)*, see `get_plan`
+        """
+        self._plan_finish()
+        return self.get_plan()
+
+    #################
+    # Private methods
+    def _plan_finish(self, lap=None) -> int:
+        """
+        Add the cells planned by `finish` to `Planner.cells`, see `_iter_plan_finish`
+
+        :param lap: None (default), or callable taking a str phase name
+        :return: int maximum y-coordinate of the cells added before
+        """
+        steps = self._iter_plan_finish( lap )
+        while True:
+            try:
+                next( steps )
+            except StopIteration as stop:
+                return stop.value
+
+    def _iter_plan_finish(self, lap=None) -> object:
+        """
+        Generator adding the cells planned by `finish` to `Planner.cells` step by step
+
+        .. python::
+            max_y = yield from self._iter_plan_finish( lap )
+
+        | Each step handles one row of a phase, and yields the int number of cells it handled.
+        | If given, *lap* is called with the name of each phase after it is done:
+        | "expanders", "column_gaps", and "unused", or "cache" if the plan was cached.
+
+        :param lap: None (default), or callable taking a str phase name
+        :return: int maximum y-coordinate of the cells added before
+        """
+        max_y = self.cells.get_current_max_y()
+        # Cells outside the content range follow, thus counting cells is no longer sufficient
+        self.wh.uniform = False
+
+        # Cached ?
+        if self._recipe is not None:
+            key   = ( self._get_options(), tuple( record[0] for record in self._recipe ) )
+            entry = self.plan_cache.lookup( key )
+            if entry is not None:
+                (steps, finish_cells, column_properties) = entry
+                self._replay_cells( finish_cells )
+                self.column_properties = dict( column_properties )
+                if lap is not None:
+                    lap("cache")
+                yield len( finish_cells )
+                return max_y
+            start = len( self.cells.get() )
+
+        # 1. Apply far left or right expander
+        column_mode = self._get_column_mode()
+        if column_mode == "properties":
+            for x in ( self.wh.expand_left_index, self.wh.expand_right_index ):
+                if x != -1:
+                    self._set_column_properties( x, stretch=1 )
+        elif column_mode == "span":
+            # One expander spanning all rows
+            y_span = max_y + 1
+            for x in ( self.wh.expand_left_index, self.wh.expand_right_index ):
+                if x == -1:
+                    continue
+                gap = self._new_gap( "H", "expand", index=None )
+                if y_span > 1:
+                    self.spans.reserve( 0, x, y_span, 1 )
+                self.cells.add(
+                    _Cell( gap, 0, x, y_span=y_span )
+                )
+                yield 1
+        elif self.expand_left or self.expand_right:
+            for y in range( max_y + 1 ):
+                # Left
+                if self.expand_left:
+                    gap = self._new_gap( "H", "expand", index=None )
+                    self.cells.add(
+                        _Cell( gap, y, 0 )
+                    )
+                # Right
+                if self.expand_right:
+                    gap = self._new_gap( "H", "expand", index=None )
+                    self.cells.add(
+                        _Cell( gap, y, self.wh.expand_right_index )
+                    )
+                yield 1
+
+        if lap is not None:
+            lap("expanders")
+
+        # 2. Add column gaps
+        yield from self.colgaps.iter_add_to_cells()
+        if lap is not None:
+            lap("column_gaps")
+
+        # 3. Mark unused cells
+        if self.work_up:
+            (left_edge, right_edge) = self.wh.content_range
+            for y in range( max_y + 1 ):
+                for x in range( left_edge, right_edge + 1 ):
+                    if not self.cells.has_taken( y, x ):
+                        idx = x-1 if self.expand_left else x
+                        gap = self._new_gap( "H", "unused", index=idx )
+                        self.cells.add(
+                            _Cell( gap, y, x )
+                        )
+                yield right_edge + 1 - left_edge
+        if lap is not None:
+            lap("unused")
+
+        # Store to cache
+        if self._recipe is not None:
+            entry = ( tuple( self._recipe ), self._get_records( start ), dict( self.column_properties ) )
+            self.plan_cache.store( key, entry )
+        return max_y
+
+    def _new_gap(self, direction=None, length=None, index=-1) -> object:
+        """
+        Create the gap object to be planned, see `Gap` for the arguments
+
+        :return: `Gap` object
+        """
+        return Gap( self, direction, length, index )
+
+    def _set_column_properties(self, x=0, stretch=0, min_width=0) -> None:
+        """
+        Record stretch factor and minimum width of column *x* in `column_properties`
+
+        :param x:         int column index
+        :param stretch:   int >= 0, default 0
+        :param min_width: int >= 0, default 0
+        """
+        self.column_properties[ x ] = (stretch, min_width)
+
+    def _check_item(self, item=None) -> None:
+        """
+        Raise an exception if *item* cannot be added
+
+        Any item but None is accepted, unless `_item_types` restricts the types.
+
+        :param item: required item handle
+        """
+        if item is None:
+            raise Exception("missing widget")
+        types = self._item_types
+        if types is not None and not isinstance(item, types):
+            names = ", ".join( t.__name__ for t in types )
+            raise Exception(f"Arg 'item' ({item}) must be object of type { names }")
+
+    def _check_adding(self) -> None:
+        """
+        Raise an exception if no cells can be added at the moment
+
+        The planner is always open for new cells, a `qtgrid.qtgrid.Grid` is not while finishing.
+        """
+        pass
+
+    def _get_column_mode(self) -> str:
+        """
+        Get the `column_mode` in effect, which is "cells" for "properties" in work-up mode
+
+        :return: str "cells", "span", or "properties"
+        """
+        if self.column_mode == "properties" and self.work_up:
+            return "cells"
+        return self.column_mode
+
+    def _get_remaining_x_span(self, from_x=None) -> int:
+        """
+        Get the number of remaining cells in row
+
+        | If *from_x* is None, the current **x** value from `_WriteHead` is taken.
+        | The return value is the range *from_x* to the end of all content columns,
+        | or to the next span reaching into the current row from above.
+        | It is appropiate for layout *span* values counting from 1.
+
+        :param from_x: None (default), or int >= 0
+        :return: int >= 0
+        """
+        (left_edge, right_edge) = self.wh.content_range
+        if from_x is None:
+            from_x = self.wh.x
+        next_x = self.spans.get_next_x( self.wh.y, from_x )
+        if next_x is not None and next_x <= right_edge:
+            return (next_x - from_x)
+        return (1 + right_edge - from_x)
+
+    def _check_add_args(self, widget=None, y_span=1, x_span=1) -> None:
+        """
+        Check the arguments of the `add` method and raise an exception if not valid
+
+        :param widget: required QWidget object
+        :param y_span: int >= 1
+        :param x_span: int >= 1, or string "all"
+        """
+        if widget is None:
+            raise Exception("missing widget")
+        if not (isinstance(y_span, int) and y_span >= 1):
+            raise Exception("Arg 'y_span' must be integer >= 1")
+        if ( not (isinstance(x_span, int) and x_span >= 1)
+             and not (isinstance(x_span, str) and x_span.upper() == "ALL") ):
+            raise Exception("Arg 'x_span' must be integer >= 1 or string 'all'")
+
+    def _get_custom_list(self, to_list=None) -> object:
+        """
+        Get the internal list named *to_list*, or None
+
+        :param to_list: None, or str name of an internal list
+        :return: None, or list
+        """
+        if to_list is None:
+            return None
+        if not isinstance(to_list, str):
+            raise Exception("Arg 'to_list' must be string")
+        if to_list not in self.custom_lists:
+            raise Exception(f"list '{to_list}' does not exist")
+        return self.custom_lists[ to_list ]
+
+    def _place(self, widget, y_span, x_span, custom_list) -> object:
+        """
+        Put a *widget* with checked arguments into the next free cell
+
+        :param widget:      QWidget object
+        :param y_span:      int >= 1
+        :param x_span:      int >= 1, or string "all"
+        :param custom_list: None, or list as returned from `_get_custom_list`
+
+        :return: `_Cell` object
+        """
+        self._check_item( widget )
+        # Cached ?
+        if self._recipe is not None:
+            step = ("add", y_span, x_span)
+            if self._replay_step( step, widget ):
+                if custom_list is not None:
+                    custom_list.append( widget )
+                return self.cells.get_last()
+            start = len( self.cells.get() )
+        # Calibrate write head
+        self.wh.gage()
+        # Get current position
+        y = self.wh.y
+        x = self.wh.x
+        # Check x_span
+        max_span = self._get_remaining_x_span()
+        if isinstance(x_span, str):
+            x_span = max_span
+        elif x_span > max_span:
+            x_span = max_span
+        # Add to grid cells
+        cell = _Cell( widget, y, x, y_span, x_span )
+        # Reserve span first, it raises on overlap
+        if y_span > 1 or x_span > 1:
+            self.spans.reserve( y, x, y_span, x_span )
+        self.cells.add( cell )
+        if self._recipe is not None:
+            self._record_step( step, start )
+        # Add to custom list ?
+        if custom_list is not None:
+            custom_list.append( widget )
+        # Return
+        return cell
+
+    def _place_item(self, item, custom_list) -> object:
+        """
+        Place an *item* as accepted by `add_many`
+
+        Plain widgets take the short way, only 3-tuples have their spans checked.
+
+        :param item:        widget, or 3-tuple *(widget, y_span, x_span)*
+        :param custom_list: None, or list as returned from `_get_custom_list`
+
+        :return: `_Cell` object
+        """
+        if isinstance(item, tuple):
+            if len(item) != 3:
+                raise Exception("Arg 'items' must hold widgets, or 3-tuples (widget, y_span, x_span)")
+            (widget, y_span, x_span) = item
+            self._check_add_args( widget, y_span, x_span )
+            return self._place( widget, y_span, x_span, custom_list )
+        if item is None:
+            raise Exception("missing widget")
+        return self._place( item, 1, 1, custom_list )
+
+    def _next_row(self) -> None:
+        """
+        Let the next cell start in a new row, unless the current row is completed already
+        """
+        if self._recipe is not None:
+            step = ("next",)
+            if self._replay_step( step ):
+                return
+        wh = self.wh
+        y  = wh.y
+        wh.gage()
+        if wh.y == y:
+            wh.y += 1
+            wh.x  = 0
+            wh.uniform = False
+        if self._recipe is not None:
+            self._record_step( step, len( self.cells.get() ) )
+
+    def _iter_cells(self, start=0) -> object:
+        """
+        Get an iterator over the cells from index *start* to the current end of `_Cells._list`
+
+        :param start: int >= 0
+        :return: iterator of `_Cell` objects
+        """
+        cells = self.cells.get()
+        return ( cells[i] for i in range( start, len(cells) ) )
+
+    def _get_options(self) -> tuple:
+        """
+        Get the options which influence the plan, as part of the `PlanCache` key
+
+        :return: tuple
+        """
+        return ( self.content_columns, self.expand_left, self.expand_right,
+                 tuple( self.colgaps._list_orig ), self.column_mode, self.work_up )
+
+    def _get_records(self, start=0) -> tuple:
+        """
+        Get the cells from index *start* on as records to be cached
+
+        | The item of a cell is not recorded, but the arguments to create a `Gap` again.
+
+        :param start: int >= 0
+        :return: tuple of 5-tuples *(gap_args, y, x, y_span, x_span)*, *gap_args* is None for items
+        """
+        records = []
+        for cell in self.cells.get()[ start: ]:
+            gap = cell.item
+            if isinstance(gap, Gap):
+                args = ( gap.direction, gap.length, int( gap.index ) if gap.index else None )
+            else:
+                args = None
+            records.append( (args, cell.y, cell.x, cell.y_span, cell.x_span) )
+        return tuple( records )
+
+    def _record_step(self, step, start=0) -> None:
+        """
+        Record a *step* of the recipe, placed without the cache
+
+        :param step:  tuple, the call and its arguments
+        :param start: int index of the first cell added by the step
+        """
+        self._recipe.append( (step, self._get_records( start ), (self.wh.y, self.wh.x)) )
+        # Once diverged, the cached steps do not fit anymore
+        self._replay = ()
+
+    def _replay_step(self, step, item=None) -> bool:
+        """
+        Place the cells of *step* at the coordinates cached last for the same options
+
+        | The cached steps are looked up with the first step after `clear`.
+        | The `_WriteHead`, `_Spans`, and `_Cells` are updated as without the cache,
+        | so placing can go on without the cache after any step.
+
+        :param step: tuple, the call and its arguments
+        :param item: None, or the item to place
+        :return: bool, False if the step is not cached
+        """
+        recipe = self._recipe
+        n      = len( recipe )
+        if self._replay is None:
+            self._replay = self.plan_cache.get_steps( self._get_options() ) or ()
+        replay = self._replay
+        if n >= len( replay ) or replay[n][0] != step:
+            self._replay = ()
+            return False
+        (step, records, (y, x)) = record = replay[n]
+        recipe.append( record )
+        self._replay_cells( records, item )
+        self.wh.y = y
+        self.wh.x = x
+        if step[0] == "next":
+            self.wh.uniform = False
+        return True
+
+    def _replay_cells(self, records=(), item=None) -> None:
+        """
+        Add cells from cached *records*, see `_get_records`
+
+        :param records: tuple of 5-tuples *(gap_args, y, x, y_span, x_span)*
+        :param item:    None, or the item of records without *gap_args*
+        """
+        wh    = self.wh
+        cells = self.cells
+        for (args, y, x, y_span, x_span) in records:
+            wh.y = y
+            wh.x = x
+            if y_span > 1 or x_span > 1:
+                self.spans.reserve( y, x, y_span, x_span )
+            cells.add( _Cell( item if args is None else self._new_gap( *args ), y, x, y_span, x_span ) )
+
+
+class PlanCache():
+    """
+    Least recently used cache of finished plans, see `Planner.set_plan_cache`
+
+    .. python::
+        cache = PlanCache( maxsize=64 )
+        for record in records:
+            grid = Grid( content_columns=2, plan_cache=cache )
+            ...
+        print( cache.hits, cache.misses )
+
+    | The key of a plan is made of the planner options and the recipe, i.e. the sequence
+    | of calls like `Planner.add` with their spans. The items are not part of the key.
+    """
+    def __init__(self, maxsize=128) -> None:
+        """
+        :param maxsize: int >= 1, max number of cached plans, default 128
+        """
+        if not (isinstance(maxsize, int) and maxsize >= 1):
+            raise Exception("Arg 'maxsize' must be integer >= 1")
+        self.maxsize = maxsize
+        """Max number of cached plans"""
+        self.hits = 0
+        """Number of plans found by `lookup`"""
+        self.misses = 0
+        """Number of plans not found by `lookup`"""
+        self._entries = OrderedDict()
+        """OrderedDict = { key: (steps, finish_records, column_properties), ... }, least recently used first"""
+        self._latest = {}
+        """Dictionary = { options: key, ... } of the latest stored or found key per options"""
+
+    def __len__(self) -> int:
+        return len( self._entries )
+
+    def lookup(self, key=None) -> object:
+        """
+        Get the cached plan of *key* and count a hit or a miss
+
+        :param key: required 2-tuple *(options, recipe)*
+        :return: None, or 3-tuple *(steps, finish_records, column_properties)*
+        """
+        entry = self._entries.get( key )
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end( key )
+        self._latest[ key[0] ] = key
+        return entry
+
+    def store(self, key=None, entry=None) -> None:
+        """
+        Store the plan *entry* with *key*, the least recently used plan is evicted if full
+
+        :param key:   required 2-tuple *(options, recipe)*
+        :param entry: required 3-tuple *(steps, finish_records, column_properties)*
+        """
+        entries = self._entries
+        entries[ key ] = entry
+        entries.move_to_end( key )
+        self._latest[ key[0] ] = key
+        while len( entries ) > self.maxsize:
+            (old, dummy) = entries.popitem( last=False )
+            if self._latest.get( old[0] ) == old:
+                del self._latest[ old[0] ]
+
+    def get_steps(self, options=None) -> tuple:
+        """
+        Get the steps of the latest plan for *options*, without counting
+
+        :param options: required tuple, see `Planner._get_options`
+        :return: None, or tuple of steps
+        """
+        key = self._latest.get( options )
+        if key is None:
+            return None
+        return self._entries[ key ][0]
+
+    def clear(self) -> None:
+        """
+        Remove all cached plans and reset the counters
+        """
+        self._entries = OrderedDict()
+        self._latest  = {}
+        self.hits   = 0
+        self.misses = 0
+
+
+class _WriteHead():
+    """
+    The *_WriteHead* keeps track of internal indices counting in 2 dimensions
+
+    - Composed to `Planner.wh` property.
+    - The *_WriteHead* property **max_x** value is determined at instantiation time.
+    - When calling the `gage` method, the write head is skiped to the next free cell,
+      which might be in the next row.
+    """
+    def __init__(self, grid=None) -> None:
+        """
+        Example
+
+        .. python::
+            grid.wh = _WriteHead()
+            grid.wh.measures()
+            grid.wh.gage()
+            if grid.wh.is_in_content_range(2) : pass
+
+        :param grid: required Planner object
+        """
+        if not isinstance(grid, Planner):
+            raise Exception("Arg 'grid' must be Planner object")
+        self.grid = grid
+        """Planner object, or Grid object"""
+        self.y = 0
+        """int y coordinate, init 0"""
+        self.x = 0
+        """int x coordinate, init 0"""
+        self.max_x = 0
+        """Max x-index number including far left or right expansions"""
+        self.expand_left_index  = -1
+        """Index of left expander, -1 if unset"""
+        self.expand_right_index = -1
+        """Index of right expander, -1 if unset"""
+        self.content_range = (0, 0)
+        """2-Tuple with left most and right most column indices wrapping the content"""
+        self.uniform = True
+        """Boolean. True as long as all cells are plain 1x1 cells, see `gage`"""
+
+    def measures(self) -> None:
+        """
+        Determine the current values for **expand_left_index**, **expand_right_index**,
+        **content_range**, and **max_x**
+        """
+        grid = self.grid
+        # expand_left_index
+        self.expand_left_index = 0 if grid.expand_left else -1
+        # content_range
+        left_edge  = 0
+        right_edge = 0
+        if grid.expand_left:
+            left_edge  += 1
+            right_edge += 1
+        right_edge += (grid.content_columns - 1)
+        self.content_range = (left_edge, right_edge)
+        # expand_right_index
+        if grid.expand_right:
+            self.expand_right_index = right_edge + 1
+        else:
+            self.expand_right_index = -1
+        # max_x
+        self.max_x = right_edge + 1 if grid.expand_right else right_edge
+
+    def is_in_content_range(self, i=None) -> bool:
+        """
+        Is a given index number within the content range ?
+
+        :param i: required int index number
+        :return: boolean
+        """
+        if not isinstance(i, int):
+            raise Exception("Arg 'i' must be integer")
+        (a, b) = self.content_range
+        return True if (i >= a and i <= b) else False
+
+    def gage(self) -> None:
+        """
+        Skip to the next free cell and set the **y** and **x** properties
+
+        | Skip to next cell if the current cell is occupied, or is an expander, or gap, or part of a span.
+        | This runs in a loop rather than recursively, so the number of skipped cells is not bound
+        | to the recursion limit. A reserved span is skipped as a whole run within its row.
+        |
+        | As long as the grid is **uniform**, i.e. all cells are 1x1 and there are no column gaps,
+        | the position is simply calculated from the number of cells. The **uniform** flag is reset
+        | by `_Cells.add` with the first spanning cell and by `Planner.finish`.
+        """
+        grid    = self.grid
+        # Uniform table ?
+        if self.uniform and not grid.colgaps._columns:
+            (y, x) = divmod( len(grid.cells._list), grid.content_columns )
+            self.y = y
+            self.x = x + self.content_range[0]
+            return
+        (dummy, right_edge) = self.content_range
+        taken    = grid.cells._index
+        rows     = grid.spans._starts
+        get_span = grid.spans.get
+        colgaps  = grid.colgaps._columns
+        y = self.y
+        x = self.x
+        while True:
+            # Expand left ?
+            if x == self.expand_left_index:
+                x += 1
+                continue
+            # Cell is occupied ?
+            if (y, x) in taken:
+                x += 1
+                continue
+            # Cell is reserved for a span ?
+            if y in rows:
+                span = get_span( y, x )
+                if span is not None:
+                    # skip the rest of the span within this row
+                    (span_y, span_x, y_span, x_span) = span
+                    x = span_x + x_span
+                    continue
+            # Column gap ?
+            if x in colgaps:
+                x += 1
+            # Next row ?
+            elif x > right_edge:
+                y += 1
+                x  = 0
+            else:
+                break
+        self.y = y
+        self.x = x
+
+
+class _ColumnGaps():
+    """
+    Serve `Gap`'s for complete columns
+
+    - Composed to `Planner.colgaps` property.
+    - The column gaps are represented as a list of 2-tuples of the form: *(column_index, width)*
+
+    """
+    def __init__(self, grid=None) -> None:
+        """
+        Example
+
+        .. python::
+            grid.colgaps = _ColumnGaps( grid )
+
+        :param grid: required Planner object
+        """
+        if not isinstance(grid, Planner):
+            raise Exception("Arg 'grid' must be Planner object")
+        self.grid = grid
+        """Planner object, or Grid object"""
+        self._list_orig = []
+        """Original list of tuples defining the column gaps, as set with `set` method"""
+        self._list = []
+        """Copy of the **_list_orig** variable with altered indices depending on `Planner.expand_left`
+
+        Its indices are altered depending on the expanding far left column.
+        The values are calculated in `measure`.
+        """
+        self._columns = set()
+        """Set of the column indices in **_list**, calculated in `measure`"""
+
+    def has_column(self, n=-1) -> bool:
+        """
+        Does column gap exist at index *n* ?
+
+        .. python::
+            if grid.colgaps.has_column( 2 ) : pass
+
+        :param n: int, default -1
+        :return:  bool
+        """
+        return n in self._columns
+
+    def set(self, column_gaps=[]) -> None:
+        """
+        Set a list of *column_gaps* to private property **_list_orig**
+
+        .. python::
+            grid.colgaps.set([
+                (0, None),    # 1. column gap
+                (1, 0),       # 2.    "
+                (2, 20),      # 3.    "
+                (3, "expand") # 4.    "
+            ])
+            grid.colgaps.set()
+
+        | Can only be used before any adds.
+        | Based on **_list_orig** the **_list** property is created in method `measure`.
+        | If called without arguments, properties **_list_orig** and **_list** are reset.
+        | The 2-tuples in list *column_gaps* have the form: (*column_index, width)*
+
+        - **column_index** : int 0 <= n < max number of `Planner.get_content_columns`
+        - **width** : None, or int >= 0, or string "expand"
+
+        :param column_gaps: list of tuples, default [ ]
+        """
+        grid = self.grid
+        # Checks
+        if grid.wh.x != 0 or grid.wh.y != 0:
+            raise Exception("Cannot set 'column_gaps' after adding widgets")
+        if not isinstance(column_gaps, list):
+            raise Exception("'column_gaps' must be a list")
+
+        # empty ?
+        if not len(column_gaps):
+            self._list_orig = []
+            self._list      = []
+            self._columns   = set()
+            return
+
+        # Check each tuple
+        for tpl in column_gaps:
+            if not isinstance(tpl, tuple):
+                raise Exception("Each item in 'column_gaps' must be a tuple")
+            (column_index, gap_width) = tpl
+            # first tuple element
+            if not isinstance(column_index, int) or column_index < 0 or column_index >= grid.content_columns:
+                raise Exception("First tuple element must be int >= 0 and int < content_columns")
+            # ... within content range ?
+            val = column_index
+            if grid.expand_left:
+                val += 1
+            if not grid.wh.is_in_content_range( val ):
+                raise Exception("index in 'column_gaps' is out of range")
+            # second tuple element
+            if ( gap_width is not None
+                 and not (isinstance(gap_width, int) and gap_width >= 0)
+                 and not (isinstance(gap_width, str) and gap_width.upper() == "EXPAND") ):
+                raise Exception("Second tuple element must be None, int >= 0, or string 'expand'")
+
+        # Constrain (column_gaps < content_columns)
+        if len(column_gaps) >= grid.content_columns:
+            raise Exception("Number of 'columns_gaps' must be less than 'content_columns'")
+        # Set
+        self._list_orig = column_gaps
+        self.measure()
+
+    def get(self) -> list:
+        """
+        Get accessor for **_list**
+
+        The **_list** is created in method `measure`.
+
+        :return: list of tuples
+        """
+        return self._list
+
+    def measure(self) -> None:
+        """
+        Create property **_list**.
+
+        | If `Planner.expand_left` is true, the **_list_orig** is copied to **_list**, but with incremented x-indices.
+        | If `Planner.expand_left` is false, the **_list_orig** is simply copied to **_list**.
+        | The set of column indices **_columns** is updated accordingly.
+        """
+        self._list = []
+        for tpl in self._list_orig:
+            (idx, width) = tpl
+            if self.grid.expand_left:
+                idx += 1
+            self._list.append( (idx, width) )
+        self._columns = { idx for (idx, width) in self._list }
+
+    def count(self) -> int:
+        """
+        Return the number of column gaps
+
+        :return: int length of property **_list**
+        """
+        return len(self._list)
+
+    def add_to_cells(self) -> None:
+        """
+        Add `_Cell` objects with `Gap` objects with corresponding coordinates to `Planner.cells`
+
+        | Walk through each tuple in **_list** property, create a `Gap` object with its coordinates,
+        | and put it into a `_Cell` object and aggregate it to `Planner.cells`.
+        | If `Planner.column_mode` is "span", a single `_Cell` spans over each run of free rows.
+        | If `Planner.column_mode` is "properties", no cells are added but the column stretch or
+        | minimum width is set instead.
+        | See also `iter_add_to_cells`.
+        """
+        for n in self.iter_add_to_cells():
+            pass
+
+    def iter_add_to_cells(self) -> object:
+        """
+        Generator doing `add_to_cells` step by step
+
+        .. python::
+            for n in grid.colgaps.iter_add_to_cells():
+                pass
+
+        | Each step handles one row of a column gap, or a run of free rows in column mode "span",
+        | and yields the int number of rows it handled.
+        """
+        grid  = self.grid
+        cells = grid.cells
+        max_y = cells.get_current_max_y()
+        mode  = grid._get_column_mode()
+        span  = mode == "span"
+        ###
+        for tpl in self.get():
+            (column_index, width) = tpl
+            if mode == "properties":
+                if isinstance(width, str):
+                    grid._set_column_properties( column_index, stretch=1 )
+                elif width:
+                    grid._set_column_properties( column_index, min_width=width )
+                continue
+            idx = column_index-1 if grid.expand_left else column_index
+            y   = 0
+            while y <= max_y:
+                if cells.has_taken( y, column_index ):
+                    y += 1
+                    yield 1
+                    continue
+                # Number of free rows
+                y_span = 1
+                if span:
+                    while y + y_span <= max_y and not cells.has_taken( y + y_span, column_index ):
+                        y_span += 1
+                gap = grid._new_gap( "H", width, index=idx )
+                if y_span > 1:
+                    grid.spans.reserve( y, column_index, y_span, 1 )
+                grid.cells.add(
+                    _Cell( gap, y, column_index, y_span=y_span )
+                )
+                y += y_span
+                yield y_span
+
+
+class _Spans():
+    """
+    Serve the rectangles of all spans, as 4-tuples *(y, x, y_span, x_span)*
+
+    - Composed to `Planner.spans` property.
+    - Each span is stored once, and indexed by each row it covers.
+    - Within a row, the spans are sorted by their x-coordinate and searched with *bisect*.
+    - Spans must not overlap each other, or other cells, see `reserve`.
+    """
+    def __init__(self, grid=None):
+        """
+        Example
+
+        .. python::
+            grid.spans = _Spans( grid )
+
+        :param grid: required Planner object
+        """
+        if not isinstance(grid, Planner):
+            raise Exception("Arg 'grid' must be Planner object")
+        self.grid = grid
+        """Planner object, or Grid object"""
+        self._list = []
+        """List of 4-tuples (y, x, y_span, x_span), one rectangle per span"""
+        self._rows = {}
+        """Dictionary = { y: [ (y, x, y_span, x_span), ... ], ... } of the spans covering row y, sorted by x"""
+        self._starts = {}
+        """Dictionary = { y: [ x, ... ], ... } of the x-coordinates of `_rows`, to search with *bisect*"""
+
+    def has(self, y=0, x=0) -> bool:
+        """
+        Is coordinate (y,x) part of a span ?
+
+        .. python::
+            if grid.spans.has( y=1, x=2 ) : pass
+            if grid.spans.has(1, 2)       : pass
+
+        :param y: int y coordinate
+        :param x: int x coordinate
+        :Return:  boolean
+        """
+        return self.get( y, x ) is not None
+
+    def get(self, y=0, x=0) -> tuple:
+        """
+        Get the span covering coordinate (y,x)
+
+        .. python::
+            (y, x, y_span, x_span) = grid.spans.get( 1, 2 )
+
+        Only the spans covering row *y* are searched, in logarithmic time.
+
+        :param y: int y coordinate
+        :param x: int x coordinate
+        :Return:  None, or 4-tuple *(y, x, y_span, x_span)*
+        """
+        starts = self._starts.get( y )
+        if starts is None:
+            return None
+        i = bisect_right( starts, x ) - 1
+        if i < 0:
+            return None
+        span = self._rows[ y ][ i ]
+        if x < span[1] + span[3]:
+            return span
+        return None
+
+    def get_next_x(self, y=0, x=0) -> int:
+        """
+        Get the x-coordinate of the next span in row *y* right of *x*
+
+        .. python::
+            next_x = grid.spans.get_next_x( 1, 2 )
+
+        :param y: int y coordinate
+        :param x: int x coordinate
+        :Return:  None, or int x-coordinate
+        """
+        starts = self._starts.get( y )
+        if starts is None:
+            return None
+        i = bisect_right( starts, x )
+        if i == len( starts ):
+            return None
+        return starts[ i ]
+
+    def get_overlap(self, y=0, x=0, y_span=1, x_span=1) -> tuple:
+        """
+        Get a span, or a cell, which overlaps the rectangle *(y, x, y_span, x_span)*
+
+        .. python::
+            overlap = grid.spans.get_overlap( 0, 1, y_span=2, x_span=2 )
+            if overlap is not None:
+                (y, x, y_span, x_span) = overlap
+
+        | The spans of each covered row are searched with *bisect*.
+        | Cells are looked up in `_Cells._index`, including a cell at the anchor (y,x) itself.
+
+        :param y:      int y anchor of rectangle
+        :param x:      int x anchor of rectangle
+        :param y_span: int size to y direction
+        :param x_span: int size to x direction
+        :Return:       None, or 4-tuple *(y, x, y_span, x_span)* of an overlapping span or cell
+        """
+        end   = x + x_span
+        taken = self.grid.cells._index
+        for row in range( y, y + y_span ):
+            starts = self._starts.get( row )
+            if starts is not None:
+                i = bisect_left( starts, end ) - 1
+                if i >= 0:
+                    span = self._rows[ row ][ i ]
+                    if span[1] + span[3] > x:
+                        return span
+            for col in range( x, end ):
+                cell = taken.get( (row, col) )
+                if cell is not None:
+                    return (cell.y, cell.x, cell.y_span, cell.x_span)
+        return None
+
+    def reserve(self, y=None, x=None, y_span=None, x_span=None):
+        """
+        Store the rectangle of a span
+
+        .. python::
+            grid.spans.reserve( y=0, x=1, y_span=2, x_span=2 )
+            grid.spans.reserve(0,1, y_span=2, x_span=2)
+
+        | Mark cells belonging to a span by adding the 4-tuple to property **_list**, and to each of its rows.
+        | Raise an exception if the span overlaps another span or cell, see `get_overlap`.
+
+        :param y: int y anchor of span
+        :param x: int x anchor of span
+        :param y_span: int size to y direction
+        :param x_span: int size to x direction
+        """
+        if not isinstance(y, int):
+            raise Exception("Arg 'y' must be integer")
+        if not isinstance(x, int):
+            raise Exception("Arg 'x' must be integer")
+        if not isinstance(y_span, int):
+            raise Exception("Arg 'y_span' must be integer")
+        if not isinstance(x_span, int):
+            raise Exception("Arg 'x_span' must be integer")
+        span    = (y, x, y_span, x_span)
+        overlap = self.get_overlap( y, x, y_span, x_span )
+        if overlap is not None:
+            raise Exception(f"Span {span} overlaps {overlap}")
+        self._list.append( span )
+        for row in range( y, y + y_span ):
+            starts = self._starts.get( row )
+            if starts is None:
+                self._starts[ row ] = [ x ]
+                self._rows[ row ]   = [ span ]
+            else:
+                i = bisect_left( starts, x )
+                starts.insert( i, x )
+                self._rows[ row ].insert( i, span )
+
+
+class _Cells():
+    """
+    Class *_Cells* aggregates `_Cell` objects in a simple list
+
+    | Composed to `Planner.cells` property.
+    | It serves methods for handling aggregated `_Cell` objects, which make up the placement plan.
+    | Note that coordinates are saved within `_Cell` objects.
+    """
+    def __init__(self, grid=None) -> None:
+        """
+        Example
+
+        .. python::
+            grid.cells = _Cells()
+
+        :param grid: required Planner object
+        """
+        if not isinstance(grid, Planner):
+            raise Exception("Arg 'grid' must be Planner object")
+        self.grid  = grid
+        """Planner object, or Grid object"""
+        self._list = []
+        """Aggregated list of *_Cell* objects"""
+        self._index = {}
+        """Dictionary = { (y,x): _Cell, ... } mapping anchor coordinates to the first *_Cell* added there"""
+        self._max_y = 0
+        """Maximum y-coordinate out of all aggregated *_Cell* objects"""
+
+    def get(self) -> list:
+        """
+        Get accessor for **_list** of `_Cell` objects
+
+        .. python::
+            for cell in grid.cells.get():
+                print("y,x :", cell.y, cell.x)
+
+        :Return: self._list
+        """
+        return self._list
+
+    def add(self, cell=None) -> None:
+        """
+        Add (or aggregate) a `_Cell` object to the **_list**
+
+        .. python::
+            grid.cells.add( _Cell(...) )
+
+        :param cell: required `_Cell` object
+        """
+        if not isinstance(cell, _Cell):
+            raise Exception("Arg 'cell' must be _Cell object.")
+        self._list.append( cell )
+        self._index.setdefault( (cell.y, cell.x), cell )
+        if cell.y_span > 1 or cell.x_span > 1:
+            self.grid.wh.uniform = False
+        if cell.y > self._max_y:
+            self._max_y = cell.y
+
+    def get_cell(self, y=-1, x=-1) -> object:
+        """
+        Return the `_Cell` object from coordinate (y,x)
+
+        .. python::
+            cell = grid.cells.get_cell( 0,1 )
+            print("y,x :", cell.y, cell.x)
+
+        Raise exception if not found.
+
+        :param y: int >= 0
+        :param x: int >= 0
+
+        :Return: `_Cell` object
+        """
+        if not (isinstance(y, int) and y >= 0):
+            raise Exception("Arg 'y' must be int >= 0")
+        if not (isinstance(x, int) and x >= 0):
+            raise Exception("Arg 'x' must be int >= 0")
+        RET = self._index.get( (y, x) )
+        if RET is None:
+            raise Exception(f"Cannot find cell ({y},{x})")
+        return RET
+
+    def get_covering(self, y=-1, x=-1) -> object:
+        """
+        Return the `_Cell` object covering coordinate (y,x), either at its anchor or by its span
+
+        .. python::
+            cell = grid.cells.get_covering( 1,1 )
+            if cell is not None:
+                print("y,x :", cell.y, cell.x)
+
+        :param y: int
+        :param x: int
+
+        :Return: None, or `_Cell` object
+        """
+        RET = self._index.get( (y, x) )
+        if RET is None:
+            span = self.grid.spans.get( y, x )
+            if span is not None:
+                RET = self._index.get( (span[0], span[1]) )
+        return RET
+
+    def get_last(self) -> object:
+        """
+        Return the last inserted `_Cell` object
+
+        .. python::
+            cell = grid.cells.get_last()
+
+        :return: `_Cell` object
+        """
+        return self.get()[-1]
+
+    def has_taken(self, y=-1, x=-1) -> bool:
+        """
+        Check if a `_Cell` object exists at coordinate (y, x), or (y, x) is part of a span
+
+        .. python::
+            if grid.cells.has_taken( 0,1 ) : pass
+
+        The cells are hashed in **_index**, the spans are searched in their row only, see `_Spans.get`.
+
+        :param y: int
+        :param x: int
+
+        :return: bool
+        """
+        if not (isinstance(y, int) and isinstance(x, int)):
+            raise Exception("Arg 'y' and 'x' must be integers")
+        # Is cell (y,x) unused ?
+        return (y, x) in self._index or self.grid.spans.has( y, x )
+
+    def get_current_max_y(self) -> int:
+        """
+        Get the maximum y-coordinate value out of all aggregated `_Cell` objects
+
+        .. python::
+            max_y = grid.cells.get_current_max_y()
+
+        :return: int max y
+        """
+        return self._max_y
+
+
+class _Cell():
+    """
+    *_Cell* objects are aggregated to `_Cells._list`, which itself is composed to `Planner.cells`
+
+    A *_Cell* has an **item** property holding an object together with coordinates and span values.
+    It is a slotted object without *__dict__*, as there is one per cell.
+    """
+    __slots__ = ("item", "y", "x", "y_span", "x_span")
+
+    def __init__(self, item=None, y=None, x=None, y_span=1, x_span=1) -> None:
+        """
+        Example
+
+        .. python::
+            cell = _Cell( item=Gap(...), y=0, x=1, y_span=2, x_span=2 )
+            cell = _Cell( *QWidget*, 0,1, y_span=2, x_span=2 )
+            cell = _Cell( "handle", 0,1 )
+            ####
+            grid.cells.add( cell )
+
+        :param item:   None, `Gap`, or any item handle, see `Planner._check_item`
+        :param y:      int y coordinate
+        :param x:      int x coordinate
+        :param y_span: int y direction span
+        :param x_span: int x direction span
+        """
+        # Arguments
+        if not isinstance(y, int):
+            raise Exception("Arg 'y' must be integer")
+        if not isinstance(x, int):
+            raise Exception("Arg 'x' must be integer")
+        if not isinstance(y_span, int):
+            raise Exception("Arg 'y_span' must be integer")
+        if not isinstance(x_span, int):
+            raise Exception("Arg 'x_span' must be integer")
+        # Set
+        self.item = item
+        """None, `Gap`, or any item handle"""
+        self.y = y
+        """int y coordinate"""
+        self.x = x
+        """int x coordinate"""
+        self.y_span = y_span
+        """int y direction span"""
+        self.x_span = x_span
+        """int x direction span"""
+
+
+class Gap():
+    """
+    A gap within the layout has a **direction** and a **length**. Objects are hold in `_Cell.item` properties
+
+    - Coordinates of a *Gap* are not saved in this class, but in
+      class *_Cell* as `_Cell.y` and `_Cell.x` properties.
+    - It may display a column index number, see **index**.
+    - `qtgrid.qtgrid.Grid` plans the subclass *_Gap*, which also creates the Qt item.
+    """
+    __slots__ = ("grid", "is_expander", "is_empty", "direction", "length", "index")
+
+    def __init__(self, grid=None, direction=None, length=None, index=-1):
+        """
+        Examples
+
+        .. python::
+            cell = _Cell( Gap(...), y=0, x=1, y_span=2, x_span=2 )
+
+            # horizontal direction
+            Gap(grid)                                 # H, explicit empty
+            Gap(grid, direction="H", length=None)     # H, explicit empty
+            Gap(grid, direction="H", length=0)        # H, explicit empty
+            Gap(grid, direction="H", length=20)       # H, sized (yellow)
+            Gap(grid, direction="H", length="expand") # H, expand (blue)
+            Gap(grid, direction="H", length="unused") # H, unused (magenta)
+
+            # horizontal direction is default
+            Gap(grid, length=None)     # H, explicit empty
+            Gap(grid, length=0)        # H, explicit empty
+            Gap(grid, length=20)       # H, sized (yellow)
+            Gap(grid, length="expand") # H, expand (blue)
+            Gap(grid, length="unused") # H, unused (magenta)
+
+            # vertical direction
+            Gap(grid, direction="V", length=None)     # V, explicit empty
+            Gap(grid, direction="V", length=0)        # V, explicit empty
+            Gap(grid, direction="V", length=20)       # V, sized (yellow)
+            Gap(grid, direction="V", length="expand") # V, expand (blue)
+            Gap(grid, direction="V", length="unused") # V, unused (magenta)
+
+            # If given, the index argument is displayed
+            Gap(grid, length=20, index=0)
+            Gap(grid, index=20)
+
+        :parameters:
+            grid : object
+                Planner, or Grid
+            direction : None or str
+                "H", "V", "horizontal", "vertical"
+            length : None, int, or str
+                - If length == "expand", then add expander.
+                - If length == None or 0, then leave the cell empty (also add coordinates to `_Spans`).
+                - If length >= 1, then add fixed size spacer.
+            index : int
+                If given, it will be displayed as a label
+
+        """
+        if not isinstance(grid, Planner):
+            raise Exception("Arg 'grid' must be Planner object")
+        self.grid = grid
+        """Planner object, or Grid object"""
+        self.is_expander = False
+        """Do this *gap* expand ?
+
+        .. python::
+            if self.is_expander : pass
+        """
+        self.is_empty    = True
+        """Is this *gap* explicitly empty ?
+
+        .. python::
+            if self.is_empty : pass
+        """
+        self.direction   = direction
+        """Expanding or size direction 'H', 'V', 'vertical', or 'horizontal'"""
+        self.length      = length
+        """Length or size of this *gap*. Can be None, "expand", or int"""
+        self.index       = index
+        """If integer is given, it will be displayed as a label"""
+
+        # Arg 'direction', None, H, HORIZONTAL, V, VERTICAL
+        err = "Arg 'direction' must be (H|horizontal|V|vertical)"
+        if direction is None:
+            direction = "H"
+            length    = 0
+        if ( not isinstance(direction, str)
+             or direction.upper() not in ["H", "HORIZONTAL", "V", "VERTICAL"] ):
+            raise Exception( err )
+        self.direction = "H" if direction.upper() in ["H", "HORIZONTAL"] else "V"
+
+        # Arg 'length', None, int >= 0, "EXPAND", "UNUSED"
+        err = "Arg 'length' must be None, integer >= 0, or string 'expand', or string 'unused'"
+        ok  = False
+        if length is None:
+            length = 0
+            self.is_empty = True
+            ok = True
+        if isinstance(length, int):
+            if length < 0:
+                raise Exception( err )
+            if length == 0:
+                self.is_empty = True
+            ok = True
+        if isinstance(length, str):
+            length = length.upper()
+            if not (length == "EXPAND" or length == "UNUSED"):
+                raise Exception( err )
+            if length == "EXPAND":
+                self.is_expander = True
+            ok = True
+        if not ok:
+            raise Exception( err )
+        self.length = length
+
+        # Arg 'index', integer
+        if index is not None and not isinstance(index, int):
+            raise Exception("Arg 'index' must be None or integer")
+        if index is None:
+            self.index = ""
+        elif index == -1:
+            x = self.grid.wh.x
+            x = x-1 if self.grid.expand_left else x
+            self.index = str(x)
+        else:
+            self.index = str( index )
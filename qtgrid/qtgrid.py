@@ -4,28 +4,69 @@
 Make working with *QGridLayout* easier
 
 | The interface class for this module is `Grid`.
+| The placement logic is inherited from `qtgrid.planner.Planner`, which does not need Qt.
 | In this moduele, there are a number of 3-tuples defining some colors.
 """
 
+import time
+import warnings
+
+from qtgrid.planner import Planner, PlanCache, Gap, _WriteHead, _ColumnGaps, _Spans, _Cells, _Cell
+
 ############################
 # Check Qt package to import
-import importlib
-
-if importlib.util.find_spec("PyQt6") is not None:
-    from PyQt6.QtCore    import Qt, QObject
-    from PyQt6.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy
-    from PyQt6.QtGui     import QPalette, QBrush, QColor, QFont
-elif importlib.util.find_spec("PyQt5") is not None:
-    from PyQt5.QtCore    import Qt, QObject
-    from PyQt5.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy
-    from PyQt5.QtGui     import QPalette, QBrush, QColor, QFont
-elif importlib.util.find_spec("PySide6") is not None:
-    from PySide6.QtCore    import Qt, QObject
-    from PySide6.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy
-    from PySide6.QtGui     import QPalette, QBrush, QColor, QFont
-else:
+import importlib.util
+import os
+import sys
+
+QT_BINDINGS = ("PyQt6", "PyQt5", "PySide6")
+"""Supported Qt bindings, probed in this order"""
+
+
+def _select_binding() -> str:
+    """
+    Select the Qt binding to import
+
+    | 1. A binding already imported by the application, so no second binding is loaded.
+    | 2. The binding named by the environment variable *QT_API*, e.g. "pyside6".
+    | 3. The first installed binding of `QT_BINDINGS`, probing with *importlib.util.find_spec*.
+    | *QT_API* is shared with other packages like *qtpy*, so values naming no supported binding,
+    | e.g. "pyside2", are ignored with a warning.
+
+    :return: str name out of `QT_BINDINGS`
+    """
+    for name in QT_BINDINGS:
+        if name in sys.modules:
+            return name
+    api = os.environ.get("QT_API")
+    if api:
+        for name in QT_BINDINGS:
+            if name.lower() == api.lower():
+                return name
+        warnings.warn( f"Environment variable QT_API='{ api }' names no binding of { ', '.join( QT_BINDINGS ) }, "
+                       "probing the installed bindings instead", RuntimeWarning )
+    for name in QT_BINDINGS:
+        if importlib.util.find_spec( name ) is not None:
+            return name
     raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
 
+
+QT_BINDING = _select_binding()
+"""Name of the imported Qt binding, see `_select_binding`"""
+
+if QT_BINDING == "PyQt6":
+    from PyQt6.QtCore    import Qt, QObject, QEvent, QTimer, QCoreApplication, QPointF, pyqtSignal as Signal
+    from PyQt6.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy, QStyle, QApplication
+    from PyQt6.QtGui     import QPalette, QBrush, QColor, QFont, QPainter, QStaticText, QFontMetrics
+elif QT_BINDING == "PyQt5":
+    from PyQt5.QtCore    import Qt, QObject, QEvent, QTimer, QCoreApplication, QPointF, pyqtSignal as Signal
+    from PyQt5.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy, QStyle, QApplication
+    from PyQt5.QtGui     import QPalette, QBrush, QColor, QFont, QPainter, QStaticText, QFontMetrics
+else:
+    from PySide6.QtCore    import Qt, QObject, QEvent, QTimer, QCoreApplication, QPointF, Signal
+    from PySide6.QtWidgets import QLabel, QLayout, QGridLayout, QSpacerItem, QWidget, QSizePolicy, QStyle, QApplication
+    from PySide6.QtGui     import QPalette, QBrush, QColor, QFont, QPainter, QStaticText, QFontMetrics
+
 ###############
 # Global colors
 #   in work-up mode and for default labels
@@ -46,17 +87,31 @@ HEADER_BG = (190, 190, 190)
 
 # Text for reminder
 REMIND_TO_FINISH = "Method 'finish' not used"
+DEFAULT_LABELS   = ("default", "default-header")
+
 
-class Grid(QObject):
+class Grid(Planner, QObject):
     """
     Interface class for this *qtgrid* module
+
+    The placement is planned by `qtgrid.planner.Planner`, and applied to the layout in `finish`.
     """
+    finished = Signal(object)
+    """Signal emitted at the end of `finish` with the `GridStats` object, or None, see `set_stats`"""
+    finish_progress = Signal(int)
+    """Signal emitted after each step of `finish_later` with the number of cells done so far"""
+    finish_failed = Signal(object)
+    """Signal emitted with the exception raised by a step of `finish_later`, finishing stops"""
+
     def __init__(self,
                  # Instantiation options
                  layout      = None,  content_columns = 1,
                  expand_left = False, expand_right    = False,
                  work_up     = False, column_gaps     = [],
-                 list_names  = []
+                 list_names  = [],    column_mode     = "cells",
+                 recycle     = False, production      = False,
+                 plan_cache  = None,  stats           = False,
+                 virtual     = False, static          = False
                  ) -> None:
         """
         Examples
@@ -74,179 +129,295 @@ class Grid(QObject):
                 column_gaps = [ (1, 20), (3, None) ],
 
                 list_names = ["list1", "list2"],
+
+                column_mode = "span",
+
+                recycle    = True,
+                production = True,
+                plan_cache = PlanCache(),
+                stats      = True,
+                virtual    = False,
+                static     = False,
             )
 
         :param layout:          None (default) or QGridLayout object
         :param content_columns: Max int number of content columns, default 1
         :param expand_left:     boolean, default False
         :param expand_right:    boolean, default False
-        :param work_up:         boolean, default False
+        :param work_up:         boolean, or string "overlay", default False
         :param column_gaps:     list of tuples, default [ ]
         :param list_names:      list of string names pointing to lists, default [ ]
-        """
-        super(Grid, self).__init__()
+        :param column_mode:     "cells" (default), "span", or "properties"
+        :param recycle:         boolean, default False
+        :param production:      boolean, default False
+        :param plan_cache:      None (default), or `qtgrid.planner.PlanCache` object
+        :param stats:           boolean, default False
+        :param virtual:         boolean, default False
+        :param static:          boolean, default False
+        """
+        QObject.__init__(self)
         # to be composed
         self.layout  = None
         """Composed QGridLayout object. Will be cleared"""
-        self.wh      = None
-        """Composed `_WriteHead` object"""
-        self.colgaps = None
-        """Composed `_ColumnGaps` object"""
-        self.spans   = None
-        """Composed `_Spans` object"""
-        self.cells   = None
-        """Composed `_Cells` object"""
         #####
-        self.expand_left = False
-        """Boolean. If True, a far left column with expanders are applied"""
-        self.expand_right = False
-        """Boolean. If True, a far right column with expanders are applied"""
-        self.content_columns = 1
-        """Integer >= 1. Max number of content columns"""
-        self.work_up = False
-        """Boolean. If True, visual help is applied"""
+        self.work_up_overlay = False
+        """Boolean. If True, visual help is painted by a `_WorkUpOverlay` object"""
+        self._overlay = None
+        """None, or the `_WorkUpOverlay` object created in `finish`"""
+        self._column_properties = set()
+        """Set of column indices whose stretch or minimum width was set in `finish`"""
         self.label_sources = {}
         """Dictionary = { "name_id1": qlabel1, "name_id2": qlabel2, ... }"""
-        self.custom_lists = {}
-        """Dictionary = { "list_name1": [ ], "list_name2": [ ], ... }"""
+        self._label_templates = {}
+        """Dictionary = { "name_id1": _LabelTemplate, ... } compiled from **label_sources**"""
+        self.recycle = False
+        """Boolean. If True, `clear` keeps labels in a pool for reuse, see `set_recycle`"""
+        self._pool = {}
+        """Dictionary = { key: [ qlabel1, qlabel2, ... ], ... } of hidden labels for reuse"""
+        self._pool_keys = {}
+        """Dictionary = { qlabel: key, ... } of labels in the layout, which go to **_pool** on `clear`"""
+        self._reused = []
+        """List of labels taken from **_pool**, to be shown again in `finish`"""
+        self._reminder = None
+        """None, or the QLabel reminding to call `finish`"""
+        self.production = True if production else False
+        """Boolean. If True, a missing `finish` is warned about instead of showing a reminder label"""
+        self._finished = False
+        """Boolean. True if `finish` was called after the last `clear`"""
+        self.stats = None
+        """None, or `GridStats` object of the current build-up, see `set_stats`"""
+        self.virtual = False
+        """Boolean. If True, only the rows around the visible area hold widgets, see `set_virtual`"""
+        self._virtual = None
+        """None, or the `_VirtualRows` object materializing the visible rows"""
+        self.static = False
+        """Boolean. If True, `add_label` plans labels painted by a `_StaticPainter`, see `set_static`"""
+        self._static_cells = []
+        """List of the `_Cell` objects holding a `_StaticLabel`, in order of insertion"""
+        self._painter = None
+        """None, or the `_StaticPainter` object created in `finish`"""
+        self._finish_steps = None
+        """None, or the `_iter_finish` generator while `finish_later` runs"""
+        self._finish_cells = 500
+        """int number of cells per step of `finish_later`"""
+        self._finish_done = 0
+        """int number of cells done by `finish_later` so far"""
+        self._finish_timer = None
+        """None, or the QTimer driving `finish_later`, created on first use"""
+        self._finish_stats = None
+        """None, or the `GridStats` object to emit with the `finished` signal"""
 
-        # Compose
         if layout is None:
             layout = QGridLayout()
         if not isinstance(layout, QGridLayout):
             raise Exception("Arg 'layout' must be QGridLayout object")
         self.layout  = layout             # QGridLayout
-        self.wh      = _WriteHead(self)   # WriteHead
-        self.colgaps = _ColumnGaps(self)  # ColumnGaps
-        self.spans   = _Spans(self)       # Spans
-        self.cells   = _Cells(self)       # Cells
-
-        # Clear layout
-        # This also adds the remainder label with text of global var: REMIND_TO_FINISH
-        self.clear()
-        # Prepare internal lists
-        self.set_list_names( list_names )
-        # Expanding far left or right columns
-        self.set_expand_left( expand_left )
-        self.set_expand_right( expand_right )
-        # Set work-up mode
-        self.set_work_up( work_up )
-        # Max number of content columns and columns gaps
-        self.set_content_columns( content_columns )
-        self.set_column_gaps( column_gaps )
-        # Label sources
-        self._set_default_label_sources()
-        # WriteHead measures
-        self.wh.measures()
-        # ColumnGaps measure
-        self.colgaps.measure()
+
+        # Compose and set the planner options.
+        # Its clear also adds the remainder label with text of global var: REMIND_TO_FINISH,
+        # or in production mode schedules the check for a missing finish call
+        Planner.__init__(
+            self,
+            content_columns = content_columns, expand_left = expand_left,
+            expand_right    = expand_right,    column_gaps = column_gaps,
+            list_names      = list_names,      column_mode = column_mode,
+            work_up         = work_up,         plan_cache  = plan_cache,
+        )
+        # Recycle labels
+        self.set_recycle( recycle )
+        # Instrumentation
+        self.set_stats( stats )
+        # Virtual mode
+        self.set_virtual( virtual )
+        # Static labels
+        self.set_static( static )
+        # The default label sources are set on first use, see `get_label`
 
     ######################
     # Public set Accessors
-    def set_list_names(self, names=[]) -> None:
+    def set_work_up(self, flag=False) -> None:
         """
-        Prepare internal lists with given names
+        Set whether or not to activate the work-up mode
 
-        .. python::
-            grid.set_list_names("list1", "list2")
-            grid.set_list_names()
+        Can only be used before any widget is added or after calling the `clear` method.
+
+        In work up mode otherwise invisible cells are colored indicating the following meaning:
 
-        | Can only be used before any widget is added or after calling the `clear` method.
-        | The internal lists are intended to hold users widgets for later disposal.
-        | Add widgets to the lists with `add`, or `add_label` methods.
-        | After all, use the `get_list_names`, or `get_list` methods to access the lists in turn.
-        | If called without argument, all internal lists will be removed.
+        - **Magenta** : unused cell
+        - **Blue**    : horizontal expander
+        - **Cyan**    : vertical expander
+        - **Yellow**  : fixed sized horizontal gap
+        - **Orange**  : fixed sized vertical gap
+        - **Grey**    : explicit empty cell
 
-        :param names: list of strings, default [ ]
+        | If *flag* is "overlay", the layout is built as without work-up mode, and the colors are
+        | painted by a single `_WorkUpOverlay` widget on top of it, instead of a colored QLabel per cell.
+        | This is much cheaper for large grids. Cells rendering as nothing keep their zero size, though.
+
+        :param flag: boolean, or string "overlay", default False
         """
         if self.wh.x != 0 or self.wh.y != 0:
-            raise Exception("Cannot set custom list names after adding widgets")
-        if not isinstance(names, list):
-            raise Exception("Arg 'names' must be a list")
-        #####
-        self.custom_lists = {}
-        for name in names:
-            if not isinstance(name, str):
-                raise Exception("Elements in 'names' must be strings")
-            self.custom_lists[ name ] = []
+            raise Exception("Cannot set 'work_up' after adding widgets")
+        if isinstance(flag, str):
+            if flag.lower() != "overlay":
+                raise Exception("Arg 'flag' must be boolean, or string 'overlay'")
+            if self.virtual:
+                raise Exception("Cannot set work-up 'overlay' in virtual mode")
+            self.work_up         = False
+            self.work_up_overlay = True
+        else:
+            self.work_up         = True if flag else False
+            self.work_up_overlay = False
 
-    def set_expand_left(self, flag=False) -> None:
+    def set_recycle(self, flag=False) -> None:
         """
-        Set whether or not to add a far left expanding column, influencing the grid alignment
+        Set whether or not labels are recycled by `clear`
 
-        Can only be used before any widget is added or after calling the `clear` method.
+        .. python::
+            grid.set_recycle( True )
+
+        | If *flag* is True, `clear` does not delete the QLabels created by `add_label` and the
+        | gap labels, but hides and keeps them in a pool. The next `add_label` with the same
+        | *name_id*, or a gap of the same kind, takes its label from the pool and just sets the text.
+        | Changes you applied to such a label yourself are kept, too.
+        | If *flag* is False, the pool is emptied.
 
         :param flag: boolean, default False
         """
-        if self.wh.x != 0 or self.wh.y != 0:
-            raise Exception("Cannot set 'expand_left' after adding widgets")
-        self.expand_left = True if flag else False
-        self.wh.measures()
-        self.colgaps.measure()
+        self.recycle = True if flag else False
+        if not self.recycle:
+            for labels in self._pool.values():
+                for label in labels:
+                    label.deleteLater()
+            self._pool = {}
+            self._pool_keys = {}
 
-    def set_expand_right(self, flag=False) -> None:
+    def set_production(self, flag=False) -> None:
         """
-        Set whether or not to add a far right expanding column, influencing the grid alignment
+        Set whether or not the grid runs in production mode
 
-        Can only be used before any widget is added or after calling the `clear` method.
+        .. python::
+            grid.set_production( True )
+
+        | In production mode, no reminder label is added to the layout by `clear`.
+        | Instead, if cells were added but `finish` is not called until the event loop
+        | runs again, a *RuntimeWarning* is issued, see `_check_finished`.
 
         :param flag: boolean, default False
         """
-        if self.wh.x != 0 or self.wh.y != 0:
-            raise Exception("Cannot set 'expand_right' after adding widgets")
-        self.expand_right = True if flag else False
-        self.wh.measures()
+        self.production = True if flag else False
+        if self.production:
+            self._remove_reminder()
 
-    def set_content_columns(self, content_columns=1) -> None:
+    def set_stats(self, flag=False) -> None:
         """
-        Set maximum number of content columns
+        Set whether or not to collect a `GridStats` object for each build-up
 
         .. python::
-            grid.set_content_columns( content_columns=1 )
-            grid.set_content_columns( 1 )
+            grid.set_stats( True )
+            grid.finished.connect( lambda stats: print( stats.as_dict() ) )
 
-        | Can only be used before any widget is added or after calling the `clear` method.
-        | The possibly far left or right expanding columns are not considered.
-        | See also the `set_column_gaps` method.
+        | With True, `clear` creates a new `GridStats` object as `stats` property,
+        | which counts and times the build-up until `finish` emits it with the `finished` signal.
+        | The counting methods are put in place on the grid object only while enabled,
+        | so without stats there is no overhead at all. Unlike most other options, this can be
+        | changed at any time. Counting starts with the call.
 
-        :param content_columns: int n with n >= 1 and n > number of `_ColumnGaps.count`, default 1
+        :param flag: boolean, default False
         """
-        if self.wh.x != 0 or self.wh.y != 0:
-            raise Exception("Cannot set 'content_columns' after adding widgets")
-        if not isinstance(content_columns, int) or content_columns < 1:
-            raise Exception("Arg 'content_columns' must be integer >= 1")
-        if self.colgaps.count() >= content_columns:
-            raise Exception("Arg 'content_columns' must be greater than the number of 'columns_gaps'")
-        #####
-        self.content_columns = content_columns
-        self.wh.measures()
+        if flag:
+            self.stats = GridStats()
+            self._instrument()
+        else:
+            self.stats = None
+            for obj in (self, self.wh, self.cells):
+                for name in ("gage", "has_taken", "_get_label_template"):
+                    obj.__dict__.pop( name, None )
 
-    def set_column_gaps(self, column_gaps=[]) -> None:
+    def set_virtual(self, flag=False, row_height=None, prefetch=20) -> None:
         """
-        Interface method to `_ColumnGaps.set`
-        """
-        self.colgaps.set( column_gaps )
+        Set whether or not only the rows around the visible area hold widgets
 
-    def set_work_up(self, flag=False) -> None:
-        """
-        Set whether or not to activate the work-up mode
+        .. python::
+            grid = Grid( content_columns=3, column_mode="properties" )
+            grid.set_virtual( True, prefetch=50 )
+            for row in rows:
+                grid.add_label("default", row.name)
+                ...
+            grid.finish()
+
+            area = QScrollArea()
+            area.setWidgetResizable( True )
+            area.setWidget( widget )    # widget.setLayout( grid.layout )
 
         Can only be used before any widget is added or after calling the `clear` method.
 
-        In work up mode otherwise invisible cells are colored indicating the following meaning:
+        | In virtual mode, `add_label` does not create a QLabel, but plans a `_VirtualLabel` holding
+        | the *name_id* and the text. `finish` plans all rows as usual, but adds only the cells of the
+        | rows inside the visible area of the layouts parent widget, plus *prefetch* rows above and
+        | below, to the layout. The rows out of range are represented by two spacer items.
+        | When the visible area moves, e.g. by scrolling a QScrollArea, rows leaving the range are
+        | taken out of the layout, and their labels are reused for the rows entering it, see `_VirtualRows`.
+        | The label of a materialized `_VirtualLabel` is its **label** property, otherwise None.
+        |
+        | All rows are assumed to have the same height. If *row_height* is None, it is the height
+        | of the first virtual label. Gaps and widgets added with `add` are planned as usual, and taken
+        | out of the layout while their rows are out of range. Use column mode "properties" to not
+        | have a gap cell in each row, see `set_column_mode`. Work-up mode "overlay" is not supported.
+        |
+        | If *flag* is False, the labels kept for reuse are deleted.
 
-        - **Magenta** : unused cell
-        - **Blue**    : horizontal expander
-        - **Cyan**    : vertical expander
-        - **Yellow**  : fixed sized horizontal gap
-        - **Orange**  : fixed sized vertical gap
-        - **Grey**    : explicit empty cell
+        :param flag:       boolean, default False
+        :param row_height: None (default), or int height of a row in pixels
+        :param prefetch:   int number of rows to materialize above and below the visible area, default 20
+        """
+        if self.wh.x != 0 or self.wh.y != 0:
+            raise Exception("Cannot set 'virtual' after adding widgets")
+        if row_height is not None and not (isinstance(row_height, int) and row_height > 0):
+            raise Exception("Arg 'row_height' must be None, or integer > 0")
+        if not (isinstance(prefetch, int) and prefetch >= 0):
+            raise Exception("Arg 'prefetch' must be integer >= 0")
+        if flag and self.work_up_overlay:
+            raise Exception("Cannot set 'virtual' in work-up 'overlay' mode")
+        if flag and self.static:
+            raise Exception("Cannot set 'virtual' in static mode")
+        if self._virtual is not None:
+            self._virtual.delete()
+            self._virtual = None
+        self.virtual = True if flag else False
+        if self.virtual:
+            self._virtual = _VirtualRows( self, row_height, prefetch )
+
+    def set_static(self, flag=False) -> None:
+        """
+        Set whether or not `add_label` plans labels which are painted instead of being QLabels
+
+        .. python::
+            grid.set_static( True )
+            cell = grid.add_label("default", "lorem ipsum")
+            ...
+            grid.finish()
+            label = grid.promote( cell )
+
+        Can only be used before any widget is added or after calling the `clear` method.
+
+        | For read-only label grids. In static mode, `add_label` plans a `_StaticLabel` holding the text
+        | and the `_StaticStyle` shared by all labels of the same label source. In the layout, each of them
+        | takes a QSpacerItem sized by the font metrics of the text. `finish` attaches a single
+        | `_StaticPainter` widget below all widgets of the layouts parent widget, which draws the texts
+        | into the geometries of the spacer items with cached QStaticText objects.
+        | Label sources using features which cannot be painted this way, e.g. text interaction,
+        | tool tips, word wrap, or style sheets, still get a QLabel, see `_StaticStyle.paintable`.
+        | A painted label is turned into a QLabel with `promote`, e.g. to interact with it.
+        | Static mode cannot be combined with virtual mode, see `set_virtual`.
 
         :param flag: boolean, default False
         """
         if self.wh.x != 0 or self.wh.y != 0:
-            raise Exception("Cannot set 'work_up' after adding widgets")
-        self.work_up = True if flag else False
+            raise Exception("Cannot set 'static' after adding widgets")
+        if flag and self.virtual:
+            raise Exception("Cannot set 'static' in virtual mode")
+        self.static = True if flag else False
 
     def set_label_source(self, name_id=None, label=None) -> None:
         """
@@ -256,7 +427,8 @@ class Grid(QObject):
             grid.set_label_source( name_id="foo", label=myLabel )
             grid.set_label_source("foo", myLabel)
 
-        The *name_id* is the key to access the label with the `add_label`, or `get_label` methods.
+        | The *name_id* is the key to access the label with the `add_label`, or `get_label` methods.
+        | The label is compiled to a `_LabelTemplate` right away, see `add_label`.
 
         :param name_id: required str name for the label
         :param label:   required QLabel object to store
@@ -268,283 +440,47 @@ class Grid(QObject):
             raise Exception("Required arg 'label' must be QLabel object")
         # Set
         self.label_sources[ name_id ] = label
+        self._label_templates[ name_id ] = _LabelTemplate( label )
 
     ######################
     # Public get Accessors
-    def get_list(self, name=None) -> list:
-        """
-        Get *name* list of widgets as it was prepared with `set_list_names`
-
-        The returned list contains QWidgets object added with the `add` or `add_label` methods.
-
-        .. python::
-            for widget in grid.get_list("list1"):
-                pass
-
-        :param name: required str name of an internal list
-
-        :return: list of widgets
-        """
-        if not isinstance(name, str):
-            raise Exception("Arg 'name' must be string")
-        if name not in self.custom_lists:
-            raise Exception(f"List '{ name }' not found")
-        return self.custom_lists[ name ]
-
-    def get_list_names(self) -> list:
-        """
-        Get all custom list names as they were prepared with `set_list_names`
-
-        .. python::
-            names = grid.get_list_names()
-            for name in names:
-                for widget in grid.get_list( name ):
-                    pass
-
-        :return: list of list names
-        """
-        return list( self.custom_lists.keys() )
-
-    def get_content_columns(self) -> int:
-        """
-        Get max number of content columns
-
-        :return: int
-        """
-        return self.content_columns
-
     def get_label(self, name_id=None) -> object:
         """
         Get stored QLabel object by *name_id*
 
-        Labels are stored with `set_label_source`.
+        | Labels are stored with `set_label_source`.
+        | The default labels "default" and "default-header" are created with the first request.
+        | Since the returned label may be altered, its template is compiled again with the next `add_label` call.
 
         :param name_id: required str id for a stored label
         :return: QLabel object
         """
         if not isinstance(name_id, str):
             raise Exception("Arg 'name_id' must be string")
+        if name_id not in self.label_sources and name_id in DEFAULT_LABELS:
+            self._set_default_label_sources()
         if name_id not in self.label_sources:
             raise Exception(f"Label with id '{name_id}' not found")
+        self._label_templates.pop( name_id, None )
         return self.label_sources[ name_id ]
 
-    ################
-    # Public methods
-    def add(self, widget=None, y_span=1, x_span=1, to_list=None) -> object:
+    def get_visible_rows(self) -> tuple:
         """
-        Add a *widget* to the current `_WriteHead` position into the grid
+        Get the range of rows holding widgets in virtual mode, see `set_virtual`
 
         .. python::
-            cell = grid.add( widget=WIDGET, y_span=1, x_span=1, to_list="list_name" )
-            cell = grid.add( WIDGET, y_span=2, x_span=2 )
-            cell = grid.add( WIDGET, x_span="all" )
-            cell = grid.add( WIDGET )
-
-        | The *to_list* argument can be used to not only add the widget to the grid, but also to
-        | a prepared internal list for later use. See also the `set_list_names` method.
-        |
-        | The *y_span* and *x_span* integer arguments spans the cell over the given number of rows
-        | and columns. If *x_span* value is **"all"** the cell spans over the remaining row.
+            (first, last) = grid.get_visible_rows()
 
-        :param widget:  required QWidget object to be added
-        :param y_span:  int >= 1, default 1
-        :param x_span:  int >= 1, or string "all", default 1
-        :param to_list: optional str name of an internal list
-
-        :return: `_Cell` object with *QWidget* object
-        """
-        # Arguments
-        if widget is None:
-            raise Exception("missing widget")
-        if not (isinstance(y_span, int) and y_span >= 1):
-            raise Exception("Arg 'y_span' must be integer >= 1")
-        if ( not (isinstance(x_span, int) and x_span >= 1)
-             and not (isinstance(x_span, str) and x_span.upper() == "ALL") ):
-            raise Exception("Arg 'x_span' must be integer >= 1 or string 'all'")
-        if to_list is not None:
-            if not isinstance(to_list, str):
-                raise Exception("Arg 'to_list' must be string")
-            if to_list not in self.custom_lists:
-                raise Exception(f"list '{to_list}' does not exist")
-        # Calibrate write head
-        self.wh.gage()
-        # Get current position
-        y = self.wh.y
-        x = self.wh.x
-        # Check x_span
-        max_span = self._get_remaining_x_span()
-        if isinstance(x_span, str) and x_span.upper() == "ALL":
-            x_span = max_span
-        else:
-            if x_span > max_span:
-                x_span = max_span
-        # Add to grid cells
-        cell = _Cell( widget, y, x, y_span, x_span )
-        self.cells.add( cell )
-        # Reserve span
-        if y_span > 1 or x_span > 1:
-            self.spans.reserve( y, x, y_span, x_span )
-        # Add to custom list ?
-        if to_list is not None:
-            self.custom_lists[ to_list ].append( widget )
-        # Return
-        return cell
-
-    def add_gap(self, direction=None, length=None, y_span=1, x_span=1) -> object:
-        """
-        Add a `_Cell` object with a `_Gap` object to the `_WriteHead` position into the grid
-
-        .. python::
-            cell = add_gap(direction="H", length="20", y_span=2, x_span=2)
-            # horizontal direction
-            cell = add_gap("H")           # same as None
-            cell = add_gap("H", 0)        # same as None
-            cell = add_gap("H", None)     # explicitly empty
-            cell = add_gap("H", 20)
-            cell = add_gap("H", "expand")
-
-            # horizontal direction is default
-            cell = add_gap()         # same as None
-            cell = add_gap(0)        # same as None
-            cell = add_gap(None)     # explicitly empty
-            cell = add_gap(20)
-            cell = add_gap("expand")
-
-            # vertical direction
-            cell = add_gap("V")           # same as None
-            cell = add_gap("V", 0)        # same as None
-            cell = add_gap("V", None)     # explicitly empty
-            cell = add_gap("V", 20)
-            cell = add_gap("V", "expand")
-
-        See the `set_work_up` method for a list of displayed colors in **work_up** mode.
-
-        :param direction: None, "H" (default) , "V", "horizontal", or "vertical"
-        :param length:    None, int >= 0, or "expand", default None
-        :param y_span:    int >= 1, default 1
-        :param x_span:    int >= 1, default 1
-
-        :return: `_Cell` object with a `_Gap` object
-        """
-        # Arg 'direction': None, int, H, HORIZONTAL, V, VERTICAL, EXPAND
-        err = "Arg 'direction' must be None, integer, H, horizontal, V, vertical, or expand"
-        if direction is None:
-            direction = "H"
-            length    = 0
-        if isinstance(direction, int):
-            length    = direction
-            direction = "H"
-        if ( not isinstance(direction, str)
-             or direction.upper() not in ["H", "HORIZONTAL", "V", "VERTICAL", "EXPAND"] ):
-            raise Exception( err )
-        else:
-            D = direction.upper()
-            if D in ["H", "HORIZONTAL"]:
-                direction = "H"
-            elif D in ["V", "VERTICAL"]:
-                direction = "V"
-            elif D == "EXPAND":
-                length    = D
-                direction = "H"
-            else:
-                direction = D
-        if direction not in ["H", "V"]:
-            raise Exception("Unknown arg 'direction' value:", direction)
-
-        # Arg 'length': None, int >= 0, EXPAND
-        err = "Arg 'length' must be None, integer >= 0, or string 'expand'"
-        if length is None:
-            length = 0
-        if not (isinstance(length, str) or isinstance(length, int)):
-            raise Exception( err )
-        if isinstance(length, int) and length < 0:
-            raise Exception( err )
-        if isinstance(length, str) and not length.upper() == "EXPAND":
-            raise Exception( err )
-
-        # Arg 'y_span': int >= 1
-        if not isinstance(y_span, int) or not y_span >= 1:
-            raise Exception("Arg 'y_span' must be integer >= 1")
-
-        # Arg 'x_span': int >= 1, ALL
-        err = "Arg 'x_span' must be integer >= 1, or 'all'"
-        max_span = self._get_remaining_x_span()
-        if isinstance(x_span, str) and x_span.upper() == "ALL":
-            x_span = max_span
-        if not (isinstance(x_span, int) and x_span >= 1):
-            raise Exception( err )
-        if x_span > max_span:
-            x_span = max_span
-
-        # Calibrate write head
-        self.wh.gage()
-        # Get current position
-        y = self.wh.y
-        x = self.wh.x
-        # Add to grid cells
-        gap  = _Gap( self, direction, length )
-        cell = _Cell( gap, y, x, y_span, x_span )
-        self.cells.add( cell )
-        # Reserve span
-        if y_span > 1 or x_span > 1:
-            self.spans.reserve( y, x, y_span, x_span )
-        # Return
-        return cell
-
-    def add_empty_row(self, height=None) -> object:
-        """
-        Add a row gap
+        | The range includes the *prefetch* rows above and below the visible area.
 
-        .. python::
-            cell = grid.add_empty_row()     # same as None
-            cell = grid.add_empty_row(0)    # same as None
-            cell = grid.add_empty_row(None) # explicitly empty
-            cell = grid.add_empty_row(20)
-            cell = grid.add_empty_row("expand")
-
-        | If not in first column: fill the remaining row with explicit empty cells (colored grey), then …
-        | In the first column of a row: apply vertical gap by adding a single cell spawning the complete row.
-        |
-        | The first three calls are all equivalent.
-        | When given a integer number, the row gets a fixed height in pixels.
-        | If the string “expand” is used, the row expands in vertical direction.
-        | See the `set_work_up` method for a list of displayed colors in **work_up** mode.
-
-        :param height: None (default), int >= 0, or "expand"
-
-        :return: `_Cell` object with `_Gap` object
+        :return: None, or 2-tuple of int *(first, last)*
         """
-        # Arg 'height': None, int >= 0, or "expand"
-        if ( height is not None
-             and not (isinstance(height, int) and height >= 0)
-             and not (isinstance(height, str) and height.upper() == "EXPAND") ):
-            raise Exception("Arg 'height' must be None, int >= 0, or string 'expand'")
-        (left_edge, right_edge) = self.wh.content_range
-        # Calibrate write head
-        self.wh.gage()
-        # Get current position
-        y = self.wh.y
-        x = self.wh.x
-        # Fill remaining row cells
-        while x != left_edge:
-            gap = _Gap( self )
-            self.cells.add(
-                _Cell( gap, y, x )
-            )
-            self.wh.gage()
-            y = self.wh.y
-            x = self.wh.x
-        # Apply vertical row gap
-        span = self._get_remaining_x_span()
-        gap  = _Gap( self, "V", height )
-        cell = _Cell( gap, y, x, x_span=span )
-        self.cells.add( cell )
-        # Reserve span
-        if span > 1:
-            self.spans.reserve( y, x, 1, span )
-        # Return
-        return cell
+        if self._virtual is None:
+            return None
+        return self._virtual.window
 
+    ################
+    # Public methods
     def add_label(self, name_id=None, text="", y_span=1, x_span=1, to_list=None) -> object:
         """
         Add a `_Cell` object with a *QLabel* object at `_WriteHead` position into the grid
@@ -552,6 +488,8 @@ class Grid(QObject):
         | The *name_id* argument references to a label preset.
         | If *x_span* value is "all", the added label spans over the remaining row.
         | See also the `set_label_source` method.
+        | The new label is created from the compiled `_LabelTemplate` of the preset,
+        | or taken from the pool of recycled labels, see `set_recycle`.
 
         .. python::
             cell = grid.add_label( name_id="foo", text="lorem ipsum", y_span=2, x_span=2, to_list="list1" )
@@ -584,114 +522,663 @@ class Grid(QObject):
 
         :return: `_Cell` object with *QLabel* object
         """
+        self._check_adding()
         if not isinstance(name_id, str) or not len(name_id):
             raise Exception("Required arg 'name_id' must be string")
         if not isinstance(text, str):
             raise Exception("Required arg 'text' must be string")
         #####
-        lbl     = self.get_label( name_id )
-        mylabel = self._copy_label( lbl )
+        if self.virtual:
+            # The label is created once its row becomes visible
+            if name_id not in self.label_sources and name_id not in DEFAULT_LABELS:
+                raise Exception(f"Label with id '{name_id}' not found")
+            return self.add( _VirtualLabel( name_id, text ), y_span=y_span, x_span=x_span, to_list=to_list )
+        if self.static:
+            # Not counted as a created widget by `stats`
+            style = Grid._get_label_template( self, name_id ).get_static_style()
+            if style.paintable:
+                spacing = ( max( 0, self.layout.horizontalSpacing() ), max( 0, self.layout.verticalSpacing() ) )
+                label   = _StaticLabel( name_id, text, style, spacing )
+                cell    = self.add( label, y_span=y_span, x_span=x_span, to_list=to_list )
+                self._static_cells.append( cell )
+                return cell
+        mylabel = self._pool_take( ("label", name_id) ) if self.recycle else None
+        if mylabel is None:
+            mylabel = self._get_label_template( name_id ).create()
+            if self.recycle:
+                self._pool_keys[ mylabel ] = ("label", name_id)
         mylabel.setText( text )
         return self.add( mylabel, y_span=y_span, x_span=x_span, to_list=to_list )
 
-    def clear(self, _layout=None) -> None:
+    def promote(self, cell=None) -> object:
+        """
+        Turn the painted label of *cell* into a QLabel, see `set_static`
+
+        .. python::
+            cell  = grid.add_label("default", "lorem ipsum")
+            ...
+            label = grid.promote( cell )
+            label.setTextInteractionFlags( Qt.TextInteractionFlag.TextSelectableByMouse )
+
+        | The QLabel is created from the label source, and takes the place of the spacer item in the layout.
+        | Cells which hold a QLabel already just return it.
+
+        :param cell: required `_Cell` object as returned from `add_label`
+        :return: QLabel object
+        """
+        if not isinstance(cell, _Cell):
+            raise Exception("Arg 'cell' must be _Cell object")
+        item = cell.item
+        if isinstance(item, QLabel):
+            return item
+        if not isinstance(item, _StaticLabel):
+            raise Exception("Arg 'cell' must hold a label")
+        if item.label is None:
+            label = self._get_label_template( item.name_id ).create()
+            label.setText( item.text )
+            item.label = label
+            if self._finished:
+                self.layout.removeItem( item.spacer )
+                self.layout.addWidget( label, cell.y, cell.x, cell.y_span, cell.x_span )
+            if self._painter is not None:
+                self._painter.update()
+        return item.label
+
+    def clear(self) -> None:
         """
         Delete all `_Cell` objects and corresponding items in *QGridLayout* recursively
 
         .. python::
             grid.clear()
 
-        | The *_layout* argument is used for the recursive call only.
-        | The `_WriteHead` coordinates are reset.
-        | All `custom_lists` and the private list `_Spans._list` are reset.
+        | The items are taken from the end of the layout, see `_clear_layout`.
+        | In recycle mode, labels are kept in a pool instead, see `set_recycle`.
+        | In virtual mode, the labels of the visible rows are kept for reuse, see `set_virtual`.
+        | Then the plan is cleared, see `qtgrid.planner.Planner.clear`.
+        """
+        # Stop finishing, then clear grid items
+        self.cancel_finish()
+        if self._virtual is not None:
+            self._virtual.detach()
+        self._clear_layout( self.layout )
+        self._pool_keys = {}
+        # Reset column properties, overlay, and painter
+        if self._overlay is not None:
+            self._overlay.detach()
+            self._overlay = None
+        if self._painter is not None:
+            self._painter.detach()
+            self._painter = None
+        self._static_cells = []
+        for x in self._column_properties:
+            self.layout.setColumnStretch( x, 0 )
+            self.layout.setColumnMinimumWidth( x, 0 )
+        self._column_properties = set()
+        # Clear the plan
+        Planner.clear( self )
+        self._finished = False
+        if self.stats is not None:
+            self.stats = GridStats()
+            self._instrument()
+        if self.production:
+            # Check for a missing finish call, once the event loop runs again
+            if QCoreApplication.instance() is not None:
+                QTimer.singleShot( 0, self._check_finished )
+            return
+        # Add reminder label.
+        # This will only be removed in finish method.
+        if self._reminder is None:
+            self._reminder = QLabel( REMIND_TO_FINISH )
+        self.layout.addWidget( self._reminder )
+
+    def finish(self) -> None:
+        """
+        Always call this after you added all your cells
+
+        | Plan the expander and gaps, and the unused cells in **work_up** mode, see `qtgrid.planner.Planner.finish`.
+        | Then apply the column properties and from all `_Cell` objects their holding *QWidget* objects
+        | to the resulting *QGridLayout*, see `apply_plan`.
+        | In virtual mode, only the cells of the visible rows are applied, see `set_virtual`.
+        | In work-up "overlay" mode, a `_WorkUpOverlay` is attached to the layouts parent widget last.
+        | At last, the `finished` signal is emitted.
+        | To keep the event loop running while finishing a large grid, see `finish_later`.
+        """
+        if self.is_finishing():
+            raise Exception("Grid is finishing already")
+        for n in self._iter_finish():
+            pass
+        self.finished.emit( self._finish_stats )
+
+    def apply_plan(self, plan=None, resolve=None) -> None:
+        """
+        Add the items of a placement plan to the resulting QGridLayout in one batch
+
+        .. python::
+            grid.apply_plan()
+
+            planner = Planner( content_columns=3 )
+            planner.add("name")
+            grid.apply_plan( planner.finish(), resolve=widgets.get )
+
+        | Without *plan*, the plan of this grid is applied, as done by `finish`.
+        | A *plan* is a list of 5-tuples *(item, y, x, y_span, x_span)*, e.g. computed by a
+        | `qtgrid.planner.Planner` in a worker thread. Its item handles are mapped to Qt objects by
+        | the *resolve* callable, its `qtgrid.planner.Gap` objects are created as `_Gap` of this grid.
+        | Column properties are not part of a plan, they are applied by `finish` only.
+        | Applying a given *plan* takes the place of calling `finish`, so the reminder label is removed.
+        |
+        | While adding, the updates of the layouts parent widget are suspended and the layout
+        | is disabled, so it is activated only once at the end. On a visible parent widget,
+        | the added widgets are shown within the batch, too.
+        | The add method per item type is looked up with `_get_dispatch`.
+        | In virtual mode, the rows are applied by `finish` only, see `set_virtual`.
+
+        :param plan:    None (default), or list of 5-tuples
+        :param resolve: None (default), or callable mapping an item handle to a Qt object
+        """
+        if self._virtual is not None:
+            raise Exception("Cannot apply a plan in virtual mode, use 'finish'")
+        for n in self._iter_apply_plan( plan, resolve ):
+            pass
+
+    def finish_later(self, cells=500) -> None:
+        """
+        Do `finish` in steps, while the event loop keeps running
+
+        .. python::
+            grid.finish_progress.connect( lambda cells: status.setText( f"{ cells } cells" ) )
+            grid.finished.connect( lambda stats: status.setText("done") )
+            grid.finish_later()
+
+        | Each event loop tick plans or applies about *cells* cells, then the `finish_progress` signal
+        | is emitted. At last, the `finished` signal is emitted, the layout is the same as by `finish`.
+        | The reminder label is removed at once. Until the last step, the layout is disabled and
+        | the updates of its parent widget are suspended, as by `apply_plan`. So the last step
+        | still takes the single layout pass of Qt, which grows with the number of cells.
+        | A running finish is stopped by `cancel_finish`, or by `clear`.
+        | Cells cannot be added until it is done.
+        | An exception raised by the first step, which runs right away, is passed on. Raised by a
+        | later step, it stops finishing and is emitted with the `finish_failed` signal.
+        | Raise an exception if a finish is running already.
+
+        :param cells: int number of cells per step, default 500
+        """
+        if not (isinstance(cells, int) and cells > 0):
+            raise Exception("Arg 'cells' must be integer > 0")
+        if self.is_finishing():
+            raise Exception("Grid is finishing already")
+        self._finish_steps = self._iter_finish()
+        self._finish_cells = cells
+        self._finish_done  = 0
+        if self._finish_timer is None:
+            self._finish_timer = QTimer( self )
+            self._finish_timer.setInterval( 0 )
+            self._finish_timer.timeout.connect( self._finish_tick )
+        self._finish_step()
+        if self.is_finishing():
+            self._finish_timer.start()
+
+    async def finish_async(self, cells=500, budget_ms=20) -> bool:
+        """
+        Do `finish` as coroutine, control is given back to the asyncio event loop after each step
+
+        .. python::
+            await grid.finish_async()
+            await grid.finish_async( cells=2000, budget_ms=None )
+
+        | Each step plans or applies up to *cells* cells until *budget_ms* milliseconds are used up,
+        | then the `finish_progress` signal is emitted and *asyncio.sleep(0)* is awaited.
+        | At last, the `finished` signal is emitted, the layout is the same as by `finish`.
+        | As with `finish_later`, a running finish is stopped by `cancel_finish`, or by `clear`,
+        | and also if the awaiting task is cancelled.
+        | Raise an exception if a finish is running already.
+
+        :param cells:     int maximum number of cells per step, default 500
+        :param budget_ms: None, or int milliseconds per step, default 20
+        :return:          boolean, True if finished, False if stopped
+        """
+        # Not imported by the module, to keep importing it fast
+        import asyncio
+        if not (isinstance(cells, int) and cells > 0):
+            raise Exception("Arg 'cells' must be integer > 0")
+        if not (budget_ms is None or isinstance(budget_ms, int) and budget_ms > 0):
+            raise Exception("Arg 'budget_ms' must be None, or integer > 0")
+        if self.is_finishing():
+            raise Exception("Grid is finishing already")
+        self._finish_steps = steps = self._iter_finish()
+        self._finish_cells = cells
+        self._finish_done  = 0
+        try:
+            while True:
+                deadline = None if budget_ms is None else time.perf_counter() + budget_ms / 1000
+                if self._finish_step( deadline ):
+                    return True
+                await asyncio.sleep( 0 )
+                if self._finish_steps is not steps:
+                    return False
+        finally:
+            if self._finish_steps is steps:
+                self.cancel_finish()
+
+    async def add_rows_async(self, rows=None, columns=None, batch=100, budget_ms=20) -> int:
+        """
+        Add rows of labels as coroutine, control is given back to the asyncio event loop after each batch
+
+        .. python::
+            await grid.add_rows_async( fetch_rows(), columns=[ "name", ("size", "right") ] )
+            await grid.finish_async()
+
+        | The *rows* are an asynchronous iterable, an iterable, or a path of a CSV or JSONL file,
+        | mapped to labels by *columns*, see `qtgrid.loader.GridLoader`.
+        | Each batch adds up to *batch* rows until *budget_ms* milliseconds are used up,
+        | see `qtgrid.loader.GridLoader.load_async`. The grid is not finished.
 
-        :param _layout: None or QGridLayout object
+        :param rows:      required asynchronous iterable, or iterable of rows, or path of a file
+        :param columns:   None (default), or list of keys, or of 2-tuples *(key, name_id)*
+        :param batch:     int maximum number of rows per batch, default 100
+        :param budget_ms: None, or int milliseconds per batch, default 20
+        :return:          int number of rows added
         """
-        if _layout is None:
-            _layout = self.layout
-        # Clear grid items
-        item = _layout.takeAt(0)
-        while item is not None:
+        from qtgrid.loader import GridLoader
+        loader = GridLoader( self, rows, columns=columns, chunk_ms=budget_ms, finish=False )
+        return await loader.load_async( batch )
+
+    def cancel_finish(self) -> None:
+        """
+        Stop a finish started by `finish_later` or `finish_async`
+
+        .. python::
+            grid.cancel_finish()
+
+        | The layout is enabled again, and holds the cells applied so far.
+        | Call `clear` before adding cells and finishing again. Without finishing, nothing happens.
+        """
+        if self._finish_timer is not None:
+            self._finish_timer.stop()
+        steps = self._finish_steps
+        self._finish_steps = None
+        if steps is not None:
+            steps.close()
+
+    def is_finishing(self) -> bool:
+        """
+        Is a finish started by `finish_later` or `finish_async` running ?
+
+        :return: boolean
+        """
+        return self._finish_steps is not None
+
+    #################
+    # Private methods
+    def _finish_tick(self) -> None:
+        """
+        Do a step of `finish_later`, called by its timer
+
+        | An exception is not raised out of the timer slot, but emitted with the `finish_failed` signal.
+        """
+        try:
+            self._finish_step()
+        except Exception as e:
+            self.finish_failed.emit( e )
+
+    def _finish_step(self, deadline=None) -> bool:
+        """
+        Do about **_finish_cells** cells of `_iter_finish`, called by `finish_later`, `_finish_tick`,
+        and `finish_async`
+
+        | With *deadline*, the step ends once *time.perf_counter()* reaches it, too.
+        | Then emit the `finish_progress` signal with the number of cells done so far.
+        | After the last step, emit the `finished` signal.
+        | An exception raised by `_iter_finish` stops finishing, and is raised again.
+
+        :param deadline: None (default), or float seconds of *time.perf_counter()*
+        :return:         boolean, True after the last step
+        """
+        steps = self._finish_steps
+        limit = self._finish_done + self._finish_cells
+        done  = self._finish_done
+        try:
+            while done < limit:
+                done += next( steps )
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+        except StopIteration:
+            if self._finish_timer is not None:
+                self._finish_timer.stop()
+            self._finish_steps = None
+        except Exception:
+            self.cancel_finish()
+            raise
+        finally:
+            self._finish_done = done
+        self.finish_progress.emit( done )
+        if self._finish_steps is not None:
+            return False
+        # Emitted after the progress, not within the last step
+        self.finished.emit( self._finish_stats )
+        return True
+
+    def _iter_finish(self) -> object:
+        """
+        Generator doing `finish` step by step, yields the int number of cells of each step
+
+        | The `finished` signal is not emitted, but its `GridStats` object is kept
+        | as **_finish_stats**, see `finish` and `_finish_step`.
+        """
+
+        # Remove reminder label, it is kept for the next clear
+        self._remove_reminder()
+        self._finished = True
+        stats = self.stats
+        lap   = None
+        if stats is not None:
+            lap = stats.lap
+            lap()
+
+        # 1.-3. Plan expander, column gaps, and unused cells
+        max_y = yield from self._iter_plan_finish( lap )
+        # Qt leaves out the spacing after a column without items, so a fixed
+        # sized gap column gets it added, unless no column follows. Without
+        # parent widget, the layout has no spacing yet, take the default.
+        spacing = self.layout.horizontalSpacing()
+        if spacing < 0:
+            spacing = QApplication.style().pixelMetric( QStyle.PixelMetric.PM_LayoutHorizontalSpacing )
+        spacing = max( 0, spacing )
+        last_x  = self.wh.max_x
+        for (x, (stretch, min_width)) in self.column_properties.items():
+            if min_width > 0 and x < last_x:
+                min_width += spacing
+            self.layout.setColumnStretch( x, stretch )
+            self.layout.setColumnMinimumWidth( x, min_width )
+            self._column_properties.add( x )
+
+        # 4. Apply all cells in one batch, or the visible rows only
+        if self._virtual is not None:
+            self._virtual.attach( max_y )
+        else:
+            yield from self._iter_apply_plan()
+        if stats is not None:
+            stats.count( self )
+        # Show recycled labels again
+        for label in self._reused:
+            if label.parentWidget() is not None:
+                label.show()
+        self._reused = []
+        if lap is not None:
+            lap("apply")
+
+        # 5. Paint static labels, and work-up colors
+        if self._static_cells:
+            self._painter = _StaticPainter( self, self._static_cells )
+            self._painter.attach()
+        if self.work_up_overlay:
+            self._overlay = _WorkUpOverlay( self, self._get_work_up_marks( max_y ) )
+            self._overlay.attach()
+            if lap is not None:
+                lap("overlay")
+        self._finish_stats = stats
+
+    def _iter_apply_plan(self, plan=None, resolve=None) -> object:
+        """
+        Generator doing `apply_plan` step by step, yields 1 for each item of the plan
+
+        | If closed before the end, the layouts are enabled and the updates are resumed,
+        | but the layout is not activated.
+
+        :param plan:    None (default), or list of 5-tuples
+        :param resolve: None (default), or callable mapping an item handle to a Qt object
+        """
+        layout = self.layout
+        if plan is None:
+            plan = self.get_plan()
+        else:
+            # A given plan replaces calling finish
+            self._remove_reminder()
+            self._finished = True
+        ###
+        # Methods to use:
+        #
+        # for Grid objects  : layout.addLayout( obj.layout, y,x, y_span, x_span )
+        # for QLayout objects     : layout.addLayout( obj,        y,x, y_span, x_span )
+        # for QSpacerItem objects : layout.addItem(   obj,        y,x, y_span, x_span )
+        # for QWidget objects     : layout.addWidget( obj,        y,x, y_span, x_span )
+        ###
+        methods = {
+            "item":   layout.addItem,
+            "layout": layout.addLayout,
+            "widget": layout.addWidget,
+        }
+        dispatch     = Grid._dispatch
+        get_dispatch = self._get_dispatch
+        # Suspend updates and layout activation of the parent widget
+        parent  = layout.parentWidget()
+        visible = parent is not None and parent.isVisible()
+        suspend = parent is not None and parent.updatesEnabled()
+        top     = parent.layout() if parent is not None else None
+        layouts = [ layout ] if top is None or top is layout else [ layout, top ]
+        if suspend:
+            parent.setUpdatesEnabled( False )
+        for lyt in layouts:
+            lyt.setEnabled( False )
+        widgets = []
+        try:
+            for (item, y, x, y_span, x_span) in plan:
+                if resolve is not None and item is not None and not isinstance(item, Gap):
+                    item = resolve( item )
+                kind = dispatch.get( type(item) ) or get_dispatch( type(item) )
+                if kind == "plan-gap":
+                    item = self._new_gap( item.direction, item.length, index=int(item.index) if item.index else None )
+                    kind = "gap"
+                if kind == "gap":
+                    # Cell Gap, holding None, QSpacerItem, or QLabel
+                    item = item.item
+                    kind = dispatch.get( type(item) ) or get_dispatch( type(item) )
+                elif kind == "static":
+                    # Painted label, or its promoted QLabel
+                    if item.label is None:
+                        item = item.spacer
+                        kind = "item"
+                    else:
+                        item = item.label
+                        kind = "widget"
+                elif kind == "grid":
+                    item = item.layout
+                    kind = "layout"
+                if kind == "none":
+                    yield 1
+                    continue
+                methods[ kind ]( item, y, x, y_span, x_span )
+                if visible:
+                    if kind == "widget":
+                        widgets.append( item )
+                    elif kind == "layout":
+                        self._collect_widgets( item, widgets )
+                yield 1
+            # Show reparented widgets now, as Qt would do one by one later,
+            # each time activating the layout of the visible parent.
+            # Showing top-most first keeps Qt's sibling checks short.
+            for widget in reversed( widgets ):
+                if not ( widget.isHidden()
+                         and widget.testAttribute( Qt.WidgetAttribute.WA_WState_ExplicitShowHide ) ):
+                    widget.setVisible( True )
+        finally:
+            for lyt in layouts:
+                lyt.setEnabled( True )
+            if suspend:
+                parent.setUpdatesEnabled( True )
+        layouts[-1].activate()
+
+    def _clear_layout(self, layout=None) -> None:
+        """
+        Take all items from *layout* and its nested layouts, starting at the end
+
+        | Taking from the end avoids shifting the remaining items in Qt's item list.
+        | Widgets are deleted, unless they are recyclable labels, which are hidden
+        | and moved to the pool, see `set_recycle`.
+
+        :param layout: required QLayout object
+        """
+        for i in range( layout.count() - 1, -1, -1 ):
+            item = layout.takeAt(i)
             wgt = item.widget()
             if wgt is not None:
-                wgt.deleteLater()
+                if wgt is not self._reminder:
+                    self._release_widget( wgt )
+                continue
             lyt = item.layout()
             if lyt is not None:
-                self.clear( lyt )
-            item = _layout.takeAt(0)
-
-        # Reset WriteHead coordinates
-        self.wh.y = 0
-        self.wh.x = 0
-        # Clear custom lists
-        for name in self.custom_lists:
-            self.custom_lists[ name ] = []
-        # Clear spans
-        self.spans = _Spans(self)
-        # Clear cells
-        self.cells = _Cells(self)
-        # Add reminder label.
-        # This will only be removed in finish method.
-        self.layout.addWidget( QLabel( REMIND_TO_FINISH ) )
+                self._clear_layout( lyt )
 
-    def finish(self) -> None:
+    def _release_widget(self, wgt=None) -> None:
         """
-        Always call this after you added all your cells
+        Delete a widget taken from the layout, or move a recyclable label to the pool
 
-        | Apply from all `_Cell` objects their holding *QWidget* objects to the resulting *QGridLayout*.
-        | Also add the expander and gaps and mark unused cells in **work_up** mode.
+        :param wgt: required QWidget object
         """
+        key = self._pool_keys.get( wgt )
+        if key is None:
+            wgt.deleteLater()
+        else:
+            if wgt.parentWidget() is not None:
+                wgt.hide()
+            self._pool.setdefault( key, [] ).append( wgt )
 
-        # Remove reminder label
+    def _remove_reminder(self) -> None:
+        """
+        Take the reminder label out of the layout, it is kept for the next `clear`
+        """
         item = self.layout.itemAt(0)
-        if item is not None:
-            lbl = item.widget()
-            if ( lbl is not None
-                 and isinstance(lbl, QLabel)
-                 and lbl.text() == REMIND_TO_FINISH ):
-                self.layout.takeAt(0)
-                lbl.deleteLater()
+        if item is not None and item.widget() is self._reminder:
+            self.layout.takeAt(0)
+            self._reminder.setParent( None )
 
-        max_y = self.cells.get_current_max_y()
+    def _check_finished(self) -> None:
+        """
+        Warn about a missing `finish` call in production mode
 
-        # 1. Apply far left or right expander
-        for y in range( max_y + 1 ):
-            # Left
-            if self.expand_left:
-                gap = _Gap( self, "H", "expand", index=None )
-                self.cells.add(
-                    _Cell( gap, y, 0 )
-                )
-            # Right
-            if self.expand_right:
-                gap = _Gap( self, "H", "expand", index=None )
-                self.cells.add(
-                    _Cell( gap, y, self.wh.expand_right_index )
-                )
+        | Called from the event loop after `clear`. Without added cells, there is nothing to warn about.
+        """
+        if self.production and not self._finished and len( self.cells.get() ):
+            warnings.warn( f"Grid with { len( self.cells.get() ) } cells: { REMIND_TO_FINISH }", RuntimeWarning )
 
-        # 2. Add column gaps
-        self.colgaps.add_to_cells()
+    def _instrument(self) -> None:
+        """
+        Put counting methods in place on the grid, its `_WriteHead` and its `_Cells` for `stats`
 
-        # 3. Apply user added cells
-        self.cells.apply_to_layout()
+        | The methods are instance attributes wrapping the class methods, see `set_stats`.
+        """
+        stats = self.stats
+        wh_gage      = _WriteHead.gage.__get__( self.wh )
+        has_taken    = _Cells.has_taken.__get__( self.cells )
+        get_template = Grid._get_label_template.__get__( self )
 
-        # 4. Mark unused cells
-        if self.work_up:
-            (left_edge, right_edge) = self.wh.content_range
-            for y in range( max_y + 1 ):
-                for x in range( left_edge, right_edge + 1 ):
-                    if not self.cells.has_taken( y, x ):
-                        idx = x-1 if self.expand_left else x
-                        gap = _Gap( self, "H", "unused", index=idx)
-                        self.layout.addWidget( gap.item, y, x )
+        def gage():
+            stats.gage += 1
+            wh_gage()
+
+        def counting_has_taken(y=-1, x=-1):
+            stats.has_taken += 1
+            return has_taken( y, x )
+
+        def counting_get_template(name_id=None):
+            stats.widgets += 1
+            return get_template( name_id )
+
+        self.wh.gage = gage
+        self.cells.has_taken = counting_has_taken
+        self._get_label_template = counting_get_template
+
+    def _pool_take(self, key=None) -> object:
+        """
+        Take a label out of the pool of recycled labels
+
+        | A taken label is recyclable again, and it is shown again in `finish`.
+
+        :param key: required tuple, ("label", name_id) or ("gap", direction, length, index, work_up)
+        :return: None, or QLabel object
+        """
+        labels = self._pool.get( key )
+        if not labels:
+            return None
+        label = labels.pop()
+        self._pool_keys[ label ] = key
+        self._reused.append( label )
+        return label
+
+    def _check_adding(self) -> None:
+        """
+        Raise an exception while finishing in steps, see `finish_later` and `finish_async`
+        """
+        if self._finish_steps is not None:
+            raise Exception("Grid is finishing")
+
+    def _new_gap(self, direction=None, length=None, index=-1) -> object:
+        """
+        Create the gap object to be planned, see `_Gap` for the arguments
+
+        :return: `_Gap` object
+        """
+        return _Gap( self, direction, length, index )
+
+    def _collect_widgets(self, layout=None, widgets=None) -> None:
+        """
+        Append all widgets of *layout* and its nested layouts to *widgets*
+
+        :param layout:  required QLayout object
+        :param widgets: required list to append to
+        """
+        for i in range( layout.count() ):
+            item = layout.itemAt(i)
+            if item.widget() is not None:
+                widgets.append( item.widget() )
+            elif item.layout() is not None:
+                self._collect_widgets( item.layout(), widgets )
+
+    _dispatch = { type(None): "none" }
+    """Dict, cache of `_get_dispatch` results per item type"""
+
+    @classmethod
+    def _get_dispatch(cls, item_type=None) -> str:
+        """
+        Get how `apply_plan` handles items of type *item_type*
+
+        .. python::
+            kind = Grid._get_dispatch( QLabel )
+
+        | The result is cached in `_dispatch`, so the *isinstance* checks run once per type only.
+
+        :param item_type: required type of a plan item, or of a `_Gap.item`
+        :return: string "none", "gap", "plan-gap", "static", "grid", "item", "layout", or "widget"
+        """
+        kind = cls._dispatch.get( item_type )
+        if kind is not None:
+            return kind
+        if item_type is type(None):
+            kind = "none"
+        elif issubclass(item_type, _Gap):
+            kind = "gap"
+        elif issubclass(item_type, Gap):
+            kind = "plan-gap"
+        elif issubclass(item_type, _StaticLabel):
+            kind = "static"
+        elif issubclass(item_type, Grid):
+            kind = "grid"
+        elif issubclass(item_type, QSpacerItem):
+            kind = "item"
+        elif issubclass(item_type, QLayout):
+            kind = "layout"
+        elif issubclass(item_type, QWidget):
+            kind = "widget"
+        else:
+            raise Exception("unknown cell.item type:", item_type)
+        cls._dispatch[ item_type ] = kind
+        return kind
 
-    #################
-    # Private methods
     def _set_default_label_sources(self) -> None:
         """
-        Set label sources for "default" and "default-header"
+        Set label sources for "default" and "default-header", unless set already
 
-        After calling this method at init time the user can do :
+        This method is called on first request of a default label by `get_label`, so the user can do :
 
         .. python::
             grid.add_label("default", "my text")
@@ -700,46 +1187,95 @@ class Grid(QObject):
         """
         ####################
         # Add default header
-        lbl = QLabel()
-        # margin
-        lbl.setMargin( 5 )
-        # Background color
-        palette = QPalette()
-        (r, g, b) = HEADER_BG
-        brush     = QBrush( QColor( r, g, b ) )
-        brush.setStyle( Qt.BrushStyle.SolidPattern )
-        palette.setBrush( QPalette.ColorRole.Window, brush )
-        lbl.setAutoFillBackground(True)
-        lbl.setPalette( palette )
-        # Font
-        font = QFont()
-        font.setFamily("Sans")
-        font.setBold(True)
-        font.setPointSize( 10 )
-        lbl.setFont( font )
-        #####
-        self.set_label_source( name_id="default-header", label=lbl )
+        if "default-header" not in self.label_sources:
+            lbl = QLabel()
+            # margin
+            lbl.setMargin( 5 )
+            # Background color
+            palette = QPalette()
+            (r, g, b) = HEADER_BG
+            brush     = QBrush( QColor( r, g, b ) )
+            brush.setStyle( Qt.BrushStyle.SolidPattern )
+            palette.setBrush( QPalette.ColorRole.Window, brush )
+            lbl.setAutoFillBackground(True)
+            lbl.setPalette( palette )
+            # Font
+            font = QFont()
+            font.setFamily("Sans")
+            font.setBold(True)
+            font.setPointSize( 10 )
+            lbl.setFont( font )
+            #####
+            self.set_label_source( name_id="default-header", label=lbl )
         ###################
         # Add default label
-        lbl = QLabel()
-        lbl.setIndent( 5 )
-        self.set_label_source( name_id="default", label=lbl )
+        if "default" not in self.label_sources:
+            lbl = QLabel()
+            lbl.setIndent( 5 )
+            self.set_label_source( name_id="default", label=lbl )
+
+    def _get_work_up_marks(self, max_y=0) -> list:
+        """
+        Collect the cells to be colored by a `_WorkUpOverlay` from `Grid.cells` and `Grid.spans`
+
+        | The gaps are taken from the `_Gap` objects in `Grid.cells`. In column mode "properties"
+        | there are no cells for expander and column gap columns, so their free rows are added.
+        | At last, the unused cells in content range are marked.
+
+        :param max_y: int maximum y-coordinate of user added cells
+        :return: list of tuples *(y, x, y_span, x_span, (r, g, b), text, bright)*
+        """
+        cells = self.cells
+        marks = []
+        # Gaps
+        for cell in cells.get():
+            gap = cell.item
+            if isinstance(gap, _Gap):
+                (rgb, bright) = gap.get_color()
+                marks.append( (cell.y, cell.x, cell.y_span, cell.x_span, rgb, gap.index, bright) )
+        # Expander and column gap columns without cells
+        if self._get_column_mode() == "properties":
+            columns = [ (x, "EXPAND", "") for x in (self.wh.expand_left_index, self.wh.expand_right_index)
+                        if x != -1 ]
+            for (x, width) in self.colgaps.get():
+                idx = x-1 if self.expand_left else x
+                columns.append( (x, width, str(idx)) )
+            for (x, width, text) in columns:
+                if isinstance(width, str):
+                    # expand
+                    (rgb, bright) = (BLUE, True)
+                elif width:
+                    (rgb, bright) = (YELLOW, False)
+                else:
+                    (rgb, bright) = (GREY, False)
+                for y in range( max_y + 1 ):
+                    if not cells.has_taken( y, x ):
+                        marks.append( (y, x, 1, 1, rgb, text, bright) )
+        # Unused cells
+        (left_edge, right_edge) = self.wh.content_range
+        colgaps = self.colgaps._columns
+        for y in range( max_y + 1 ):
+            for x in range( left_edge, right_edge + 1 ):
+                if x not in colgaps and not cells.has_taken( y, x ):
+                    idx = x-1 if self.expand_left else x
+                    marks.append( (y, x, 1, 1, MAGENTA, str(idx), True) )
+        return marks
 
-    def _get_remaining_x_span(self, from_x=None) -> int:
+    def _get_label_template(self, name_id=None) -> object:
         """
-        Get the number of remaining cells in row
+        Get the compiled `_LabelTemplate` for the label source *name_id*
 
-        | If *from_x* is None, the current **x** value from `_WriteHead` is taken.
-        | The return value is the range *from_x* to the end of all content columns.
-        | It is appropiate for layout *span* values counting from 1.
+        Compile it again, if it was dropped by `get_label`.
 
-        :param from_x: None (default), or int >= 0
-        :return: int >= 0
+        :param name_id: required str id for a stored label
+        :return: `_LabelTemplate` object
         """
-        (left_edge, right_edge) = self.wh.content_range
-        if from_x is None:
-            from_x = self.wh.x
-        return (1 + right_edge - from_x)
+        template = self._label_templates.get( name_id )
+        if template is None:
+            label    = self.get_label( name_id )
+            template = _LabelTemplate( label )
+            self._label_templates[ name_id ] = template
+        return template
 
     def _copy_label(self, label) -> object:
         """
@@ -748,638 +1284,938 @@ class Grid(QObject):
         .. python::
             label2 = grid._copy_label( label1 )
 
+        The copy is made by a `_LabelTemplate` object which is used once.
+
         :param label: required QLabel object
         :return: QLabel object
         """
-        lbl = QLabel()
-        lbl.setAlignment( label.alignment() )
-        lbl.setIndent( label.indent() )
-        lbl.setMargin( label.margin() )
-        lbl.setOpenExternalLinks( label.openExternalLinks() )
-        p = label.pixmap()
-        if p:
-            lbl.setPixmap( p )
-        lbl.setScaledContents( label.hasScaledContents() )
-        lbl.setTextFormat( label.textFormat() )
-        lbl.setTextInteractionFlags( label.textInteractionFlags() )
-        lbl.setWordWrap( label.wordWrap() )
-        lbl.setFont( label.font() )
-
-        lbl.setBaseSize( label.baseSize() )
-        lbl.setCursor( label.cursor() )
-        lbl.setGeometry( label.geometry() )
-        lbl.resize( label.height(), label.width() )
-        lbl.setLocale( label.locale() )
-
-        lbl.setMaximumHeight( label.maximumHeight() )
-        lbl.setMaximumWidth( label.maximumWidth() )
-        lbl.setMaximumSize( label.maximumSize() )
-
-        lbl.setMinimumHeight( label.minimumHeight() )
-        lbl.setMinimumWidth( label.minimumWidth() )
-        lbl.setMinimumSize( label.minimumSize() )
-
-        lbl.setAutoFillBackground( label.autoFillBackground() )
-        lbl.setPalette( label.palette() )
-
-        lbl.setSizePolicy( label.sizePolicy() )
-        lbl.setStyleSheet( label.styleSheet() )
-
-        lbl.setStatusTip( label.statusTip() )
-        lbl.setToolTip( label.toolTip() )
-        lbl.setToolTipDuration( label.toolTipDuration() )
-        lbl.setWhatsThis( label.whatsThis() )
-        return lbl
-
-
-class _WriteHead():
+        return _LabelTemplate( label ).create()
+
+
+class GridStats():
     """
-    The *_WriteHead* keeps track of internal indices counting in 2 dimensions
+    Counters and timings of a grid build-up from `Grid.clear` to `Grid.finish`
+
+    .. python::
+        grid = Grid( stats=True )
+        ...
+        grid.finish()
+        print( grid.stats.phases["apply"], grid.stats.gage )
 
-    - Composed to `Grid.wh` property.
-    - The *_WriteHead* property **max_x** value is determined at instantiation time.
-    - When calling the `gage` method, the write head is skiped to the next free cell,
-      which might be in the next row.
+    See `Grid.set_stats`.
     """
-    def __init__(self, grid=None) -> None:
+    def __init__(self) -> None:
+        self.phases = {}
+        """Dictionary = { "expanders": seconds, "column_gaps": .., "unused": .., "apply": .., ... } of `Grid.finish`"""
+        self.cells = 0
+        """Number of cells applied to the layout"""
+        self.gaps = 0
+        """Number of `_Gap` cells, including expander and unused cells"""
+        self.spacers = 0
+        """Number of QSpacerItem objects created for gaps"""
+        self.widgets = 0
+        """Number of QLabel objects created by `Grid.add_label` and for gaps, not taken from the pool"""
+        self.gage = 0
+        """Number of `_WriteHead.gage` calls"""
+        self.has_taken = 0
+        """Number of `_Cells.has_taken` calls"""
+        self._lap = 0.0
+        """float time of the last `lap`"""
+
+    def lap(self, phase=None) -> None:
         """
-        Example
+        Add the seconds since the last call to *phase* in `phases`
 
-        .. python::
-            grid.wh = _WriteHead()
-            grid.wh.measures()
-            grid.wh.gage()
-            if grid.wh.is_in_content_range(2) : pass
+        :param phase: None to only start, or str phase name
+        """
+        now = time.perf_counter()
+        if phase is not None:
+            self.phases[ phase ] = self.phases.get( phase, 0.0 ) + now - self._lap
+        self._lap = now
 
-        :param grid: required Grid object
+    def count(self, grid=None) -> None:
         """
-        if not isinstance(grid, Grid):
-            raise Exception("Arg 'grid' must be Grid object")
-        self.grid = grid
-        """Grid object"""
-        self.y = 0
-        """int y coordinate, init 0"""
-        self.x = 0
-        """int x coordinate, init 0"""
-        self.max_x = 0
-        """Max x-index number including far left or right expansions"""
-        self.expand_left_index  = -1
-        """Index of left expander, -1 if unset"""
-        self.expand_right_index = -1
-        """Index of right expander, -1 if unset"""
-        self.content_range = (0, 0)
-        """2-Tuple with left most and right most column indices wrapping the content"""
-
-    def measures(self) -> None:
-        """
-        Determine the current values for **expand_left_index**, **expand_right_index**,
-        **content_range**, and **max_x**
-        """
-        grid = self.grid
-        # expand_left_index
-        self.expand_left_index = 0 if grid.expand_left else -1
-        # content_range
-        left_edge  = 0
-        right_edge = 0
-        if grid.expand_left:
-            left_edge  += 1
-            right_edge += 1
-        right_edge += (grid.content_columns - 1)
-        self.content_range = (left_edge, right_edge)
-        # expand_right_index
-        if grid.expand_right:
-            self.expand_right_index = right_edge + 1
-        else:
-            self.expand_right_index = -1
-        # max_x
-        self.max_x = right_edge + 1 if grid.expand_right else right_edge
+        Count the cells, gaps, spacer items, and gap labels of *grid* after applying them
 
-    def is_in_content_range(self, i=None) -> bool:
+        :param grid: required `Grid` object
         """
-        Is a given index number within the content range ?
+        reused = { label for label in grid._reused if grid._pool_keys.get( label, ("",) )[0] == "gap" }
+        cells  = grid.cells.get()
+        self.cells = len( cells )
+        for cell in cells:
+            gap = cell.item
+            if isinstance(gap, _Gap):
+                self.gaps += 1
+                if isinstance(gap.item, QSpacerItem):
+                    self.spacers += 1
+                elif gap.item is not None and gap.item not in reused:
+                    self.widgets += 1
 
-        :param i: required int index number
-        :return: boolean
+    def as_dict(self) -> dict:
         """
-        if not isinstance(i, int):
-            raise Exception("Arg 'i' must be integer")
-        (a, b) = self.content_range
-        return True if (i >= a and i <= b) else False
-
-    def gage(self) -> None:
-        """
-        Skip to the next free cell and set the **y** and **x** properties
-
-        | Skip to next cell if the current cell is occupied, or is an expander, or gap, or part of a span.
-        | This is called recursively and sets the **y** and **x** properties.
-        """
-        grid = self.grid
-        (dummy, right_edge) = self.content_range
-        # print("wh.y, wh.x :",self.y, self.x)
-        # print("wh.max_x   :",self.max_x)
-
-        # Expand left ?
-        if self.x == self.expand_left_index:
-            self.x += 1
-            self.gage()
-        # Cell is occupied ?
-        elif grid.cells.has_taken( self.y, self.x ):
-            self.x += 1
-            self.gage()
-        # Cell is reserved for a span ?
-        elif grid.spans.has( self.y, self.x ):
-            self.x += 1
-            self.gage()
-        # Column gap ?
-        elif grid.colgaps.has_column( self.x ):
-            self.x += 1
-            self.gage()
-        # Next row ?
-        elif self.x > right_edge:
-            self.y += 1
-            self.x  = 0
-            self.gage()
-
-
-class _ColumnGaps():
-    """
-    Serve `_Gap`'s for complete columns
+        Get all counters and the phases as dictionary, e.g. for logging
+
+        :return: dict
+        """
+        return dict( phases=dict( self.phases ), cells=self.cells, gaps=self.gaps, spacers=self.spacers,
+                     widgets=self.widgets, gage=self.gage, has_taken=self.has_taken )
 
-    - Composed to `Grid.colgaps` property.
-    - The column gaps are represented as a list of 2-tuples of the form: *(column_index, width)*
 
+class _LabelTemplate():
     """
-    def __init__(self, grid=None) -> None:
+    Compiled copy source for labels created with `Grid.add_label`
+
+    | At instantiation time the properties listed in **PROPERTIES** are read once from the
+    | source label and compared to the ones of a fresh QLabel. Only the differing properties
+    | are stored as setter calls, which are applied to each label returned from `create`.
+    """
+    PROPERTIES = (
+        # (getter, setter)
+        ("alignment",            "setAlignment"),
+        ("indent",               "setIndent"),
+        ("margin",               "setMargin"),
+        ("openExternalLinks",    "setOpenExternalLinks"),
+        ("hasScaledContents",    "setScaledContents"),
+        ("textFormat",           "setTextFormat"),
+        ("textInteractionFlags", "setTextInteractionFlags"),
+        ("wordWrap",             "setWordWrap"),
+        ("font",                 "setFont"),
+        ("baseSize",             "setBaseSize"),
+        ("geometry",             "setGeometry"),
+        ("locale",               "setLocale"),
+        ("maximumSize",          "setMaximumSize"),
+        ("minimumSize",          "setMinimumSize"),
+        ("autoFillBackground",   "setAutoFillBackground"),
+        ("palette",              "setPalette"),
+        ("sizePolicy",           "setSizePolicy"),
+        ("styleSheet",           "setStyleSheet"),
+        ("statusTip",            "setStatusTip"),
+        ("toolTip",              "setToolTip"),
+        ("toolTipDuration",      "setToolTipDuration"),
+        ("whatsThis",            "setWhatsThis"),
+    )
+    """Tuple of 2-tuples *(getter, setter)* naming the QLabel methods of a copied property"""
+
+    def __init__(self, label=None) -> None:
         """
         Example
 
         .. python::
-            grid.colgaps = _ColumnGaps( grid )
+            template = _LabelTemplate( label )
+            label2   = template.create()
 
-        :param grid: required Grid object
+        :param label: required QLabel object
         """
-        if not isinstance(grid, Grid):
-            raise Exception("Arg 'grid' must be Grid object")
-        self.grid = grid
-        """Grid object"""
-        self._list_orig = []
-        """Original list of tuples defining the column gaps, as set with `set` method"""
-        self._list = []
-        """Copy of the **_list_orig** variable with altered indices depending on `Grid.expand_left`
+        if not isinstance(label, QLabel):
+            raise Exception("Arg 'label' must be QLabel object")
+        self.setters = []
+        """List of 2-tuples *(unbound QLabel setter, value)* for properties differing from a fresh QLabel"""
+        self.changed = []
+        """List of the getter names of **setters**, and "pixmap" or "cursor" if set"""
+        self.source = label
+        """QLabel object compiled"""
+        self._static_style = None
+        """None, or the `_StaticStyle` object returned from `get_static_style`"""
+        #####
+        fresh = QLabel()
+        for (getter, setter) in self.PROPERTIES:
+            value = getattr(label, getter)()
+            if value != getattr(fresh, getter)():
+                self.setters.append( (getattr(QLabel, setter), value) )
+                self.changed.append( getter )
+        # Pixmap
+        pixmap = label.pixmap()
+        if pixmap is not None and not pixmap.isNull():
+            self.setters.append( (QLabel.setPixmap, pixmap) )
+            self.changed.append("pixmap")
+        # Cursor, not comparable as a whole
+        cursor = label.cursor()
+        if ( cursor.shape() != fresh.cursor().shape()
+             or cursor.shape() == Qt.CursorShape.BitmapCursor ):
+            self.setters.append( (QLabel.setCursor, cursor) )
+            self.changed.append("cursor")
+
+    def create(self) -> object:
+        """
+        Create a new QLabel with the compiled properties applied
 
-        Its indices are altered depending on the expanding far left column.
-        The values are calculated in `measure`.
+        :return: QLabel object
         """
+        label = QLabel()
+        for (setter, value) in self.setters:
+            setter( label, value )
+        return label
 
-    def has_column(self, n=-1) -> bool:
+    def get_static_style(self) -> object:
         """
-        Does column gap exist at index *n* ?
+        Get the `_StaticStyle` of the labels painted in static mode, see `Grid.set_static`
 
-        .. python::
-            if grid.colgaps.has_column( 2 ) : pass
+        | It is created on first request, and shared by all static labels of this template.
 
-        :param n: int, default -1
-        :return:  bool
+        :return: `_StaticStyle` object
         """
-        for tpl in self._list:
-            (idx, width) = tpl
-            if idx == n:
-                return True
-        return False
+        if self._static_style is None:
+            self._static_style = _StaticStyle( self )
+        return self._static_style
 
-    def set(self, column_gaps=[]) -> None:
+
+class _StaticStyle():
+    """
+    Shared style of the labels of one label source painted in static mode, see `Grid.set_static`
+
+    | The font metrics, colors, alignment, margin, and indent are read once from the source label.
+    | Label sources with properties changed out of **PAINTABLE** are not **paintable**,
+    | so `Grid.add_label` creates a QLabel for them.
+    """
+    PAINTABLE = ("alignment", "indent", "margin", "textFormat", "font", "autoFillBackground",
+                 "palette", "sizePolicy", "locale", "geometry", "baseSize")
+    """Tuple of the `_LabelTemplate.PROPERTIES` getter names, which can be painted"""
+
+    def __init__(self, template=None) -> None:
         """
-        Set a list of *column_gaps* to private property **_list_orig**
+        Example
 
         .. python::
-            grid.colgaps.set([
-                (0, None),    # 1. column gap
-                (1, 0),       # 2.    "
-                (2, 20),      # 3.    "
-                (3, "expand") # 4.    "
-            ])
-            grid.colgaps.set()
+            style = template.get_static_style()
+            (width, height) = style.get_size("lorem ipsum")
+
+        :param template: required `_LabelTemplate` object
+        """
+        if not isinstance(template, _LabelTemplate):
+            raise Exception("Arg 'template' must be _LabelTemplate object")
+        label = template.source
+        self.paintable = all( name in self.PAINTABLE for name in template.changed )
+        """Boolean. True if the label source can be painted"""
+        self.font = label.font()
+        """QFont of the label source"""
+        self.metrics = QFontMetrics( self.font )
+        """QFontMetrics of **font**"""
+        self.color = label.palette().color( QPalette.ColorRole.WindowText )
+        """QColor of the text"""
+        self.background = label.palette().color( QPalette.ColorRole.Window ) if label.autoFillBackground() else None
+        """None, or QColor filling the cell"""
+        self.alignment = label.alignment()
+        """Qt.AlignmentFlag of the text"""
+        self.margin = label.margin()
+        """int margin on each side"""
+        self.indent = max( 0, label.indent() )
+        """int indent on the side of the alignment"""
+        self.text_format = label.textFormat()
+        """Qt.TextFormat of the text"""
+
+    def get_size(self, text="") -> tuple:
+        """
+        Get the size of a label with *text*, as the size hint of a QLabel of the label source
+
+        :param text: str text
+        :return: 2-tuple of int *(width, height)*
+        """
+        size   = self.metrics.size( 0, text )
+        align  = self.alignment
+        width  = size.width() + 2 * self.margin
+        height = size.height() + 2 * self.margin
+        if align & (Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignRight):
+            width += self.indent
+        elif align & (Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignBottom):
+            height += self.indent
+        return (width, height)
+
+    def get_position(self, rect=None, size=None) -> object:
+        """
+        Get the top left position of a text of *size* painted into the cell *rect*
+
+        :param rect: required QRect of the cell
+        :param size: required QSizeF of the text
+        :return: QPointF
+        """
+        align  = self.alignment
+        (m, i) = (self.margin, self.indent)
+        left   = rect.left() + m
+        top    = rect.top() + m
+        right  = rect.right() + 1 - m
+        bottom = rect.bottom() + 1 - m
+        # Horizontal
+        if align & Qt.AlignmentFlag.AlignRight:
+            x = right - i - size.width()
+        elif align & Qt.AlignmentFlag.AlignHCenter:
+            x = (left + right - size.width()) / 2
+        else:
+            x = left + i
+        # Vertical
+        if align & Qt.AlignmentFlag.AlignTop:
+            y = top + i
+        elif align & Qt.AlignmentFlag.AlignBottom:
+            y = bottom - i - size.height()
+        else:
+            y = (top + bottom - size.height()) / 2
+        return QPointF( x, y )
 
-        | Can only be used before any adds.
-        | Based on **_list_orig** the **_list** property is created in method `measure`.
-        | If called without arguments, properties **_list_orig** and **_list** are reset.
-        | The 2-tuples in list *column_gaps* have the form: (*column_index, width)*
 
-        - **column_index** : int 0 <= n < max number of `Grid.get_content_columns`
-        - **width** : None, or int >= 0, or string "expand"
+class _ParentProbe(QWidget):
+    """
+    Hidden widget in a layout without parent widget, calling back once the layout gets one
 
-        :param column_gaps: list of tuples, default [ ]
+    | Qt sends no event to a layout when it is set to a widget, directly or nested in another layout.
+    | But it reparents the widgets managed by the layout, so this widget receives a *ParentChange* event.
+    | Being explicitly hidden, it takes no space in the layout. It is added last at cell (0,0),
+    | so *QGridLayout.itemAtPosition* still finds the planned item there first.
+    | The callback runs from the event loop, not while Qt reparents the items of the layout.
+    """
+    def __init__(self, layout=None, callback=None) -> None:
         """
-        grid = self.grid
-        # Checks
-        if grid.wh.x != 0 or grid.wh.y != 0:
-            raise Exception("Cannot set 'column_gaps' after adding widgets")
-        if not isinstance(column_gaps, list):
-            raise Exception("'column_gaps' must be a list")
-
-        # empty ?
-        if not len(column_gaps):
-            self._list_orig = []
-            self._list      = []
-            return
+        Example
 
-        # Check each tuple
-        for tpl in column_gaps:
-            if not isinstance(tpl, tuple):
-                raise Exception("Each item in 'column_gaps' must be a tuple")
-            (column_index, gap_width) = tpl
-            # first tuple element
-            if not isinstance(column_index, int) or column_index < 0 or column_index >= grid.content_columns:
-                raise Exception("First tuple element must be int >= 0 and int < content_columns")
-            # ... within content range ?
-            val = column_index
-            if grid.expand_left:
-                val += 1
-            if not grid.wh.is_in_content_range( val ):
-                raise Exception("index in 'column_gaps' is out of range")
-            # second tuple element
-            if ( gap_width is not None
-                 and not (isinstance(gap_width, int) and gap_width >= 0)
-                 and not (isinstance(gap_width, str) and gap_width.upper() == "EXPAND") ):
-                raise Exception("Second tuple element must be None, int >= 0, or string 'expand'")
-
-        # Constrain (column_gaps < content_columns)
-        if len(column_gaps) >= grid.content_columns:
-            raise Exception("Number of 'columns_gaps' must be less than 'content_columns'")
-        # Set
-        self._list_orig = column_gaps
-        self.measure()
+        .. python::
+            self._probe = _ParentProbe( grid.layout, self.attach )
 
-    def get(self) -> list:
+        :param layout:   required QGridLayout object without parent widget
+        :param callback: required callable without arguments
         """
-        Get accessor for **_list**
-
-        The **_list** is created in method `measure`.
+        super(_ParentProbe, self).__init__()
+        self.grid_layout = layout
+        """QGridLayout object to watch"""
+        self.callback = callback
+        """Callable called once the layout has a parent widget"""
+        self.setVisible( False )
+        layout.addWidget( self, 0, 0 )
 
-        :return: list of tuples
+    def event(self, event) -> bool:
         """
-        return self._list
-
-    def measure(self) -> None:
+        Call back from the event loop, once the layout has a parent widget
         """
-        Create property **_list**.
+        if event.type() == QEvent.Type.ParentChange and self.callback is not None:
+            if self.grid_layout.parentWidget() is not None:
+                QTimer.singleShot( 0, self._call )
+        return super(_ParentProbe, self).event( event )
 
-        | If `Grid.expand_left` is true, the **_list_orig** is copied to **_list**, but with incremented x-indices.
-        | If `Grid.expand_left` is false, the **_list_orig** is simply copied to **_list**.
+    def cancel(self) -> None:
         """
-        self._list = []
-        for tpl in self._list_orig:
-            (idx, width) = tpl
-            if self.grid.expand_left:
-                idx += 1
-            self._list.append( (idx, width) )
-
-    def count(self) -> int:
+        Remove the probe from the layout and delete it, without calling back
         """
-        Return the number of column gaps
+        self.callback = None
+        self.grid_layout.removeWidget( self )
+        self.deleteLater()
 
-        :return: int length of property **_list**
+    def _call(self) -> None:
         """
-        return len(self._list)
-
-    def add_to_cells(self) -> None:
+        Remove the probe, then call back
         """
-        Add `_Cell` objects with `_Gap` objects with corresponding coordinates to `Grid.cells`
+        callback = self.callback
+        if callback is not None:
+            self.cancel()
+            callback()
 
-        | Walk through each tuple in **_list** property, create a `_Gap` object with its coordinates,
-        | and put it into a `_Cell` object and aggregate it to `Grid.cells`.
-        """
-        grid  = self.grid
-        cells = grid.cells
-        max_y = cells.get_current_max_y()
-        ###
-        for tpl in self.get():
-            (column_index, width) = tpl
-            for y in range( max_y + 1 ):
-                if not cells.has_taken( y, column_index ):
-                    idx = column_index-1 if grid.expand_left else column_index
-                    gap = _Gap( grid, "H", width, index=idx )
-                    grid.cells.add(
-                        _Cell( gap, y, column_index )
-                    )
-
-
-class _Spans():
+
+class _WorkUpOverlay(QWidget):
     """
-    Serve a list of 2-tuples (coordinates) which are parts of a span
+    Paint the work-up colors of a grid in a single widget
 
-    - Composed to `Grid.spans` property.
+    | Used by `Grid.finish` in work-up "overlay" mode, see `Grid.set_work_up`.
+    | The overlay is not part of the QGridLayout, so it does not change its geometry.
+    | Instead it becomes a child of the layouts parent widget, covers it completely, and paints
+    | each mark at the geometry of its layout cells. It ignores mouse events.
     """
-    def __init__(self, grid=None):
+    def __init__(self, grid=None, marks=[]) -> None:
         """
         Example
 
         .. python::
-            grid.spans = _Spans( grid )
+            overlay = _WorkUpOverlay( grid, grid._get_work_up_marks( max_y ) )
+            overlay.attach()
 
-        :param grid: required Grid object
+        :param grid:  required Grid object
+        :param marks: list of tuples as returned from `Grid._get_work_up_marks`
         """
         if not isinstance(grid, Grid):
             raise Exception("Arg 'grid' must be Grid object")
+        super(_WorkUpOverlay, self).__init__()
         self.grid = grid
         """Grid object"""
-        self._list = []
-        """List of 2-tuple cell coordinates (y,x) which are parts of any span"""
+        self.marks = []
+        """List of tuples *(y, x, y_span, x_span, QColor, text, bright)*"""
+        for (y, x, y_span, x_span, (r, g, b), text, bright) in marks:
+            self.marks.append( (y, x, y_span, x_span, QColor(r, g, b), text, bright) )
+        self.target = None
+        """None, or the QWidget this overlay is attached to"""
+        self.detached = False
+        """Boolean. True after `detach`, the overlay must not be used anymore"""
+        self._probe = None
+        """None, or the `_ParentProbe` waiting for a parent widget of the layout"""
+        self.setAttribute( Qt.WidgetAttribute.WA_TransparentForMouseEvents )
+
+    def attach(self) -> None:
+        """
+        Attach the overlay to the parent widget of `Grid.layout`
+
+        | Often `Grid.finish` is called before the layout is set to a widget.
+        | In that case it is attached as soon as the layout has a parent widget, see `_ParentProbe`.
+        """
+        if self.detached or self.target is not None:
+            return
+        target = self.grid.layout.parentWidget()
+        if target is None:
+            if self._probe is None:
+                self._probe = _ParentProbe( self.grid.layout, self._attach_later )
+            return
+        self.target = target
+        self.setParent( target )
+        self.setGeometry( target.rect() )
+        target.installEventFilter( self )
+        self.raise_()
+        self.show()
 
-    def has(self, y=0, x=0) -> bool:
+    def detach(self) -> None:
+        """
+        Remove the overlay from its parent widget and delete it
         """
-        Is coordinate (y,x) part of a span ?
+        self.detached = True
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        if self.target is not None:
+            self.target.removeEventFilter( self )
+            self.target = None
+        self.hide()
+        self.deleteLater()
 
-        .. python::
-            if grid.spans.has( y=1, x=2 ) : pass
-            if grid.spans.has(1, 2)       : pass
+    def _attach_later(self) -> None:
+        """
+        Attach, called by the `_ParentProbe` once the layout has a parent widget
+        """
+        self._probe = None
+        self.attach()
 
-        :param y: int y coordinate
-        :param x: int x coordinate
-        :Return:  boolean
+    def eventFilter(self, obj, event) -> bool:
+        """
+        Follow the geometry of the parent widget
         """
-        for tpl in self._list:
-            (b, a) = tpl
-            if b == y and a == x:
-                return True
+        if obj is self.target:
+            if event.type() == QEvent.Type.Resize:
+                self.setGeometry( self.target.rect() )
+            elif event.type() == QEvent.Type.LayoutRequest:
+                self.update()
         return False
 
-    def reserve(self, y=None, x=None, y_span=None, x_span=None):
-        """
-        Store 2-tuples as coordinates to property **_list**, belonging to a span
+    def paintEvent(self, event) -> None:
+        """
+        Paint all marks intersecting the exposed area
+        """
+        layout  = self.grid.layout
+        exposed = event.rect()
+        (dx, dy) = (self.x(), self.y())
+        text_color   = self.palette().color( QPalette.ColorRole.WindowText )
+        bright_color = QColor(210, 210, 210)
+        painter = QPainter( self )
+        for (y, x, y_span, x_span, color, text, bright) in self.marks:
+            rect = layout.cellRect( y, x )
+            if y_span > 1 or x_span > 1:
+                rect = rect.united( layout.cellRect( y + y_span - 1, x + x_span - 1 ) )
+            rect.translate( -dx, -dy )
+            if not rect.intersects( exposed ):
+                continue
+            painter.fillRect( rect, color )
+            if text:
+                painter.setPen( bright_color if bright else text_color )
+                painter.drawText( rect, Qt.AlignmentFlag.AlignCenter, text )
+        painter.end()
 
-        .. python::
-            grid.spans.reserve( y=0, x=1, y_span=2, x_span=2 )
-            grid.spans.reserve(0,1, y_span=2, x_span=2)
-
-        Mark cells belonging to a span by adding tuples of (y,x) coordinates to property **_list**.
-
-        :param y: int y anchor of span
-        :param x: int x anchor of span
-        :param y_span: int size to y direction
-        :param x_span: int size to x direction
-        """
-        if not isinstance(y, int):
-            raise Exception("Arg 'y' must be integer")
-        if not isinstance(x, int):
-            raise Exception("Arg 'x' must be integer")
-        if not isinstance(y_span, int):
-            raise Exception("Arg 'y_span' must be integer")
-        if not isinstance(x_span, int):
-            raise Exception("Arg 'x_span' must be integer")
-        for row_count in range( y_span ):
-            for col_count in range( x_span ):
-                self._list.append( (y + row_count, x + col_count) )
-
-
-class _Cells():
+
+class _VirtualLabel():
     """
-    Class *_Cells* aggregates `_Cell` objects in a simple list
+    Item planned by `Grid.add_label` in virtual mode, see `Grid.set_virtual`
 
-    | Composed to `Grid.cells` property.
-    | It serves methods for handling aggregated `_Cell` objects and to apply them
-    | to the resulting layout. Note that coordinates are saved within `_Cell` objects.
+    | It holds what is needed to create the label, once its row becomes visible.
+    | Objects are slotted, as there is one per label of a possibly huge grid.
     """
-    def __init__(self, grid=None) -> None:
+    __slots__ = ("name_id", "text", "label")
+
+    def __init__(self, name_id=None, text="") -> None:
         """
         Example
 
         .. python::
-            grid.cells = _Cells()
+            cell = grid.add( _VirtualLabel( "default", "lorem ipsum" ) )
 
-        :param grid: required Grid object
+        :param name_id: required str id of a label source
+        :param text:    str text of the label
         """
-        if not isinstance(grid, Grid):
-            raise Exception("Arg 'grid' must be GrindHandle object")
-        self.grid  = grid
-        """Grid object"""
-        self._list = []
-        """Aggregated list of *_Cell* objects"""
+        self.name_id = name_id
+        """str id of a label source, see `Grid.set_label_source`"""
+        self.text = text
+        """str text of the label"""
+        self.label = None
+        """None, or the QLabel while its row is materialized"""
 
-    def get(self) -> list:
+
+class _VirtualRows(QObject):
+    """
+    Materialize the cells of the rows around the visible area of a grid in virtual mode
+
+    | Used by `Grid.finish` and `Grid.clear`, see `Grid.set_virtual`.
+    | The cells keep their planned coordinates in the layout. The rows above and below the
+    | **window** are left empty in the layout, and each side is filled by a single spacer item,
+    | which is as high as the rows it stands for. Cells spanning into the window are cut to it.
+    | The window follows the visible area of the layouts parent widget, by watching its
+    | move and resize events, and the resize events of its parent, e.g. the viewport of a QScrollArea.
+    """
+    def __init__(self, grid=None, row_height=None, prefetch=20) -> None:
         """
-        Get accessor for **_list** of `_Cell` objects
+        Example
 
         .. python::
-            for cell in grid.cells.get():
-                print("y,x :", cell.y, cell.x)
+            grid._virtual = _VirtualRows( grid, row_height=None, prefetch=20 )
+            grid._virtual.attach( max_y )
 
-        :Return: self._list
+        :param grid:       required Grid object
+        :param row_height: None, or int height of a row in pixels
+        :param prefetch:   int number of rows materialized above and below the visible area
         """
-        return self._list
+        if not isinstance(grid, Grid):
+            raise Exception("Arg 'grid' must be Grid object")
+        super(_VirtualRows, self).__init__()
+        self.grid = grid
+        """Grid object"""
+        self.row_height = row_height
+        """None, or int height of a row in pixels"""
+        self.prefetch = prefetch
+        """int number of rows materialized above and below the visible area"""
+        self.pitch = 1
+        """int distance of two rows in pixels, determined by `attach`"""
+        self.max_y = -1
+        """int maximum y-coordinate of the planned cells, -1 while detached"""
+        self.window = None
+        """None, or 2-tuple *(first, last)* of the materialized rows"""
+        self._rows = {}
+        """Dictionary = { y: [ _Cell, ... ], ... } of the cells anchored in row y and spanning one row"""
+        self._tall = []
+        """List of the `_Cell` objects spanning more than one row"""
+        self._shown = {}
+        """Dictionary = { _Cell: (kind, obj, y, y_span), ... } of the cells in the layout, see `_show`"""
+        self._pool = {}
+        """Dictionary = { name_id: [ qlabel1, ... ], ... } of hidden labels for reuse"""
+        self._spacers = ( QSpacerItem( 0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed ),
+                          QSpacerItem( 0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed ) )
+        """2-tuple of QSpacerItem objects standing for the rows above and below the window"""
+        self._watched = []
+        """List of QWidget objects whose events are filtered"""
+        self._probe = None
+        """None, or the `_ParentProbe` waiting for a parent widget of the layout"""
+
+    def attach(self, max_y=0) -> None:
+        """
+        Index the planned cells by row and materialize the rows around the visible area
+
+        :param max_y: int maximum y-coordinate of user added cells
+        """
+        self._take_out()
+        rows = {}
+        tall = []
+        for cell in self.grid.cells.get():
+            if cell.y_span > 1:
+                tall.append( cell )
+            elif cell.y in rows:
+                rows[ cell.y ].append( cell )
+            else:
+                rows[ cell.y ] = [ cell ]
+            if cell.y + cell.y_span - 1 > max_y:
+                max_y = cell.y + cell.y_span - 1
+        self._rows  = rows
+        self._tall  = tall
+        self.max_y  = max_y
+        self.pitch  = self._get_pitch()
+        self._watch()
 
-    def add(self, cell=None) -> None:
+    def detach(self) -> None:
         """
-        Add (or aggregate) a `_Cell` object to the **_list**
+        Take all materialized cells and the spacer items out of the layout
 
-        .. python::
-            grid.cells.add( _Cell(...) )
-
-        :param cell: required `_Cell` object
+        | The labels of `_VirtualLabel` items are hidden and kept for reuse.
+        | The other widgets are released as by `Grid.clear`, even those out of the window.
         """
-        if not isinstance(cell, _Cell):
-            raise Exception("Arg 'cell' must be _Cell object.")
-        self._list.append( cell )
+        self._take_out()
+        if self.max_y >= 0:
+            for cell in self.grid.cells.get():
+                item = cell.item
+                if isinstance(item, _Gap):
+                    item = item.item
+                if isinstance(item, Grid):
+                    item = item.layout
+                if isinstance(item, QWidget):
+                    self.grid._release_widget( item )
+                elif isinstance(item, QLayout):
+                    self.grid._clear_layout( item )
+        self._rows  = {}
+        self._tall  = []
+        self.max_y  = -1
+        self.window = None
 
-    def get_cell(self, y=-1, x=-1) -> object:
+    def delete(self) -> None:
         """
-        Return the `_Cell` object from coordinate (y,x)
-
-        .. python::
-            cell = grid.cells.get_cell( 0,1 )
-            print("y,x :", cell.y, cell.x)
-
-        Raise exception if not found.
-
-        :param y: int >= 0
-        :param x: int >= 0
-
-        :Return: `_Cell` object
+        Detach, and delete the labels kept for reuse
         """
-        if not (isinstance(y, int) and y >= 0):
-            raise Exception("Arg 'y' must be int >= 0")
-        if not (isinstance(x, int) and x >= 0):
-            raise Exception("Arg 'x' must be int >= 0")
-        RET = None
-        for cell in self.get():
-            if cell.y == y and cell.x == x:
-                RET = cell
-                break
-        if RET is None:
-            raise Exception(f"Cannot find cell ({y},{x})")
-        return RET
+        self.detach()
+        for labels in self._pool.values():
+            for label in labels:
+                label.deleteLater()
+        self._pool = {}
 
-    def get_last(self) -> object:
+    def get_window(self) -> tuple:
         """
-        Return the last inserted `_Cell` object
+        Get the rows intersecting the visible area of the layouts parent widget, plus **prefetch** rows
 
-        .. python::
-            cell = grid.cells.get_last()
+        | While the parent widget is not visible, the window starts at the first row.
 
-        :return: `_Cell` object
+        :return: 2-tuple of int *(first, last)*
         """
-        return self.get()[-1]
+        layout = self.grid.layout
+        parent = layout.parentWidget()
+        area   = None
+        if parent is not None and parent.isVisible():
+            area = parent.visibleRegion().boundingRect()
+        if area is None or area.isEmpty():
+            (top, bottom) = (0, 0)
+        else:
+            origin = layout.contentsMargins().top()
+            top    = ( area.top() - origin ) // self.pitch
+            bottom = ( area.bottom() - origin ) // self.pitch
+        first = max( 0, top - self.prefetch )
+        last  = min( self.max_y, bottom + self.prefetch )
+        return (first, max( first, last ))
 
-    def has_taken(self, y=-1, x=-1) -> bool:
+    def update(self) -> None:
         """
-        Check if a `_Cell` object exists at coordinate (y, x)
+        Materialize the cells of the rows in the current window, and take out those of the rows leaving it
 
-        .. python::
-            if grid.cells.has_taken( 0,1 ) : pass
-
-        :param y: int
-        :param x: int
-
-        :return: bool
-        """
-        if not (isinstance(y, int) and isinstance(x, int)):
-            raise Exception("Arg 'y' and 'x' must be integers")
-        grid = self.grid
-        # Is cell (y,x) unused ?
-        for cell in self._list:
-            if cell.y == y and cell.x == x:
-                return True
-            if grid.spans.has( y, x ):
-                return True
-        ######
+        | Like `Grid.apply_plan`, the layout is disabled while changing, so it is activated only once.
+        """
+        if self.max_y < 0:
+            return
+        window = self.get_window()
+        if window == self.window:
+            return
+        self.window = window
+        (first, last) = window
+        layout = self.grid.layout
+        # Cells in window
+        wanted = {}
+        rows = self._rows
+        for y in range( first, last + 1 ):
+            for cell in rows.get( y, () ):
+                wanted[ cell ] = (y, 1)
+        for cell in self._tall:
+            y0 = max( cell.y, first )
+            y1 = min( cell.y + cell.y_span - 1, last )
+            if y0 <= y1:
+                wanted[ cell ] = (y0, y1 - y0 + 1)
+        layout.setEnabled( False )
+        try:
+            for cell in [ c for (c, shown) in self._shown.items() if wanted.get( c ) != shown[2:] ]:
+                self._hide( cell )
+            for (cell, (y, y_span)) in wanted.items():
+                if cell not in self._shown:
+                    self._show( cell, y, y_span )
+            # Spacer items for the rows out of the window
+            spacing = max( 0, layout.verticalSpacing() )
+            (top, bottom) = self._spacers
+            for spacer in self._spacers:
+                layout.removeItem( spacer )
+            if first > 0:
+                top.changeSize( 0, max( 0, first * self.pitch - spacing ),
+                                QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed )
+                layout.addItem( top, first - 1, 0 )
+            if last < self.max_y:
+                bottom.changeSize( 0, max( 0, (self.max_y - last) * self.pitch - spacing ),
+                                   QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed )
+                layout.addItem( bottom, last + 1, 0 )
+        finally:
+            layout.setEnabled( True )
+        layout.activate()
+
+    def eventFilter(self, obj, event) -> bool:
+        """
+        Follow the visible area of the layouts parent widget
+        """
+        if event.type() in (QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.Show):
+            self.update()
         return False
 
-    def get_current_max_y(self) -> int:
+    def _watch(self) -> None:
         """
-        Get the maximum y-coordinate value out of all aggregated `_Cell` objects
+        Follow the visible area of the layouts parent widget, and update the window
 
-        .. python::
-            max_y = grid.cells.get_current_max_y()
+        | Without parent widget yet, this is repeated by a `_ParentProbe` once it has one.
+        """
+        self._probe = None
+        if self.max_y < 0:
+            return
+        parent = self.grid.layout.parentWidget()
+        if parent is not None:
+            self._watched = [ parent ] if parent.parentWidget() is None else [ parent, parent.parentWidget() ]
+            for widget in self._watched:
+                widget.installEventFilter( self )
+        self.update()
+        if parent is None:
+            # Added after the materialized cells, see `_ParentProbe`
+            self._probe = _ParentProbe( self.grid.layout, self._watch )
+
+    def _take_out(self) -> None:
+        """
+        Stop following the visible area, and take the materialized cells and the spacer items out of the layout
+        """
+        for widget in self._watched:
+            widget.removeEventFilter( self )
+        self._watched = []
+        if self._probe is not None:
+            self._probe.cancel()
+            self._probe = None
+        for cell in list( self._shown ):
+            self._hide( cell )
+        for spacer in self._spacers:
+            self.grid.layout.removeItem( spacer )
+        self.window = None
+
+    def _get_pitch(self) -> int:
+        """
+        Get the distance of two rows in pixels, from **row_height** or from the first `_VirtualLabel`
+
+        :return: int >= 1
+        """
+        height = self.row_height
+        if height is None:
+            height = 1
+            for cell in self.grid.cells.get():
+                item = cell.item
+                if isinstance(item, _VirtualLabel):
+                    label = self._take( item.name_id )
+                    label.setText( item.text )
+                    height = label.sizeHint().height()
+                    self._pool[ item.name_id ].append( label )
+                    break
+        return max( 1, height + max( 0, self.grid.layout.verticalSpacing() ) )
+
+    def _take(self, name_id=None) -> object:
+        """
+        Take a hidden label of label source *name_id* for reuse, or create a new one
+
+        :param name_id: required str id of a label source
+        :return: QLabel object
+        """
+        labels = self._pool.setdefault( name_id, [] )
+        if labels:
+            return labels.pop()
+        return self.grid._get_label_template( name_id ).create()
 
-        :return: int max y
+    def _show(self, cell=None, y=0, y_span=1) -> None:
         """
-        max_y = 0
-        for cell in self._list:
-            if cell.y > max_y:
-                max_y = cell.y
-        return max_y
+        Add the item of *cell* to the layout at row *y*, spanning *y_span* rows
 
-    def apply_to_layout(self) -> None:
+        :param cell:   required `_Cell` object
+        :param y:      int y-coordinate, the cells one or the first of the window
+        :param y_span: int number of rows, cut to the window
         """
-        Add all `_Cell.item` objects to the resulting QGridLayout
+        item = cell.item
+        if isinstance(item, _VirtualLabel):
+            obj = self._take( item.name_id )
+            obj.setText( item.text )
+            item.label = obj
+            kind = "widget"
+        else:
+            get_dispatch = self.grid._get_dispatch
+            kind = get_dispatch( type(item) )
+            if kind == "gap":
+                item = item.item
+                kind = get_dispatch( type(item) )
+            elif kind == "grid":
+                item = item.layout
+                kind = "layout"
+            obj = item
+        self._shown[ cell ] = (kind, obj, y, y_span)
+        layout = self.grid.layout
+        if kind == "widget":
+            layout.addWidget( obj, y, cell.x, y_span, cell.x_span )
+            obj.show()
+        elif kind == "layout":
+            layout.addLayout( obj, y, cell.x, y_span, cell.x_span )
+            widgets = []
+            self.grid._collect_widgets( obj, widgets )
+            for widget in widgets:
+                widget.show()
+        elif kind == "item":
+            layout.addItem( obj, y, cell.x, y_span, cell.x_span )
+
+    def _hide(self, cell=None) -> None:
+        """
+        Take the item of *cell* out of the layout, see `_show`
 
-        .. python::
-            grid.cells.apply_to_layout()
+        :param cell: required `_Cell` object
         """
+        (kind, obj, y, y_span) = self._shown.pop( cell )
         layout = self.grid.layout
-        ###
-        # Methods to use:
-        #
-        # for Grid objects  : layout.addLayout( obj.layout, y,x, y_span, x_span )
-        # for QLayout objects     : layout.addLayout( obj,        y,x, y_span, x_span )
-        # for QSpacerItem objects : layout.addItem(   obj,        y,x, y_span, x_span )
-        # for QWidget objects     : layout.addWidget( obj,        y,x, y_span, x_span )
-        ###
-        for cell in self.get():
-            if cell.item is None:
-                # Cell None
-                continue
-            elif isinstance(cell.item, _Gap):
-                # Cell Gap
-                gap = cell.item
-                if gap.item is None:
-                    # -> Gap None
-                    continue
-                elif isinstance(gap.item, QSpacerItem):
-                    # -> Gap QSpacerItem
-                    layout.addItem( gap.item, cell.y, cell.x, cell.y_span, cell.x_span )
-                elif isinstance(gap.item, QLabel):
-                    # -> Gap QLabel
-                    layout.addWidget( gap.item, cell.y, cell.x, cell.y_span, cell.x_span )
-                else:
-                    raise Exception("unknown gap.item value:", gap.item)
-            elif isinstance(cell.item, Grid):
-                # Cell Grid
-                layout.addLayout( cell.item.layout, cell.y, cell.x, cell.y_span, cell.x_span )
-            elif isinstance(cell.item, QSpacerItem):
-                # Cell QSpacerItem
-                layout.addItem( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
-            elif isinstance(cell.item, QLayout):
-                # Cell QLayout
-                layout.addLayout( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
-            elif isinstance(cell.item, QWidget):
-                # Cell QWidget
-                layout.addWidget( cell.item, cell.y, cell.x, cell.y_span, cell.x_span )
-            else:
-                raise Exception("unknown cell.item value:", cell.item)
+        if kind == "widget":
+            layout.removeWidget( obj )
+            obj.hide()
+            item = cell.item
+            if isinstance(item, _VirtualLabel):
+                item.label = None
+                self._pool[ item.name_id ].append( obj )
+        elif kind == "layout":
+            layout.removeItem( obj )
+            widgets = []
+            self.grid._collect_widgets( obj, widgets )
+            for widget in widgets:
+                widget.hide()
+        elif kind == "item":
+            layout.removeItem( obj )
+
+
+class _StaticLabel():
+    """
+    Item planned by `Grid.add_label` in static mode, see `Grid.set_static`
 
+    | It takes the place of a QLabel in the layout with a QSpacerItem of the same size,
+    | and is painted by the `_StaticPainter` of the grid.
+    | QGridLayout adds no spacing after rows and columns of spacer items only,
+    | so the spacer item is larger by the layout spacing, and painted without it.
+    """
+    __slots__ = ("name_id", "text", "style", "spacer", "static", "label")
 
-class _Cell():
+    def __init__(self, name_id=None, text="", style=None, spacing=(0, 0)) -> None:
+        """
+        Example
+
+        .. python::
+            style = grid._get_label_template("default").get_static_style()
+            cell  = grid.add( _StaticLabel( "default", "lorem ipsum", style, spacing=(6, 6) ) )
+
+        :param name_id: required str id of a label source
+        :param text:    str text of the label
+        :param style:   required `_StaticStyle` object of the label source
+        :param spacing: 2-tuple of int *(horizontal, vertical)* spacing of the layout
+        """
+        self.name_id = name_id
+        """str id of a label source, see `Grid.set_label_source`"""
+        self.text = text
+        """str text of the label"""
+        self.style = style
+        """`_StaticStyle` object shared by the labels of the label source"""
+        (width, height) = style.get_size( text )
+        (h_spacing, v_spacing) = spacing
+        self.spacer = QSpacerItem( width + h_spacing, height + v_spacing,
+                                   QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum )
+        """QSpacerItem taking the place in the layout"""
+        self.static = None
+        """None, or the QStaticText of **text**, created on first paint"""
+        self.label = None
+        """None, or the QLabel created by `Grid.promote`"""
+
+
+class _StaticPainter(_WorkUpOverlay):
     """
-    *_Cell* objects are aggregated to `_Cells._list`, which itself is composed to `Grid.cells`
+    Paint the static labels of a grid in a single widget, see `Grid.set_static`
 
-    A *_Cell* has an **item** property holding an object together with coordinates and span values.
+    | Attached like `_WorkUpOverlay`, but below all other children of the layouts parent widget.
+    | If the layout has no parent widget yet, it is attached once it has one, see `_ParentProbe`.
+    | Each label is painted into the geometry of its spacer item, unless it was promoted.
+    | Only the labels of the rows intersecting the exposed area are painted, they are found by bisection.
     """
-    def __init__(self, item=None, y=None, x=None, y_span=1, x_span=1) -> None:
+    def __init__(self, grid=None, cells=[]) -> None:
         """
         Example
 
         .. python::
-            cell = _Cell( item=_Gap(...),   y=0, x=1, y_span=2, x_span=2 )
-            cell = _Cell( _Grid(...), 0,1, y_span=2, x_span=2 )
-            cell = _Cell( *QSpacerItem*,    0,1, y_span=2, x_span=2 )
-            cell = _Cell( *QLayout*, 0,1 )
-            cell = _Cell( *QWidget*, 0,1 )
-            ####
-            grid.cells.add( cell )
-
-        :param item:   None or `_Gap`, or `Grid`, or QSpacerItem, QLayout, QWidget
-        :param y:      int y coordinate
-        :param x:      int x coordinate
-        :param y_span: int y direction span
-        :param x_span: int x direction span
-        """
-        # Arguments
-        ok = False
-        if item is None:
-            ok = True
-        if isinstance(item, _Gap):
-            ok = True
-        if isinstance(item, Grid):
-            ok = True
-        if isinstance(item, QSpacerItem):
-            ok = True
-        if isinstance(item, QLayout):
-            ok = True
-        if isinstance(item, QWidget):
-            ok = True
-        if not ok:
-            msg = f"Arg 'item' ({item}) must be None or object of type _Gap, Grid, QSpacerItem, QLayout, or QWidget"
-            raise Exception( msg )
-        if not isinstance(y, int):
-            raise Exception("Arg 'y' must be integer")
-        if not isinstance(x, int):
-            raise Exception("Arg 'x' must be integer")
-        if not isinstance(y_span, int):
-            raise Exception("Arg 'y_span' must be integer")
-        if not isinstance(x_span, int):
-            raise Exception("Arg 'x_span' must be integer")
-        # Set
-        self.item = item
-        """must be None or `_Gap`, or `Grid`, or QSpacerItem, QLayout, QWidget"""
-        self.y = y
-        """int y coordinate"""
-        self.x = x
-        """int x coordinate"""
-        self.y_span = y_span
-        """int y direction span"""
-        self.x_span = x_span
-        """int x direction span"""
-
-
-class _Gap():
+            painter = _StaticPainter( grid, grid._static_cells )
+            painter.attach()
+
+        :param grid:  required Grid object
+        :param cells: list of `_Cell` objects holding a `_StaticLabel`, in order of insertion
+        """
+        super(_StaticPainter, self).__init__( grid )
+        self.cells = cells
+        """List of `_Cell` objects holding a `_StaticLabel`, with non-decreasing y-coordinates"""
+        self.max_y_span = max( cell.y_span for cell in cells ) if cells else 1
+        """int maximum y span of **cells**"""
+        layout = grid.layout
+        self.spacing = ( max( 0, layout.horizontalSpacing() ), max( 0, layout.verticalSpacing() ) )
+        """2-tuple of int *(horizontal, vertical)* layout spacing included in the spacer items"""
+
+    def attach(self) -> None:
+        """
+        Attach the painter below all other children of the parent widget of `Grid.layout`
+
+        | Also called back by the `_ParentProbe`, if the layout has no parent widget yet.
+        """
+        _WorkUpOverlay.attach( self )
+        if self.target is not None:
+            self.lower()
+
+    def paintEvent(self, event) -> None:
+        """
+        Paint all labels intersecting the exposed area
+        """
+        layout  = self.grid.layout
+        exposed = event.rect()
+        cells   = self.cells
+        (dx, dy) = (self.x(), self.y())
+        # First cell whose row reaches into the exposed area
+        top = exposed.top() + dy
+        (lo, hi) = (0, len( cells ))
+        while lo < hi:
+            mid = (lo + hi) // 2
+            cell = cells[ mid ]
+            if layout.cellRect( cell.y, cell.x ).bottom() < top:
+                lo = mid + 1
+            else:
+                hi = mid
+        # Step back to labels spanning into it
+        if lo < len( cells ) and self.max_y_span > 1:
+            first_y = cells[ lo ].y - self.max_y_span + 1
+            hi = lo
+            lo = 0
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if cells[ mid ].y < first_y:
+                    lo = mid + 1
+                else:
+                    hi = mid
+        bottom  = exposed.bottom() + dy
+        (h_spacing, v_spacing) = self.spacing
+        painter = QPainter( self )
+        style   = None
+        for i in range( lo, len( cells ) ):
+            cell = cells[ i ]
+            item = cell.item
+            rect = item.spacer.geometry()
+            if rect.top() > bottom:
+                break
+            if item.label is not None:
+                continue
+            rect.adjust( -dx, -dy, -dx - h_spacing, -dy - v_spacing )
+            if not rect.intersects( exposed ):
+                continue
+            if item.style is not style:
+                style = item.style
+                painter.setFont( style.font )
+                painter.setPen( style.color )
+            if style.background is not None:
+                painter.fillRect( rect, style.background )
+            static = item.static
+            if static is None:
+                static = QStaticText( item.text )
+                static.setTextFormat( style.text_format )
+                item.static = static
+            painter.drawStaticText( style.get_position( rect, static.size() ), static )
+        painter.end()
+
+
+class _Gap(Gap):
     """
-    A gap within the layout has a **direction** and a **length**. Objects are hold in `_Cell.item` properties
+    A `qtgrid.planner.Gap` which also creates the Qt object representing it
 
-    - Coordinates of a *_Gap* are not saved in this class, but in
-      class *_Cell* as `_Cell.y` and `_Cell.x` properties.
-    - It may display a column index number with a label.
+    - The object is created at init time, see `_gap_item`.
+    - Gaps rendering as nothing are plain slotted objects with **item** None.
     """
+    __slots__ = ("item", "label")
+
     def __init__(self, grid=None, direction=None, length=None, index=-1):
         """
         Examples
@@ -1387,120 +2223,20 @@ class _Gap():
         .. python::
             cell = _Cell( _Gap(...), y=0, x=1, y_span=2, x_span=2 )
 
-            # horizontal direction
             _Gap(grid)                                 # H, explicit empty
-            _Gap(grid, direction="H", length=None)     # H, explicit empty
-            _Gap(grid, direction="H", length=0)        # H, explicit empty
-            _Gap(grid, direction="H", length=20)       # H, sized (yellow)
-            _Gap(grid, direction="H", length="expand") # H, expand (blue)
-            _Gap(grid, direction="H", length="unused") # H, unused (magenta)
-
-            # horizontal direction is default
-            _Gap(grid, length=None)     # H, explicit empty
-            _Gap(grid, length=0)        # H, explicit empty
-            _Gap(grid, length=20)       # H, sized (yellow)
-            _Gap(grid, length="expand") # H, expand (blue)
-            _Gap(grid, length="unused") # H, unused (magenta)
-
-            # vertical direction
-            _Gap(grid, direction="V", length=None)     # V, explicit empty
-            _Gap(grid, direction="V", length=0)        # V, explicit empty
             _Gap(grid, direction="V", length=20)       # V, sized (yellow)
-            _Gap(grid, direction="V", length="expand") # V, expand (blue)
-            _Gap(grid, direction="V", length="unused") # V, unused (magenta)
-
-            # If given, the index argument is displayed
+            _Gap(grid, direction="H", length="expand") # H, expand (blue)
             _Gap(grid, length=20, index=0)
-            _Gap(grid, index=20)
-
-        :parameters:
-            grid : object
-                Grid
-            direction : None or str
-                "H", "V", "horizontal", "vertical"
-            length : None, int, or str
-                - If length == "expand", then add expander.
-                - If length == None or 0, then leave the cell empty (also add coordinates to `_Spans`).
-                - If length >= 1, then add fixed size spacer.
-            index : int
-                If given, it will be displayed as a label
 
+        See `qtgrid.planner.Gap` for the arguments.
         """
         if not isinstance(grid, Grid):
             raise Exception("Arg 'grid' must be Grid object")
-        self.grid = grid
-        """Grid object"""
-        self.is_expander = False
-        """Do this *gap* expand ?
-
-        .. python::
-            if self.is_expander : pass
-        """
-        self.is_empty    = True
-        """Is this *gap* explicitly empty (gap.item == None) ?
-
-        .. python::
-            if self.is_empty : pass
-        """
-        self.item        = None
-        """Object as returned from `_gap_item` method : *None*, *QLabel* or *QSpacerItem*"""
+        Gap.__init__( self, grid, direction, length, index )
         self.label       = None
         """If instance argument **index** is given, display a label with its number"""
-        self.direction   = direction
-        """Expanding or size direction 'H', 'V', 'vertical', or 'horizontal'"""
-        self.length      = length
-        """Length or size of this *gap*. Can be None, "expand", or int"""
-        self.index       = index
-        """If integer is given, it will be displayed as a label"""
-
-        # Arg 'direction', None, H, HORIZONTAL, V, VERTICAL
-        err = "Arg 'direction' must be (H|horizontal|V|vertical)"
-        if direction is None:
-            direction = "H"
-            length    = 0
-        if ( not isinstance(direction, str)
-             or direction.upper() not in ["H", "HORIZONTAL", "V", "VERTICAL"] ):
-            raise Exception( err )
-        self.direction = "H" if direction.upper() in ["H", "HORIZONTAL"] else "V"
-
-        # Arg 'length', None, int >= 0, "EXPAND", "UNUSED"
-        err = "Arg 'length' must be None, integer >= 0, or string 'expand', or string 'unused'"
-        ok  = False
-        if length is None:
-            length = 0
-            self.is_empty = True
-            ok = True
-        if isinstance(length, int):
-            if length < 0:
-                raise Exception( err )
-            if length == 0:
-                self.is_empty = True
-            ok = True
-        if isinstance(length, str):
-            length = length.upper()
-            if not (length == "EXPAND" or length == "UNUSED"):
-                raise Exception( err )
-            if length == "EXPAND":
-                self.is_expander = True
-            ok = True
-        if not ok:
-            raise Exception( err )
-        self.length = length
-
-        # Arg 'index', integer
-        if index is not None and not isinstance(index, int):
-            raise Exception("Arg 'index' must be None or integer")
-        if index is None:
-            self.index = ""
-        elif index == -1:
-            x = self.grid.wh.x
-            x = x-1 if self.grid.expand_left else x
-            self.index = str(x)
-        else:
-            self.index = str( index )
-
-        # Item
-        self.item = self._gap_item()
+        self.item        = self._gap_item()
+        """Object as returned from `_gap_item` method : *None*, *QLabel* or *QSpacerItem*"""
 
     def _gap_item(self) -> QObject:
         """
@@ -1511,59 +2247,32 @@ class _Gap():
 
         | Visualize expander or gaps with a colored QLabel or a QSpacerItem
         | with the corresponding expansion, behaviour, or size.
+        | Qt objects are only created for the returned item. Gaps which render as nothing,
+        | i.e. unused and explicit empty cells outside work-up mode, do not touch Qt at all.
 
         :return: None, QLabel, QSpacerItem
         """
-        # Label
-        label = QLabel()
-        label.setAutoFillBackground( True )
-        label.setAlignment( Qt.AlignmentFlag.AlignCenter )
-        # Label text
-        if self.grid.work_up:
-            label.setText( self.index )
-        else:
-            label.setText("")
-        # Label palette
-        palette = QPalette()
-        # Label background color
-        (r, g, b) = (0, 0, 0)
-        # Label Size policy
-        sizePolicy = None
-        # Label margin
-        margin = 1
+        work_up = self.grid.work_up
 
         if isinstance(self.length, str) and self.length == "UNUSED":
             # Unused cell
             # ===========
-            if self.grid.work_up:
-                # Label size policy
-                sizePolicy = QSizePolicy( QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum )  # W,H
-                # Label margin
-                label.setMargin( margin )
-                # Label background color
-                (r, g, b) = MAGENTA
-                # Label text color more bright
-                # (apply brush to palette)
-                q_color = QColor(210, 210, 210)
-                brush   = QBrush( q_color )
-                brush.setStyle( Qt.BrushStyle.SolidPattern )
-                palette.setBrush( QPalette.ColorRole.WindowText, brush )
-            else:
+            if not work_up:
                 return None
+            return self._gap_label(
+                policy = (QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum),  # W,H
+                margin = True,
+            )
 
         elif self.length == 0:
             # Explicit empty cell
             # ===================
-            # Label size policy
-            if self.grid.work_up:
-                # Label size policy
-                sizePolicy = QSizePolicy( QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum )  # W,H
-                # Label margin
-                label.setMargin( margin )
-                # Label background color
-                (r, g, b) = GREY
-            else:
+            if not work_up:
                 return None
+            return self._gap_label(
+                policy = (QSizePolicy.Policy.Maximum, QSizePolicy.Policy.Maximum),  # W,H
+                margin = True,
+            )
 
         elif self.is_expander:
             # Expander
@@ -1571,72 +2280,122 @@ class _Gap():
             if self.direction == "H":
                 # Horizontal expander
                 # -------------------
-                if self.grid.work_up:
-                    # Label size policy
-                    sizePolicy = QSizePolicy( QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum )  # W,H
-                    # Label background color
-                    (r, g, b) = BLUE
-                    # Label text color more bright
-                    # (apply brush to palette)
-                    q_color = QColor(210, 210, 210)
-                    brush   = QBrush( q_color )
-                    brush.setStyle( Qt.BrushStyle.SolidPattern )
-                    palette.setBrush( QPalette.ColorRole.WindowText, brush )
-                else:
+                if not work_up:
                     # Return QSpacerItem
                     (width, height) = (1, 1)
                     v_size = QSizePolicy.Policy.Minimum
                     h_size = QSizePolicy.Policy.Expanding
                     return QSpacerItem( width, height, h_size, v_size )
+                return self._gap_label(
+                    policy = (QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Minimum),  # W,H
+                )
             else:
                 # Vertical expander
                 # -----------------
-                if self.grid.work_up:
-                    # Label size policy
-                    sizePolicy = QSizePolicy( QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding )  # W,H
-                    # Label background color
-                    (r, g, b) = CYAN
-                else:
+                if not work_up:
                     # Return QSpacerItem
                     (width, height) = (1, 1)
                     v_size = QSizePolicy.Policy.Expanding
                     h_size = QSizePolicy.Policy.Minimum
                     return QSpacerItem( width, height, h_size, v_size )
+                return self._gap_label(
+                    policy = (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding),  # W,H
+                )
         else:
             # Fixed sized gaps
             # ================
             if self.direction == "H":
                 # Horizontal gap
                 # --------------
-                # Label size policy
-                sizePolicy = QSizePolicy( QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum )  # W,H
-                # Label margin
-                label.setMargin( margin )
-                # Label background color
-                (r, g, b) = YELLOW
-                # Label fixed width
-                label.setFixedWidth( self.length )
+                return self._gap_label(
+                    policy = (QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Minimum),  # W,H
+                    margin = True,
+                    width  = self.length,
+                )
             else:
                 # Vertical gap
                 # ------------
-                # Label size policy
-                sizePolicy = QSizePolicy( QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed )  # W,H
-                # Label margin
-                label.setMargin( margin )
-                # Label background color
-                (r, g, b) = ORANGE
-                # Label fixed height
-                label.setFixedHeight( self.length )
-
-        # Apply brush (label background) to palette
-        if self.grid.work_up:
-            q_color = QColor( r, g, b )
-            brush   = QBrush( q_color )
+                return self._gap_label(
+                    policy = (QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed),  # W,H
+                    margin = True,
+                    height = self.length,
+                )
+
+    def get_color(self) -> tuple:
+        """
+        Get the work-up color of this gap
+
+        .. python::
+            ((r, g, b), bright) = gap.get_color()
+
+        See the `Grid.set_work_up` method for the meaning of the colors.
+
+        :return: 2-tuple of RGB-tuple and boolean, True if the text color is bright
+        """
+        if isinstance(self.length, str) and self.length == "UNUSED":
+            return (MAGENTA, True)
+        elif self.length == 0:
+            return (GREY, False)
+        elif self.is_expander:
+            return (BLUE, True) if self.direction == "H" else (CYAN, False)
+        else:
+            return (YELLOW, False) if self.direction == "H" else (ORANGE, False)
+
+    def _gap_label(self, policy=None, margin=False, width=None, height=None) -> QObject:
+        """
+        Create the QLabel representing this gap
+
+        In work-up mode the label is colored as returned from `get_color`.
+
+        :param policy: required 2-tuple of QSizePolicy.Policy values (W,H)
+        :param margin: boolean, if True set a margin of 1, default False
+        :param width:  None, or int fixed width
+        :param height: None, or int fixed height
+
+        :return: QLabel
+        """
+        grid    = self.grid
+        work_up = grid.work_up
+        # Recycled label
+        if grid.recycle:
+            key   = ("gap", self.direction, self.length, self.index, work_up)
+            label = grid._pool_take( key )
+            if label is not None:
+                return label
+        # Label
+        label = QLabel()
+        label.setAutoFillBackground( True )
+        label.setAlignment( Qt.AlignmentFlag.AlignCenter )
+        # Label text
+        if work_up:
+            label.setText( self.index )
+        # Label margin
+        if margin:
+            label.setMargin( 1 )
+        # Label fixed size
+        if width is not None:
+            label.setFixedWidth( width )
+        if height is not None:
+            label.setFixedHeight( height )
+        # Apply brushes (label background and text color) to palette
+        if work_up:
+            (color, bright) = self.get_color()
+            palette = QPalette()
+            if bright:
+                brush = QBrush( QColor(210, 210, 210) )
+                brush.setStyle( Qt.BrushStyle.SolidPattern )
+                palette.setBrush( QPalette.ColorRole.WindowText, brush )
+            (r, g, b) = color
+            brush = QBrush( QColor( r, g, b ) )
             brush.setStyle( Qt.BrushStyle.SolidPattern )
             palette.setBrush( QPalette.ColorRole.Window, brush )
             label.setPalette( palette )
-
-        # Return label
-        label.setSizePolicy( sizePolicy )
+        # Label size policy
+        (h_size, v_size) = policy
+        label.setSizePolicy( QSizePolicy( h_size, v_size ) )
+        if grid.recycle:
+            grid._pool_keys[ label ] = key
         return label
 
+
+Grid._item_types = (_VirtualLabel, _StaticLabel, Grid, QSpacerItem, QLayout, QWidget)
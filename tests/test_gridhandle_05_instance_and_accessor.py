@@ -28,7 +28,12 @@ def test_grid_defaults(grid):
     assert grid.expand_left  is False
     assert grid.expand_right is False
     assert grid.work_up      is False
-    # Default labels has been set at init time with "_set_default_label_sources"
+    assert grid.recycle    is False
+    assert grid.production is False
+    assert grid.stats      is None
+    # Default labels are set on first request with "_set_default_label_sources"
+    assert "default" not in grid.label_sources
+    assert isinstance(grid.get_label("default-header"), QLabel)
     assert True if "default"        in grid.label_sources else False
     assert True if "default-header" in grid.label_sources else False
     assert isinstance(grid.label_sources[ "default" ], QLabel)
@@ -176,3 +181,19 @@ def test_setget_label(grid, some_label):
     label = grid.get_label("test_label")
     assert isinstance(label, QLabel)
 
+
+def test_set_production(grid):
+    # The reminder label is removed
+    assert grid.layout.count() == 1
+    grid.set_production( True )
+    assert grid.layout.count() == 0
+    # ... and not added again
+    grid.add_label("default", "a")
+    grid.clear()
+    assert grid.layout.count() == 0
+    # Missing finish
+    grid.add_label("default", "a")
+    with pytest.warns(RuntimeWarning):
+        grid._check_finished()
+    grid.finish()
+    grid._check_finished()
@@ -45,3 +45,155 @@ def test__copy_label(grid, some_label):
     label = grid._copy_label( some_label )
     assert isinstance(label, QLabel)
     assert label.indent() == 7
+
+
+def test__cells_index(grid, some_label):
+    grid.set_content_columns( 3 )
+    cell = grid.add( some_label, y_span=2, x_span=2 )
+    # The anchor and all spanned coordinates are taken
+    for (y, x) in [ (0, 0), (0, 1), (1, 0), (1, 1) ]:
+        assert grid.cells.has_taken( y, x )
+        assert grid.spans.has( y, x )
+    assert not grid.cells.has_taken( 0, 2 )
+    assert not grid.spans.has( 0, 2 )
+    # Only the anchor coordinate refers to the cell
+    assert grid.cells.get_cell( 0, 0 ) is cell
+    with pytest.raises(Exception):
+        grid.cells.get_cell( 1, 1 )
+    # The span is stored once, and found for each of its coordinates
+    assert grid.spans._list == [ (0, 0, 2, 2) ]
+    assert grid.spans.get( 1, 1 ) == (0, 0, 2, 2)
+    assert grid.spans.get( 0, 2 ) is None
+    # The covering cell is found from each coordinate of its span
+    assert grid.cells.get_covering( 1, 1 ) is cell
+    assert grid.cells.get_covering( 0, 2 ) is None
+    # Max y is tracked while adding
+    grid.add_label("default", "foo")    # (0,2)
+    grid.add_label("default", "bar")    # (1,2)
+    assert grid.cells.get_current_max_y() == 1
+    grid.add_label("default", "baz")    # (2,0)
+    assert grid.cells.get_current_max_y() == 2
+
+
+def test__gage_long_runs(grid, some_label):
+    # Skipping many cells must not hit the recursion limit
+    import sys
+    n = sys.getrecursionlimit() + 100
+    grid.set_content_columns( n + 1 )
+    grid.add( some_label, y_span=2, x_span=n )
+    grid.add_label("default", "foo")
+    assert (grid.wh.y, grid.wh.x) == (0, n)
+    # Row 1 is reserved up to column n-1
+    grid.add_label("default", "bar")
+    assert (grid.wh.y, grid.wh.x) == (1, n)
+
+
+def test__gage_uniform(grid, some_label):
+    grid.set_content_columns( 3 )
+    grid.set_expand_left( True )
+    # Plain 1x1 cells are positioned arithmetically
+    for i in range( 7 ):
+        cell = grid.add_label("default", str(i))
+        assert (cell.y, cell.x) == (i // 3, 1 + i % 3)
+    assert grid.wh.uniform
+    # The first span falls back to the general path
+    grid.add( some_label, y_span=2 )    # (2,2)
+    assert not grid.wh.uniform
+    cell = grid.add_label("default", "foo")
+    assert (cell.y, cell.x) == (2, 3)
+    cell = grid.add_label("default", "bar")
+    assert (cell.y, cell.x) == (3, 1)
+    cell = grid.add_label("default", "baz")
+    assert (cell.y, cell.x) == (3, 3)
+    # Reset by clear
+    grid.clear()
+    assert grid.wh.uniform
+
+
+def test__gage_uniform_column_gaps(grid):
+    grid.set_content_columns( 3 )
+    grid.set_column_gaps([ (1, 20) ])
+    cells = [ grid.add_label("default", str(i)) for i in range( 4 ) ]
+    assert [ (c.y, c.x) for c in cells ] == [ (0, 0), (0, 2), (1, 0), (1, 2) ]
+
+
+def test__label_template(grid, some_label):
+    from qtgrid.qtgrid import _LabelTemplate
+    # Only differing properties are compiled
+    template = _LabelTemplate( QLabel() )
+    assert template.setters == []
+    some_label.setIndent( 7 )
+    some_label.setToolTip("tip")
+    template = _LabelTemplate( some_label )
+    assert len( template.setters ) == 2
+    label = template.create()
+    assert label.indent() == 7
+    assert label.toolTip() == "tip"
+    assert label.text() == ""
+    # Compiled when set as label source, compiled again after get_label
+    grid.set_label_source("test_label", some_label)
+    assert "test_label" in grid._label_templates
+    grid.get_label("test_label").setIndent( 9 )
+    assert "test_label" not in grid._label_templates
+    cell = grid.add_label("test_label", "foo")
+    assert cell.item.indent() == 9
+    assert cell.item.text() == "foo"
+
+
+def test__gap_item(grid):
+    from qtgrid.qtgrid import _Gap
+    if importlib.util.find_spec("PyQt6") is not None:
+        from PyQt6.QtWidgets import QSpacerItem
+    elif importlib.util.find_spec("PyQt5") is not None:
+        from PyQt5.QtWidgets import QSpacerItem
+    else:
+        from PySide6.QtWidgets import QSpacerItem
+    # Without work-up, empty and unused gaps render as nothing
+    assert _Gap( grid ).item is None
+    assert _Gap( grid, "V", None ).item is None
+    assert _Gap( grid, "H", "unused" ).item is None
+    assert isinstance( _Gap( grid, "H", "expand" ).item, QSpacerItem )
+    assert isinstance( _Gap( grid, "V", "expand" ).item, QSpacerItem )
+    label = _Gap( grid, "H", 20 ).item
+    assert isinstance( label, QLabel )
+    assert label.width() == 20
+    assert label.text() == ""
+    # Work-up mode
+    grid.set_work_up( True )
+    assert isinstance( _Gap( grid ).item, QLabel )
+    assert isinstance( _Gap( grid, "H", "unused", index=3 ).item, QLabel )
+    assert _Gap( grid, "H", "unused", index=3 ).item.text() == "3"
+    assert isinstance( _Gap( grid, "V", "expand" ).item, QLabel )
+
+
+def test__spans_overlap(grid, some_label):
+    grid.set_content_columns( 4 )
+    grid.add( QLabel("a") )                         # (0,0)
+    grid.add( QLabel("b"), y_span=3 )               # (0,1)
+    grid.add( QLabel("c"), y_span=2, x_span=2 )     # (0,2)
+    # Spans are sorted by x within each row
+    assert grid.spans._starts[ 1 ] == [ 1, 2 ]
+    assert grid.spans._starts[ 2 ] == [ 1 ]
+    assert grid.spans.get_next_x( 1, 0 ) == 1
+    assert grid.spans.get_next_x( 1, 2 ) is None
+    # "all" stops at the span reaching into the row from above
+    cell = grid.add( some_label, x_span="all" )     # (1,0)
+    assert (cell.y, cell.x, cell.x_span) == (1, 0, 1)
+    # Overlapping spans are rejected
+    assert grid.spans.get_overlap( 1, 0, 1, 2 ) == (0, 1, 3, 1)
+    assert grid.spans.get_overlap( 3, 0, 2, 4 ) is None
+    with pytest.raises(Exception):
+        grid.spans.reserve( 2, 0, 1, 2 )
+    with pytest.raises(Exception):
+        grid.spans.reserve( 1, 3, 1, 1 )
+    grid.spans.reserve( 2, 2, 1, 2 )
+    assert grid.spans.get( 2, 3 ) == (2, 2, 1, 2)
+    # A rejected span leaves no cell behind
+    grid.spans.reserve( 3, 0, 1, 1 )
+    count = len( grid.cells.get() )
+    with pytest.raises(Exception):
+        grid.add( QLabel("d"), y_span=2 )           # (2,0)
+    assert len( grid.cells.get() ) == count
+    assert not grid.cells.has_taken( 2, 0 )
+    cell = grid.add( QLabel("d") )
+    assert (cell.y, cell.x) == (2, 0)
@@ -1,18 +1,19 @@
 import pytest
-from qtgrid.qtgrid import _Cell, _Gap, REMIND_TO_FINISH, GREY, BLUE, CYAN, YELLOW, ORANGE, MAGENTA
+from qtgrid import Grid
+from qtgrid.qtgrid import _Cell, _Gap, _WorkUpOverlay, REMIND_TO_FINISH, GREY, BLUE, CYAN, YELLOW, ORANGE, MAGENTA
 
 ############################
 # Check Qt package to import
 import importlib
 
 if importlib.util.find_spec("PyQt6") is not None:
-    from PyQt6.QtWidgets import QLabel
+    from PyQt6.QtWidgets import QApplication, QLabel, QWidget, QStyle
     from PyQt6.QtGui     import QPalette, QColor
 elif importlib.util.find_spec("PyQt5") is not None:
-    from PyQt5.QtWidgets import QLabel
+    from PyQt5.QtWidgets import QApplication, QLabel, QWidget, QStyle
     from PyQt5.QtGui     import QPalette, QColor
 elif importlib.util.find_spec("PySide6") is not None:
-    from PySide6.QtWidgets import QLabel
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget, QStyle
     from PySide6.QtGui     import QPalette, QColor
 else:
     raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
@@ -101,6 +102,25 @@ def test_add_label(grid, some_label):
     assert grid.wh.y == 1
     assert grid.wh.x == 3
 
+
+def test_add_gap_all():
+    # "all" is measured at the calibrated position, as for add
+    for mode in ("cells", "span"):
+        grid = Grid( content_columns=3, expand_right=True, column_mode=mode )
+        grid.add( QLabel("a") )
+        cell = grid.add_gap( x_span="all" )
+        assert (cell.y, cell.x, cell.x_span) == (0, 1, 2)
+        cell = grid.add( QLabel("b") )
+        assert (cell.y, cell.x) == (1, 0)
+        grid.finish()
+        # A full row leaves a gap for the next row
+        grid.clear()
+        for text in ("a", "b", "c"):
+            grid.add( QLabel( text ) )
+        cell = grid.add_gap( x_span="all" )
+        assert (cell.y, cell.x, cell.x_span) == (1, 0, 3)
+        grid.finish()
+
 def test_add_gap(grid):
     # Preapre
     grid.set_content_columns( 5 )
@@ -496,3 +516,279 @@ def test_finish(grid):
     assert qblue    == grid.layout.itemAtPosition(4, 8).widget().palette().color( QPalette.ColorRole.Window )
 
 
+def test_add_many(grid):
+    # Preapre
+    grid.set_list_names( ["test_list"] )
+    grid.set_content_columns( 3 )
+
+    labels = [ QLabel(str(i)) for i in range(4) ]
+    cells  = grid.add_many([
+        labels[0],              # (0,0)
+        (labels[1], 2, 1),      # (0,1) 2 rows
+        labels[2],              # (0,2)
+        (labels[3], 1, "all"),  # (1,0) spans to (1,0), stops at reserved (1,1)
+    ], to_list="test_list")
+    # Cells are yielded in order of insertion
+    cells = list( cells )
+    assert [ c.item for c in cells ] == labels
+    assert [ (c.y, c.x) for c in cells ] == [ (0, 0), (0, 1), (0, 2), (1, 0) ]
+    assert cells[1].y_span == 2
+    assert cells[3].x_span == 1
+    assert grid.get_list("test_list") == labels
+
+    # Arguments are checked
+    with pytest.raises(Exception):
+        grid.add_many([ QLabel() ], to_list="unknown")
+    with pytest.raises(Exception):
+        grid.add_many([ (QLabel(), 0, 1) ])
+    with pytest.raises(Exception):
+        grid.add_many([ None ])
+    with pytest.raises(Exception, match="3-tuples"):
+        grid.add_many([ (QLabel(), 2) ])
+
+
+def test_add_many_failed():
+    grid = Grid( content_columns=1, expand_right=True )
+    with pytest.raises(Exception):
+        grid.add_many([ QLabel("a"), QLabel("b"), QLabel("c"), (QLabel("d"), 2) ])
+    # The cells placed before stay, and are finished
+    assert len( grid.cells.get() ) == 3
+    assert grid.cells.get_current_max_y() == 2
+    grid.finish()
+    assert grid.layout.itemAtPosition( 2, 1 ) is not None
+
+
+def test_add_rows(grid):
+    # Preapre
+    grid.set_content_columns( 3 )
+
+    cells = list( grid.add_rows([
+        [ QLabel("a"), QLabel("b") ],           # row 0, one unused cell
+        [],                                     # skipped
+        [ QLabel("c"), QLabel("d"), QLabel("e") ],
+        [ QLabel("f") ],
+    ]) )
+    assert [ (c.y, c.x) for c in cells ] == [ (0, 0), (0, 1), (1, 0), (1, 1), (1, 2), (2, 0) ]
+    assert [ c.item.text() for c in cells ] == [ "a", "b", "c", "d", "e", "f" ]
+    # The next widget starts in a new row
+    cell = grid.add_label("default", "g")
+    assert (cell.y, cell.x) == (3, 0)
+
+
+def test_finish_column_mode_span(grid):
+    def build(grid, mode):
+        grid.clear()
+        grid.set_content_columns( 3 )
+        grid.set_expand_left( True )
+        grid.set_expand_right( True )
+        grid.set_column_gaps([ (1, 20) ])
+        grid.set_column_mode( mode )
+        for y in range( 10 ):
+            if y == 4:
+                # Spans over the column gap
+                grid.add_label("default", "span", x_span="all")
+            else:
+                grid.add_label("default", "a")
+                grid.add_label("default", "b")
+        grid.finish()
+        return grid.layout.count()
+
+    count_cells = build( grid, "cells" )
+    count_span  = build( grid, "span" )
+    # 10 rows with 2 expanders each and 9 column gaps become 2 expanders and 2 column gaps
+    assert count_cells - count_span == (20 + 9) - (2 + 2)
+    # Each row of a column refers to the same item
+    layout = grid.layout
+    for x in (0, 4):
+        item = layout.itemAtPosition(0, x)
+        assert item.spacerItem() is not None
+        assert all( layout.itemAtPosition(y, x) is item for y in range(10) )
+    # Column gap, interrupted by the spanning label in row 4
+    above = layout.itemAtPosition(0, 2)
+    below = layout.itemAtPosition(5, 2)
+    assert above.widget().width() == 20
+    assert all( layout.itemAtPosition(y, 2) is above for y in range(4) )
+    assert all( layout.itemAtPosition(y, 2) is below for y in range(5, 10) )
+    assert layout.itemAtPosition(4, 2).widget().text() == "span"
+
+    with pytest.raises(Exception):
+        grid.set_column_mode("foo")
+
+
+def test_finish_column_mode_properties(grid):
+    grid.set_content_columns( 4 )
+    grid.set_expand_left( True )
+    grid.set_expand_right( True )
+    grid.set_column_gaps([ (1, 20), (2, "expand") ])
+    grid.set_column_mode("properties")
+    for y in range( 5 ):
+        grid.add_label("default", "a")
+        grid.add_label("default", "b")
+    grid.finish()
+
+    layout = grid.layout
+    # Only the labels are items
+    assert layout.count() == 10
+    for x in (0, 2, 3, 5):
+        assert all( layout.itemAtPosition(y, x) is None for y in range(5) )
+    # Column properties
+    assert layout.columnStretch(0) == 1
+    assert layout.columnStretch(5) == 1
+    # Plus the spacing, which Qt leaves out after a column without items
+    spacing = QApplication.style().pixelMetric( QStyle.PixelMetric.PM_LayoutHorizontalSpacing )
+    assert layout.columnMinimumWidth(2) == 20 + spacing
+    assert layout.columnStretch(3) == 1
+    assert layout.columnStretch(1) == 0
+    # Reset by clear
+    grid.clear()
+    assert all( layout.columnStretch(x) == 0 for x in range(6) )
+    assert layout.columnMinimumWidth(2) == 0
+
+    # Colored cells in work-up mode
+    grid.set_work_up( True )
+    grid.add_label("default", "a")
+    grid.finish()
+    assert layout.columnStretch(0) == 0
+    assert isinstance( layout.itemAtPosition(0, 0).widget(), QLabel )
+    assert isinstance( layout.itemAtPosition(0, 2).widget(), QLabel )
+
+
+def test_finish_column_mode_geometry():
+    """
+    All column modes place the labels at the same positions
+    """
+    geometry = {}
+    for mode in ("cells", "span", "properties"):
+        widget = QWidget()
+        grid   = Grid( content_columns=7, expand_left=True, expand_right=True,
+                       column_gaps=[ (1, 20), (3, "expand"), (5, 15) ], column_mode=mode )
+        labels = [ QLabel("abc") for i in range(8) ]
+        grid.add_many( labels )
+        grid.finish()
+        widget.setLayout( grid.layout )
+        widget.resize( 500, 100 )
+        widget.show()
+        QApplication.processEvents()
+        geometry[mode] = [ label.geometry().getRect() for label in labels ]
+        widget.close()
+    assert geometry["span"] == geometry["cells"]
+    assert geometry["properties"] == geometry["cells"]
+
+
+def test_finish_work_up_overlay(grid):
+    grid.set_content_columns( 2 )
+    grid.set_expand_right( True )
+    grid.set_work_up("overlay")
+    assert grid.work_up is False
+    assert grid.work_up_overlay is True
+    for text in ("a", "b", "c"):
+        grid.add_label("default", text)
+    grid.finish()
+
+    # Nothing colored in the layout itself
+    layout = grid.layout
+    assert layout.itemAtPosition(1, 1) is None
+    marks = grid._get_work_up_marks( 1 )
+    assert (1, 1, 1, 1, MAGENTA, "1", True) in marks
+    assert isinstance( grid._overlay, _WorkUpOverlay )
+    # Attached as soon as the layout has a parent widget, however long it takes
+    for n in range( 300 ):
+        QApplication.processEvents()
+    assert grid._overlay.target is None
+    widget = QWidget()
+    widget.setLayout( layout )
+    QApplication.processEvents()
+    assert grid._overlay.parentWidget() is widget
+    assert grid._overlay._probe is None
+    widget.resize( 300, 100 )
+    image = widget.grab().toImage()
+    assert grid._overlay.geometry() == widget.rect()
+    color = image.pixelColor( layout.cellRect(1, 1).topLeft() )
+    assert (color.red(), color.green(), color.blue()) == MAGENTA
+
+    # Removed by clear
+    overlay = grid._overlay
+    grid.clear()
+    assert grid._overlay is None
+    assert overlay.detached is True
+
+    with pytest.raises(Exception):
+        grid.set_work_up("foo")
+
+
+def test_clear_recycle(grid):
+    widget = QWidget()
+    widget.setLayout( grid.layout )
+    grid.set_content_columns( 2 )
+    grid.set_recycle( True )
+    for text in ("a", "b", "c"):
+        grid.add_label("default", text)
+    grid.add_gap( 10 )
+    labels = [ cell.item for cell in grid.cells.get() ]
+    labels[-1] = labels[-1].item
+    # A nested grid
+    nested = Grid()
+    nested.add_label("default", "nested")
+    nested.finish()
+    grid.add( nested )
+    grid.finish()
+
+    # Nested layouts are cleared, with a single reminder label left
+    grid.clear()
+    assert grid.layout.count() == 1
+    assert grid.layout.itemAt(0).widget().text() == REMIND_TO_FINISH
+    assert sum( len(L) for L in grid._pool.values() ) == 4
+    assert all( label.isHidden() for label in labels )
+
+    # Labels are taken from the pool
+    cell = grid.add_label("default", "d")
+    assert cell.item in labels
+    assert cell.item.text() == "d"
+    cell = grid.add_gap( 10 )
+    assert cell.item.item in labels
+    cell = grid.add_label("default-header", "e")
+    assert cell.item not in labels
+    grid.finish()
+    assert not any( grid.layout.itemAt(i).widget().isHidden() for i in range( grid.layout.count() ) )
+
+    # Disable recycling, the pool is emptied
+    grid.set_recycle( False )
+    assert grid._pool == {}
+
+
+def test_finish_stats(grid):
+    emitted = []
+    grid.finished.connect( emitted.append )
+    grid.finish()
+    assert emitted == [ None ]
+    # Enabled
+    grid.clear()
+    grid.set_stats( True )
+    grid.set_content_columns( 3 )
+    grid.set_expand_right( True )
+    grid.set_column_gaps([ (1, 20) ])
+    grid.set_work_up( True )
+    grid.add_label("default", "a")
+    grid.add_label("default", "b", y_span=2)
+    grid.add_gap("V", "expand")
+    grid.finish()
+    stats = emitted[-1]
+    assert stats is grid.stats
+    assert set( stats.phases ) == { "expanders", "column_gaps", "unused", "apply" }
+    # 3 cells added, 2 expander, 2 column gaps, no unused cell
+    assert (stats.cells, stats.gaps, stats.spacers) == (7, 5, 0)
+    # 2 labels and 5 gap labels in work-up mode
+    assert stats.widgets == 7
+    assert stats.gage == 3
+    assert stats.has_taken > 0
+    assert stats.as_dict()["cells"] == 7
+    # A new object for each build-up
+    grid.clear()
+    assert grid.stats is not stats
+    assert grid.stats.gage == 0
+    # Disabled, the class methods are in place again
+    grid.set_stats( False )
+    assert "gage" not in grid.wh.__dict__
+    assert "has_taken" not in grid.cells.__dict__
+    grid.finish()
+    assert emitted[-1] is None
@@ -0,0 +1,137 @@
+import pytest
+import subprocess
+import sys
+from qtgrid import Planner, PlanCache
+from qtgrid.planner import Gap
+from qtgrid.qtgrid import Grid, _Gap
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QLabel, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QLabel, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QLabel, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+
+def _fill(target, items):
+    target.add( items[0] )
+    target.add( items[1], y_span=2, x_span=2 )
+    target.add_gap("V", 20)
+    target.add( items[2], x_span="all" )
+    target.add_empty_row( 10 )
+    target.add_many( items[3:] )
+
+
+def test_planner_without_qt():
+    code = ( "import sys, qtgrid.planner\n"
+             "from qtgrid import Planner\n"
+             "Planner( content_columns=2 ).finish()\n"
+             "print( [ m for m in sys.modules if m.startswith(('PyQt', 'PySide')) ] )" )
+    out = subprocess.run( [sys.executable, "-c", code], capture_output=True, text=True, check=True )
+    assert out.stdout.strip() == "[]"
+
+
+def test_planner_plan(grid):
+    options = dict( content_columns=3, expand_left=True, expand_right=True, column_gaps=[ (1, 20) ] )
+    planner = Planner( work_up=True, **options )
+    _fill( planner, [ "w%d" % i for i in range( 8 ) ] )
+    plan = planner.finish()
+    # Items are placed as Grid places its widgets
+    for (key, value) in options.items():
+        getattr( grid, "set_" + key )( value )
+    grid.set_work_up( True )
+    labels = [ QLabel( "w%d" % i ) for i in range( 8 ) ]
+    _fill( grid, labels )
+    grid.finish()
+    assert [ (("gap" if isinstance(i, Gap) else i), y, x, ys, xs) for (i, y, x, ys, xs) in plan ] == \
+           [ (("gap" if isinstance(i, Gap) else i.text()), y, x, ys, xs) for (i, y, x, ys, xs) in grid.get_plan() ]
+    assert all( isinstance(i, Gap) and not isinstance(i, _Gap) for (i, y, x, ys, xs) in plan if not isinstance(i, str) )
+
+
+def test_planner_column_properties():
+    planner = Planner( content_columns=3, expand_right=True, column_gaps=[ (1, 20) ], column_mode="properties" )
+    planner.add("foo")
+    assert planner.finish() == [ ("foo", 0, 0, 1, 1) ]
+    assert planner.column_properties == { 3: (1, 0), 1: (0, 20) }
+    planner.clear()
+    assert planner.column_properties == {}
+    assert planner.get_plan() == []
+
+
+def test_planner_check_item(grid):
+    planner = Planner()
+    with pytest.raises(Exception):
+        planner.add( None )
+    planner.add( 42 )
+    with pytest.raises(Exception):
+        grid.add("no widget")
+    with pytest.raises(Exception):
+        grid.add_many(["no widget"])
+
+
+def test_apply_plan(grid):
+    widget = QWidget()
+    widget.setLayout( grid.layout )
+    labels = { name: QLabel( name ) for name in ("foo", "bar") }
+    planner = Planner( content_columns=2, expand_right=True )
+    planner.add("foo")
+    planner.add("bar")
+    grid.apply_plan( planner.finish(), resolve=labels.get )
+    layout = grid.layout
+    assert layout.itemAtPosition( 0, 0 ).widget() is labels["foo"]
+    assert layout.itemAtPosition( 0, 1 ).widget() is labels["bar"]
+    assert layout.itemAtPosition( 0, 2 ).spacerItem() is not None
+
+
+def _gap_plan(plan):
+    return [ ((i.direction, i.length, i.index) if isinstance(i, Gap) else i, y, x, ys, xs)
+             for (i, y, x, ys, xs) in plan ]
+
+
+def test_plan_cache():
+    options = dict( content_columns=3, expand_left=True, column_gaps=[ (1, 20) ], work_up=True )
+    planner = Planner( **options )
+    _fill( planner, list( range( 8 ) ) )
+    expected = _gap_plan( planner.finish() )
+    cache = PlanCache( maxsize=2 )
+    for n in range( 3 ):
+        planner = Planner( plan_cache=cache, **options )
+        _fill( planner, list( range( 8 ) ) )
+        assert _gap_plan( planner.finish() ) == expected
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+    # Diverging from the cached recipe falls back to placing, and is cached as well
+    planner.clear()
+    _fill( planner, list( range( 9 ) ) )
+    planner.add( 9, x_span="all" )
+    plan = planner.finish()
+    assert _gap_plan( plan )[:9] == expected[:9]
+    assert (cache.hits, cache.misses, len(cache)) == (2, 2, 2)
+    # The least recently used plan is evicted
+    Planner( content_columns=2, plan_cache=cache ).finish()
+    assert (cache.misses, len(cache)) == (3, 2)
+    planner = Planner( plan_cache=cache, **options )
+    _fill( planner, list( range( 8 ) ) )
+    planner.finish()
+    assert (cache.hits, cache.misses) == (2, 4)
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_grid_plan_cache():
+    cache = PlanCache()
+    for n in range( 2 ):
+        grid = Grid( content_columns=2, expand_right=True, work_up=True, plan_cache=cache )
+        labels = [ QLabel( str(i) ) for i in range( 5 ) ]
+        _fill( grid, labels )
+        grid.finish()
+        layout = grid.layout
+        assert layout.itemAtPosition( 0, 1 ).widget() is labels[1]
+        assert layout.itemAtPosition( 0, 2 ).widget().text() == ""
+        assert isinstance( grid.cells.get()[-1].item, _Gap )
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -0,0 +1,44 @@
+import pytest
+import os
+import subprocess
+import sys
+from qtgrid.qtgrid import QT_BINDING, QT_BINDINGS
+
+
+def _run(code, **env):
+    environ = { key: value for (key, value) in os.environ.items() if key != "QT_API" }
+    environ.update( env )
+    return subprocess.run( [sys.executable, "-c", code], env=environ, capture_output=True, text=True )
+
+
+# Probing with find_spec must not happen, if the binding is chosen explicitly
+NO_PROBING = ( "import importlib.util\n"
+               "def fail(*args): raise AssertionError('probed')\n"
+               "importlib.util.find_spec = fail\n" )
+
+
+def test_binding_imported():
+    out = _run( NO_PROBING + f"import { QT_BINDING }.QtCore\n"
+                             "from qtgrid.qtgrid import QT_BINDING\n"
+                             "print( QT_BINDING )" )
+    assert out.stdout.strip() == QT_BINDING
+
+
+def test_binding_qt_api():
+    out = _run( NO_PROBING + "from qtgrid.qtgrid import QT_BINDING\n"
+                             "print( QT_BINDING )", QT_API=QT_BINDING.lower() )
+    assert out.stdout.strip() == QT_BINDING
+    # Values of other packages sharing QT_API are ignored
+    for api in ("pyside2", "pyqt"):
+        out = _run( "from qtgrid.qtgrid import QT_BINDING\n"
+                    "print( QT_BINDING )", QT_API=api )
+        assert out.returncode == 0
+        assert out.stdout.strip() == QT_BINDING
+        assert "QT_API" in out.stderr
+
+
+def test_binding_probed():
+    assert QT_BINDING in QT_BINDINGS
+    out = _run( "import sys, qtgrid\n"
+                "print( [ m for m in sys.modules if m.split('.')[0] in ('PyQt6', 'PyQt5', 'PySide6') ] )" )
+    assert out.stdout.strip() == "[]"
@@ -0,0 +1,91 @@
+import pytest
+import gc
+import math
+import time
+from qtgrid import Grid
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QLabel, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QLabel, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QLabel, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+# Placement and finish must grow near-linearly with the number of cells.
+# The growth rate is the slope of log(seconds) over log(cells), fitted over doubling sizes.
+# Each size is measured several times and the fastest run is taken, to be robust on shared runners.
+SIZES    = (1000, 2000, 4000, 8000)
+REPEAT   = 3
+MAX_RATE = 1.3
+
+
+def _build(size):
+    """
+    Get a grid with its labels, and the functions adding them and finishing the grid
+    """
+    widget = QWidget()
+    grid   = Grid( content_columns=6, expand_right=True, column_gaps=[ (2, 10) ], work_up=True, production=True )
+    widget.setLayout( grid.layout )
+    labels = [ QLabel( str(i) ) for i in range( size ) ]
+
+    def add():
+        for (i, label) in enumerate( labels ):
+            if i % 5 == 0:
+                grid.add( label, y_span=2 )
+            elif i % 7 == 0:
+                grid.add( label, x_span=2 )
+                grid.add_gap("H", 5)
+            else:
+                grid.add( label )
+            if i % 50 == 49:
+                grid.add_empty_row( 5 )
+    return (widget, grid, add, grid.finish)
+
+
+def _measure(size):
+    """
+    Get the fastest seconds for placing, and for finishing *size* labels
+    """
+    best = [ math.inf, math.inf ]
+    for n in range( REPEAT ):
+        (widget, grid, add, finish) = _build( size )
+        gc.collect()
+        gc.disable()
+        try:
+            for (i, func) in enumerate( (add, finish) ):
+                start = time.perf_counter()
+                func()
+                best[i] = min( best[i], time.perf_counter() - start )
+        finally:
+            gc.enable()
+        widget.deleteLater()
+    return best
+
+
+def _growth_rate(sizes, seconds):
+    """
+    Get the least squares slope of log(seconds) over log(sizes)
+    """
+    xs = [ math.log( n ) for n in sizes ]
+    ys = [ math.log( s ) for s in seconds ]
+    (mx, my) = ( sum(xs) / len(xs), sum(ys) / len(ys) )
+    return sum( (x - mx) * (y - my) for (x, y) in zip( xs, ys ) ) / sum( (x - mx) ** 2 for x in xs )
+
+
+def test__growth_rate():
+    assert _growth_rate( SIZES, [ n * 1e-6 for n in SIZES ] ) == pytest.approx( 1.0 )
+    assert _growth_rate( SIZES, [ n * n * 1e-9 for n in SIZES ] ) == pytest.approx( 2.0 )
+
+
+def test_near_linear():
+    results = [ _measure( size ) for size in SIZES ]
+    for (i, phase) in enumerate( ("placement", "finish") ):
+        seconds = [ result[i] for result in results ]
+        rate    = _growth_rate( SIZES, seconds )
+        assert rate < MAX_RATE, f"{ phase } grows with n^{ rate:.2f}: { seconds }"
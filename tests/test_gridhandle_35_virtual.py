@@ -0,0 +1,124 @@
+import pytest
+from qtgrid import Grid
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QApplication, QLabel, QScrollArea, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QApplication, QLabel, QScrollArea, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QApplication, QLabel, QScrollArea, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+ROWS = 2000
+
+
+def _scroll_area(grid):
+    widget = QWidget()
+    widget.setLayout( grid.layout )
+    area = QScrollArea()
+    area.setWidgetResizable( True )
+    area.setWidget( widget )
+    area.resize( 300, 200 )
+    return (area, widget)
+
+
+def test_set_virtual(grid, some_label):
+    assert grid.virtual is False
+    assert grid.get_visible_rows() is None
+    with pytest.raises(Exception):
+        grid.set_virtual( True, row_height=0 )
+    with pytest.raises(Exception):
+        grid.set_virtual( True, prefetch=-1 )
+    grid.set_work_up("overlay")
+    with pytest.raises(Exception):
+        grid.set_virtual( True )
+    grid.set_work_up( False )
+    grid.set_virtual( True )
+    with pytest.raises(Exception):
+        grid.set_work_up("overlay")
+    grid.add( some_label )
+    grid.add( QLabel("b") )
+    with pytest.raises(Exception):
+        grid.set_virtual( False )
+    with pytest.raises(Exception):
+        grid.add_label("unknown", "foo")
+    with pytest.raises(Exception, match="virtual mode"):
+        grid.apply_plan()
+
+
+def test_virtual_rows():
+    grid = Grid( content_columns=2, expand_right=True, column_mode="properties",
+                 production=True, virtual=True )
+    grid.set_virtual( True, prefetch=5 )
+    (area, widget) = _scroll_area( grid )
+    header = QLabel("header")
+    grid.add( header, x_span="all" )
+    for i in range( ROWS ):
+        grid.add_label("default", str(i))
+        grid.add_label("default", "b")
+    grid.finish()
+    layout = grid.layout
+    # Not visible yet, only the prefetch rows are materialized
+    assert grid.get_visible_rows() == (0, 5)
+    cells = grid.cells.get()
+    assert cells[1].item.label.text() == "0"
+    assert cells[-1].item.label is None
+    assert layout.count() < 20
+    # The whole grid is scrollable
+    area.show()
+    QApplication.processEvents()
+    pitch = grid._virtual.pitch
+    assert widget.height() >= ROWS * pitch
+    # Scroll to the middle
+    bar = area.verticalScrollBar()
+    bar.setValue( bar.maximum() // 2 )
+    QApplication.processEvents()
+    (first, last) = grid.get_visible_rows()
+    assert first > 5 and last < ROWS
+    assert layout.count() < 3 * (last - first + 1)
+    cell = grid.cells.get_cell( first + 10, 0 )
+    assert cell.item.label.text() == str( first + 9 )
+    assert cell.item.label.isVisible()
+    # Rows out of range hold no labels, and the labels are reused
+    assert cells[1].item.label is None
+    assert not header.isVisible()
+    pool = sum( len( labels ) for labels in grid._virtual._pool.values() )
+    assert pool + layout.count() < 4 * (last - first + 1)
+    # Back to the top
+    bar.setValue( 0 )
+    QApplication.processEvents()
+    assert grid.get_visible_rows()[0] == 0
+    assert header.isVisible()
+    # Clear keeps the labels for reuse
+    grid.clear()
+    assert grid.get_visible_rows() is None
+    assert layout.count() == 0
+    assert len( grid._virtual._pool["default"] ) > 0
+    area.deleteLater()
+
+
+def test_virtual_finish_before_parent():
+    grid = Grid( content_columns=2, production=True, virtual=True )
+    for i in range( ROWS ):
+        grid.add_label("default", str(i))
+        grid.add_label("default", "b")
+    grid.finish()
+    assert grid.layout.itemAtPosition( 0, 0 ).widget().text() == "0"
+    (area, widget) = _scroll_area( grid )
+    area.show()
+    QApplication.processEvents()
+    assert grid._virtual._watched
+    bar = area.verticalScrollBar()
+    bar.setValue( bar.maximum() // 2 )
+    QApplication.processEvents()
+    (first, last) = grid.get_visible_rows()
+    assert first > 20 and last < ROWS
+    cell = grid.cells.get_cell( first + 10, 0 )
+    assert cell.item.label.text() == str( first + 10 )
+    assert cell.item.label.isVisible()
+    area.deleteLater()
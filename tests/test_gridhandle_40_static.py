@@ -0,0 +1,99 @@
+import pytest
+from qtgrid import Grid
+from qtgrid.qtgrid import _StaticLabel, _StaticPainter, HEADER_BG
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtWidgets import QApplication, QLabel, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtWidgets import QApplication, QLabel, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtCore import Qt
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+
+def test_set_static(grid, some_label):
+    assert grid.static is False
+    grid.set_static( True )
+    with pytest.raises(Exception):
+        grid.set_virtual( True )
+    grid.add( some_label )
+    grid.add( QWidget() )
+    with pytest.raises(Exception):
+        grid.set_static( False )
+    assert grid.promote( grid.cells.get()[0] ) is some_label
+    with pytest.raises(Exception):
+        grid.promote( grid.cells.get_last() )
+
+
+def test_static_labels():
+    grid   = Grid( content_columns=2, production=True, static=True, stats=True )
+    widget = QWidget()
+    widget.setLayout( grid.layout )
+    # An interactive label source is not painted
+    source = QLabel()
+    source.setToolTip("tip")
+    grid.set_label_source( "tip", source )
+    header = grid.add_label( "default-header", "Header", x_span="all" )
+    cells  = [ grid.add_label( "default", str(i) ) for i in range( 10 ) ]
+    tip    = grid.add_label( "tip", "with tool tip" )
+    grid.finish()
+    assert isinstance(header.item, _StaticLabel)
+    assert isinstance(tip.item, QLabel)
+    assert grid.stats.widgets == 1
+    # The layout holds spacer items, sized like QLabels
+    layout = grid.layout
+    assert layout.itemAtPosition( 1, 0 ).spacerItem() is cells[0].item.spacer
+    assert cells[0].item.spacer.sizeHint().height() >= QLabel("0").sizeHint().height()
+    assert [ w for w in widget.findChildren( QLabel ) ] == [ tip.item ]
+    assert isinstance(grid._painter, _StaticPainter)
+    # The labels are painted
+    widget.show()
+    QApplication.processEvents()
+    image = widget.grab().toImage()
+    rect  = header.item.spacer.geometry()
+    color = image.pixelColor( rect.left() + 1, rect.top() + 1 )
+    assert (color.red(), color.green(), color.blue()) == HEADER_BG
+    assert cells[3].item.static is not None
+    # A promoted label takes the place of its spacer item
+    label = grid.promote( cells[3] )
+    assert grid.promote( cells[3] ) is label
+    assert grid.promote( tip ) is tip.item
+    assert label.text() == "3"
+    assert layout.itemAtPosition( 2, 1 ).widget() is label
+    QApplication.processEvents()
+    assert label.isVisible()
+    # Clear removes the painter
+    grid.clear()
+    assert grid._painter is None
+    assert grid._static_cells == []
+    widget.deleteLater()
+
+
+def test_static_finish_before_parent():
+    grid   = Grid( content_columns=2, production=True, static=True )
+    header = grid.add_label( "default-header", "Header", x_span="all" )
+    grid.add_label( "default", "a" )
+    grid.finish()
+    for n in range( 300 ):
+        QApplication.processEvents()
+    assert grid._painter.target is None
+    widget = QWidget()
+    widget.setLayout( grid.layout )
+    widget.show()
+    QApplication.processEvents()
+    assert grid._painter.parentWidget() is widget
+    # Below the other children
+    assert [ c for c in widget.children() if isinstance(c, QWidget) ][0] is grid._painter
+    image = widget.grab().toImage()
+    rect  = header.item.spacer.geometry()
+    color = image.pixelColor( rect.left() + 1, rect.top() + 1 )
+    assert (color.red(), color.green(), color.blue()) == HEADER_BG
+    widget.deleteLater()
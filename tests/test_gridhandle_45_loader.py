@@ -0,0 +1,156 @@
+import pytest
+import gc
+import json
+import time
+from qtgrid import Grid, GridLoader
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QApplication
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QApplication
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QApplication
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+
+def _run(loader, max_steps=10000):
+    """
+    Process events until the loader is done, and get the signals emitted
+    """
+    signals = []
+    for name in ("progress", "loaded", "canceled", "failed"):
+        getattr( loader, name ).connect( lambda value, name=name: signals.append( (name, value) ) )
+    loader.start()
+    for n in range( max_steps ):
+        if not loader.is_running():
+            break
+        QApplication.processEvents()
+    return signals
+
+
+def _texts(grid):
+    return [ cell.item.text() for cell in grid.cells.get() ]
+
+
+def test_loader_args():
+    grid = Grid( production=True )
+    with pytest.raises(Exception):
+        GridLoader( None, [] )
+    with pytest.raises(Exception):
+        GridLoader( grid, None )
+    with pytest.raises(Exception):
+        GridLoader( grid, [], chunk_ms=0 )
+    with pytest.raises(Exception):
+        GridLoader( grid, [], columns=[ ("a", 1) ] )
+    with pytest.raises(Exception):
+        GridLoader( grid, "data.txt" ).start()
+
+
+def test_loader_iterable():
+    grid   = Grid( content_columns=2, production=True )
+    rows   = ( [ i, "x" * (i % 3) ] for i in range( 500 ) )
+    loader = GridLoader( grid, rows, columns=[ 0, (1, "default-header") ], chunk_ms=1 )
+    signals = _run( loader )
+    assert signals[-1] == ("loaded", 500)
+    assert [ name for (name, value) in signals[:-1] ] == [ "progress" ] * (len( signals ) - 1)
+    assert signals[-2] == ("progress", 500)
+    assert grid._finished
+    assert gc.isenabled()
+    assert _texts( grid )[:6] == [ "0", "", "1", "x", "2", "xx" ]
+
+
+def test_loader_files(tmp_path):
+    csv_file = tmp_path / "data.csv"
+    csv_file.write_text("name,size\nfoo,1\nbar,\n")
+    grid    = Grid( content_columns=2, production=True )
+    signals = _run( GridLoader( grid, csv_file ) )
+    assert signals[-1] == ("loaded", 2)
+    assert _texts( grid ) == [ "foo", "1", "bar", "" ]
+    # Keys missing in a row are empty
+    jsonl_file = tmp_path / "data.jsonl"
+    jsonl_file.write_text( "\n".join( json.dumps( row ) for row in [ {"a": 1, "b": 2}, {"b": 3} ] ) + "\n\n" )
+    grid    = Grid( content_columns=2, production=True )
+    loader  = GridLoader( grid, str( jsonl_file ), finish=False )
+    signals = _run( loader )
+    assert signals[-1] == ("loaded", 2)
+    assert _texts( grid ) == [ "1", "2", "", "3" ]
+    assert not grid._finished
+    assert loader._file is None
+    # Errors stop loading
+    jsonl_file.write_text('{"a": 1}\nno json\n')
+    grid    = Grid( production=True )
+    signals = _run( GridLoader( grid, jsonl_file ) )
+    assert signals[-1][0] == "failed"
+    assert isinstance(signals[-1][1], ValueError)
+    assert len( grid.cells.get() ) == 1
+
+
+def test_loader_columns_mismatch():
+    grid    = Grid( production=True )
+    signals = _run( GridLoader( grid, [ [ "foo", "bar" ] ], columns=[ "name" ] ) )
+    assert signals[-1][0] == "failed"
+    assert "Arg 'columns'" in str( signals[-1][1] )
+
+
+def test_loader_pause_gc():
+    grid   = Grid( production=True )
+    loader = GridLoader( grid, ( [i] for i in range( 10 ) ) )
+    loader.start()
+    assert gc.isenabled()
+    loader.cancel()
+    loader = GridLoader( grid, ( [i] for i in range( 10 ) ), pause_gc=True )
+    loader.start()
+    assert not gc.isenabled()
+    # Dropping a running loader resumes the collection
+    del loader
+    assert gc.isenabled()
+    signals = _run( GridLoader( grid, ( [i] for i in range( 10 ) ), pause_gc=True ) )
+    assert signals[-1] == ("loaded", 10)
+    assert gc.isenabled()
+
+
+def test_loader_cancel():
+    grid   = Grid( production=True )
+    loader = GridLoader( grid, ( [i] for i in range( 10**9 ) ), chunk_ms=1 )
+    loader.progress.connect( lambda rows: loader.cancel() )
+    signals = _run( loader )
+    rows = loader.rows
+    assert rows > 0
+    assert signals[-2:] == [ ("canceled", rows), ("progress", rows) ]
+    assert not loader.is_running()
+    assert grid._finished
+    loader.cancel()
+    assert len( grid.cells.get() ) == rows
+
+
+def test_loader_async():
+    import asyncio
+    grid    = Grid( content_columns=2, production=True )
+    loader  = GridLoader( grid, [ (i, i * 2) for i in range( 50 ) ], chunk_ms=10000 )
+    signals = []
+    loader.progress.connect( lambda rows: signals.append( ("progress", rows) ) )
+    loader.loaded.connect( lambda rows: signals.append( ("loaded", rows) ) )
+    assert asyncio.run( loader.load_async( batch=20 ) ) == 50
+    assert [ value for (name, value) in signals if name == "progress" ][:2] == [ 20, 40 ]
+    assert signals[-1] == ("loaded", 50)
+    assert grid._finished and not loader.is_running()
+    assert _texts( grid )[:4] == [ "0", "0", "1", "2" ]
+
+
+def test_loader_async_deadline():
+    import asyncio
+    grid     = Grid( production=True )
+    slow     = ( time.sleep( 0.002 ) or [i] for i in range( 20 ) )
+    loader   = GridLoader( grid, slow, chunk_ms=1, finish=False )
+    progress = []
+    loader.progress.connect( progress.append )
+    assert asyncio.run( loader.load_async( batch=1000 ) ) == 20
+    # Each batch is cut short by the deadline, not by the batch size
+    assert len( progress ) > 2
+    assert progress[-1] == 20
+    assert progress == sorted( progress )
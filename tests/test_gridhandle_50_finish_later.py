@@ -0,0 +1,134 @@
+import pytest
+from qtgrid import Grid
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QApplication, QLabel, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QApplication, QLabel, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+
+def _build(size=300):
+    """
+    Get a grid filled with *size* labels, in a shown widget
+    """
+    widget = QWidget()
+    grid   = Grid( content_columns=4, expand_left=True, expand_right=True, column_gaps=[ (2, 10) ], work_up=True )
+    widget.setLayout( grid.layout )
+    widget.show()
+    for i in range( size ):
+        if i % 9 == 0:
+            grid.add( QLabel( str(i) ), y_span=2 )
+        else:
+            grid.add( QLabel( str(i) ) )
+        if i % 40 == 39:
+            grid.add_empty_row( 5 )
+    return (widget, grid)
+
+
+def _layout(grid):
+    layout = grid.layout
+    RET = []
+    for i in range( layout.count() ):
+        item = layout.itemAt( i )
+        widget = item.widget()
+        RET.append( (layout.getItemPosition( i ), widget.text() if widget is not None else None) )
+    return sorted( RET, key=lambda r: r[0] )
+
+
+def _run(grid, cells=100, max_steps=10000):
+    """
+    Process events until the grid is finished, and get the signals emitted
+    """
+    signals = []
+    grid.finish_progress.connect( lambda cells: signals.append( ("progress", cells) ) )
+    grid.finished.connect( lambda stats: signals.append( ("finished", stats) ) )
+    grid.finish_later( cells )
+    for n in range( max_steps ):
+        if not grid.is_finishing():
+            break
+        QApplication.processEvents()
+    return signals
+
+
+def test_finish_later_same_layout():
+    (widget, grid) = _build()
+    grid.finish()
+    expected = _layout( grid )
+    (widget, grid) = _build()
+    signals = _run( grid )
+    assert _layout( grid ) == expected
+    assert grid._finished and grid.layout.isEnabled() and widget.updatesEnabled()
+    assert signals[-1] == ("finished", None)
+    progress = [ value for (name, value) in signals[:-1] ]
+    assert len( progress ) > 5
+    assert progress == sorted( progress )
+    assert all( name == "progress" for (name, value) in signals[:-1] )
+
+
+def test_finish_later_args(grid):
+    with pytest.raises(Exception):
+        grid.finish_later( 0 )
+    grid.add( QLabel("foo") )
+    grid.finish_later( 1 )
+    assert grid.is_finishing()
+    with pytest.raises(Exception):
+        grid.finish_later()
+    with pytest.raises(Exception):
+        grid.finish()
+    grid.cancel_finish()
+    assert not grid.is_finishing()
+    grid.cancel_finish()
+
+
+def test_finish_later_no_adding(grid):
+    grid.add( QLabel("foo") )
+    grid.add( QLabel("bar") )
+    grid.finish_later( 1 )
+    for add in ( lambda: grid.add( QLabel("late") ), lambda: grid.add_label( "default", "late" ),
+                 lambda: grid.add_many( [ QLabel("late") ] ), lambda: grid.add_rows( [ [ QLabel("late") ] ] ),
+                 lambda: grid.add_gap( 10 ), lambda: grid.add_empty_row() ):
+        with pytest.raises(Exception, match="Grid is finishing"):
+            add()
+    grid.cancel_finish()
+    grid.clear()
+    grid.add( QLabel("foo") )
+
+
+def test_finish_later_failed(grid):
+    def steps():
+        yield 1
+        raise ValueError("broken")
+    grid._iter_finish = steps
+    errors = []
+    grid.finish_failed.connect( errors.append )
+    grid.finish_later( 1 )
+    for n in range( 10 ):
+        QApplication.processEvents()
+    assert [ str(e) for e in errors ] == [ "broken" ]
+    assert not grid.is_finishing()
+
+
+def test_finish_later_clear():
+    (widget, grid) = _build()
+    grid.finish_later( 100 )
+    for n in range( 4 ):
+        QApplication.processEvents()
+    assert grid.is_finishing()
+    grid.clear()
+    assert not grid.is_finishing()
+    assert grid.layout.isEnabled() and widget.updatesEnabled()
+    # Restart after clear
+    for i in range( 3 ):
+        grid.add( QLabel( "label%d" % i ) )
+    signals = _run( grid )
+    assert signals[-1][0] == "finished"
+    assert [ (pos, text) for (pos, text) in _layout( grid ) if text.startswith("label") ] == \
+           [ ((0, 1, 1, 1), "label0"), ((0, 2, 1, 1), "label1"), ((0, 4, 1, 1), "label2") ]
@@ -0,0 +1,137 @@
+import pytest
+import asyncio
+import gc
+import subprocess
+import sys
+from qtgrid import Grid
+
+############################
+# Check Qt package to import
+import importlib
+
+if importlib.util.find_spec("PyQt6") is not None:
+    from PyQt6.QtWidgets import QApplication, QWidget
+elif importlib.util.find_spec("PyQt5") is not None:
+    from PyQt5.QtWidgets import QApplication, QWidget
+elif importlib.util.find_spec("PySide6") is not None:
+    from PySide6.QtWidgets import QApplication, QWidget
+else:
+    raise Exception("Cannot find package PySide6, PyQt6, or PyQt5")
+
+
+async def _rows(size):
+    for i in range( size ):
+        yield { "name": "row%d" % i, "size": i }
+
+
+def _run(coro):
+    """
+    Run *coro* in a local asyncio event loop, next to a task processing the Qt events
+
+    :return: 2-tuple *(result, number of ticks of the other task)*
+    """
+    async def main():
+        ticks = []
+
+        async def tick():
+            while True:
+                QApplication.processEvents()
+                ticks.append( 1 )
+                await asyncio.sleep( 0 )
+        ticker = asyncio.ensure_future( tick() )
+        try:
+            result = await coro
+        finally:
+            ticker.cancel()
+        return (result, len( ticks ))
+    return asyncio.run( main() )
+
+
+def _build():
+    widget = QWidget()
+    grid   = Grid( content_columns=2, expand_right=True, column_gaps=[ (1, 10) ], work_up=True )
+    widget.setLayout( grid.layout )
+    return (widget, grid)
+
+
+def _layout(grid):
+    layout = grid.layout
+    RET = []
+    for i in range( layout.count() ):
+        widget = layout.itemAt( i ).widget()
+        RET.append( (layout.getItemPosition( i ), widget.text() if widget is not None else None) )
+    return sorted( RET, key=lambda r: r[0] )
+
+
+def test_add_rows_async():
+    (widget, grid) = _build()
+    (rows, ticks) = _run( grid.add_rows_async( _rows( 300 ), columns=[ "name", "size" ], batch=50 ) )
+    assert rows == 300
+    assert ticks >= 6
+    assert gc.isenabled()
+    assert not grid._finished
+    texts = [ cell.item.text() for cell in grid.cells.get() ]
+    assert texts[:4] == [ "row0", "0", "row1", "1" ]
+    assert len( texts ) == 600
+    with pytest.raises(Exception):
+        _run( grid.add_rows_async( [], batch=0 ) )
+    # Without time limit, as for finish_async
+    (rows, ticks) = _run( grid.add_rows_async( [ [ "x" ] ] * 10, batch=4, budget_ms=None ) )
+    assert rows == 10
+
+
+def test_finish_async_same_layout():
+    (widget, grid) = _build()
+    for row in ( [ "row%d" % i, str(i) ] for i in range( 200 ) ):
+        for text in row:
+            grid.add_label( "default", text )
+    grid.finish()
+    expected = _layout( grid )
+    (widget, grid) = _build()
+    _run( grid.add_rows_async( ( [ "row%d" % i, i ] for i in range( 200 ) ), batch=1000 ) )
+    signals = []
+    grid.finish_progress.connect( lambda cells: signals.append( cells ) )
+    grid.finished.connect( lambda stats: signals.append( "finished" ) )
+    (result, ticks) = _run( grid.finish_async( cells=50, budget_ms=None ) )
+    assert result is True
+    assert ticks >= len( signals ) - 2 > 5
+    assert signals[-1] == "finished"
+    assert _layout( grid ) == expected
+    assert not grid.is_finishing()
+
+
+def test_finish_async_cancel():
+    (widget, grid) = _build()
+    _run( grid.add_rows_async( _rows( 100 ) ) )
+
+    async def clear_soon():
+        await asyncio.sleep( 0 )
+        assert grid.is_finishing()
+        grid.clear()
+
+    async def both():
+        (result, none) = await asyncio.gather( grid.finish_async( cells=10 ), clear_soon() )
+        return result
+    (result, ticks) = _run( both() )
+    assert result is False
+    assert not grid.is_finishing()
+    assert grid.layout.isEnabled()
+    # Cancelling the awaiting task stops finishing, too
+    _run( grid.add_rows_async( _rows( 100 ) ) )
+
+    async def cancel_task():
+        task = asyncio.ensure_future( grid.finish_async( cells=10 ) )
+        await asyncio.sleep( 0 )
+        await asyncio.sleep( 0 )
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    _run( cancel_task() )
+    assert not grid.is_finishing()
+
+
+def test_asyncio_not_imported():
+    code = ( "import sys, qtgrid.qtgrid, qtgrid.loader\n"
+             "print( 'asyncio' in sys.modules )" )
+    out = subprocess.run( [sys.executable, "-c", code], capture_output=True, text=True, check=True )
+    assert out.stdout.strip() == "False"